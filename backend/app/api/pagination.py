@@ -0,0 +1,97 @@
+import base64
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+from app.db.pagination import Keyset
+
+
+# Response header carrying the cursor of the next page, absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# OpenAPI description of a paginated listing's response headers
+PAGE_RESPONSES = {
+    200: {
+        "headers": {
+            NEXT_CURSOR_HEADER: {
+                "description": "Cursor of the next page, absent on the last page",
+                "schema": {"type": "string"},
+            }
+        }
+    }
+}
+
+
+def encode_cursor(position: tuple[datetime, int, ...]) -> str:
+    """
+    Encode a listing position, a timestamp followed by integers such as a
+    Keyset, as an opaque, URL-safe cursor.
+    """
+    timestamp, *numbers = position
+    raw = "|".join([timestamp.isoformat(), *map(str, numbers)]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int = 2) -> Optional[tuple]:
+    """
+    Decode a cursor from encode_cursor holding `size` values, a Keyset by
+    default, raising 400 if it is malformed.
+    """
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        timestamp, *numbers = raw.split("|")
+        if len(numbers) != size - 1:
+            raise ValueError("Wrong number of cursor values")
+        return (datetime.fromisoformat(timestamp), *map(int, numbers))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
+
+
+def parse_fields(fields: Optional[str], allowed: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Parse a comma-separated field selection, keeping the order of `allowed`.
+
+    Returns every allowed field when no selection is given; raises 422 on
+    unknown fields.
+    """
+    if not fields:
+        return allowed
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return tuple(field for field in allowed if field in requested)
+
+
+def page_size(limit: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    """
+    Resolve a listing's page size: `limit` if given, the default page size
+    when only a cursor is given, and None (everything) when neither is.
+    """
+    if limit is None and cursor is not None:
+        return settings.LIST_PAGE_SIZE
+    return limit
+
+
+def page_response(
+    rows: list[dict[str, Any]], next_keyset: Optional[Keyset]
+) -> JSONResponse:
+    """
+    Serialize a page of rows directly, skipping response model validation,
+    with the next page's cursor in the NEXT_CURSOR_HEADER header.
+    """
+    headers = {}
+    if next_keyset is not None:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(next_keyset)
+    return JSONResponse(jsonable_encoder(rows), headers=headers)
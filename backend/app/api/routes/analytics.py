@@ -1,101 +1,196 @@
-from fastapi import APIRouter, Depends
+from typing import Any, Awaitable, Callable, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db.session import get_db_session
-from app.core.deps import get_current_user
-from app.models.user import User
+from app.db.session import async_session, get_db_session
+from app.api.pagination import decode_cursor, encode_cursor
+from app.core.analytics_cache import analytics_cache, etag_matches
+from app.core.config import settings
+from app.core.deps import get_current_user_id
 from app.services.analytics_service import AnalyticsService
 
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
 
+async def _cached(
+    request: Request, user_id: int, compute: Callable[[], Awaitable[Any]]
+) -> Response:
+    """
+    Answer an analytics request from the user's response cache.
+
+    Returns 304 when the client's If-None-Match still matches the user's
+    data; otherwise returns the cached body, calling `compute` only on a
+    miss.
+    """
+    key = f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+    etag = analytics_cache.etag(user_id, key)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    body = analytics_cache.get(etag)
+    if body is None:
+        body = JSONResponse(jsonable_encoder(await compute())).body
+        analytics_cache.set(etag, body)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/overview")
 async def get_analytics_overview(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """Get overall analytics overview for the current user."""
-    overall_stats = await AnalyticsService.get_overall_stats(db, current_user.id)
-    return overall_stats
+    return await _cached(
+        request,
+        user_id,
+        lambda: AnalyticsService.get_overall_stats(db, user_id),
+    )
 
 
 @router.get("/position")
 async def get_position_analytics(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """Get analytics by position."""
-    position_stats = await AnalyticsService.get_position_stats(db, current_user.id)
-    return position_stats
+    return await _cached(
+        request,
+        user_id,
+        lambda: AnalyticsService.get_position_stats(db, user_id),
+    )
 
 
 @router.get("/action")
 async def get_action_analytics(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """Get analytics by action."""
-    action_stats = await AnalyticsService.get_action_stats(db, current_user.id)
-    return action_stats
+    return await _cached(
+        request,
+        user_id,
+        lambda: AnalyticsService.get_action_stats(db, user_id),
+    )
 
 
 @router.get("/timeline")
 async def get_timeline_analytics(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    max_points: Optional[int] = Query(default=500, ge=3, le=10_000),
+    bucket: Optional[Literal["hands", "day", "week"]] = None,
+    bucket_size: int = Query(default=100, ge=1),
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=10_000),
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
-    """Get win rate over time."""
-    timeline = await AnalyticsService.get_win_rate_over_time(db, current_user.id)
-    return timeline
+    """
+    Get win rate over time.
+
+    By default the series is downsampled to `max_points` points. Use `bucket`
+    for one point per `bucket_size` hands, day or week, or `cursor`/`limit`
+    to page through every hand; `next_cursor` is the opaque cursor of the
+    next page.
+    """
+    after = decode_cursor(cursor, size=4)
+
+    async def compute() -> dict[str, Any]:
+        timeline = await AnalyticsService.get_win_rate_over_time(
+            db,
+            user_id,
+            max_points=max_points,
+            bucket=bucket,
+            bucket_size=bucket_size,
+            cursor=after,
+            limit=limit,
+        )
+        if timeline["next_cursor"] is not None:
+            timeline["next_cursor"] = encode_cursor(timeline["next_cursor"])
+        return timeline
+
+    return await _cached(request, user_id, compute)
 
 
 @router.get("/sessions")
 async def get_session_analytics(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
-    """Get session performance analytics."""
-    sessions = await AnalyticsService.get_session_performance(db, current_user.id)
-    return sessions
+    """Get session performance analytics, newest session first."""
+    return await _cached(
+        request,
+        user_id,
+        lambda: AnalyticsService.get_session_performance(
+            db, user_id, limit=limit, offset=offset
+        ),
+    )
 
 
 @router.get("/heatmap")
 async def get_position_heatmap(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """Get position heat map data."""
-    heatmap = await AnalyticsService.get_position_heatmap(db, current_user.id)
-    return heatmap
+    return await _cached(
+        request,
+        user_id,
+        lambda: AnalyticsService.get_position_heatmap(db, user_id),
+    )
 
 
 @router.get("/style")
 async def get_playing_style(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """Get playing style profile."""
-    style = await AnalyticsService.get_playing_style_profile(db, current_user.id)
-    return style
+    return await _cached(
+        request,
+        user_id,
+        lambda: AnalyticsService.get_playing_style_profile(db, user_id),
+    )
 
 
 @router.get("/dashboard")
 async def get_dashboard_data(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db_session),
+    request: Request,
+    timeline_points: int = Query(default=500, ge=3, le=10_000),
+    user_id: int = Depends(get_current_user_id),
 ):
-    """Get all dashboard data in a single request."""
-    overall_stats = await AnalyticsService.get_overall_stats(db, current_user.id)
-    position_stats = await AnalyticsService.get_position_stats(db, current_user.id)
-    action_stats = await AnalyticsService.get_action_stats(db, current_user.id)
-    timeline = await AnalyticsService.get_win_rate_over_time(db, current_user.id)
-    style = await AnalyticsService.get_playing_style_profile(db, current_user.id)
-
-    return {
-        "overall": overall_stats,
-        "positions": position_stats,
-        "actions": action_stats,
-        "timeline": timeline,
-        "style": style,
-    }
+    """
+    Get all dashboard data in a single request.
+
+    The underlying queries run concurrently on separate connections; the
+    request fails with 504 if they exceed the dashboard timeout.
+    """
+
+    async def compute() -> dict[str, Any]:
+        try:
+            return await AnalyticsService.get_dashboard(
+                async_session,
+                user_id,
+                timeline_points=timeline_points,
+                max_concurrency=settings.DASHBOARD_MAX_CONCURRENCY,
+                timeout=settings.DASHBOARD_TIMEOUT,
+            )
+        except TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                detail="Dashboard queries timed out",
+            )
+
+    return await _cached(request, user_id, compute)
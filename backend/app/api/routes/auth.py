@@ -1,16 +1,37 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+import math
+
+from fastapi import APIRouter, HTTPException, Request, status, Depends
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db.session import get_db_session
 from app.models.user import User
 from app.api.schemas.user import UserRegister, UserLogin, UserRead, TokenResponse
-from app.core.security import hash_password, verify_password, create_access_token
+from app.core.rate_limit import (
+    client_address,
+    login_ip_rate_limiter,
+    login_user_rate_limiter,
+    trusted_proxies,
+)
+from app.core.security import (
+    HashingPoolSaturatedError,
+    create_access_token,
+    hash_password_async,
+    verify_password_async,
+)
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _auth_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 async def register(
     user_create: UserRegister, db: AsyncSession = Depends(get_db_session)
@@ -28,10 +49,15 @@ async def register(
             detail="Username or email already registered",
         )
 
+    try:
+        hashed_password = await hash_password_async(user_create.password)
+    except HashingPoolSaturatedError:
+        raise _auth_busy()
+
     new_user = User(
         username=user_create.username,
         email=user_create.email,
-        hashed_password=hash_password(user_create.password),
+        hashed_password=hashed_password,
     )
     db.add(new_user)
     await db.commit()
@@ -41,14 +67,46 @@ async def register(
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(user_login: UserLogin, db: AsyncSession = Depends(get_db_session)):
-    """Authenticate a user and return a JWT access token."""
+async def login(
+    user_login: UserLogin,
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Authenticate a user and return a JWT access token.
+
+    Attempts are rate limited per username, and more loosely per client
+    address since users behind one proxy or NAT share it.
+    """
+    client = client_address(request, trusted_proxies)
+    for limiter, key in (
+        (login_user_rate_limiter, user_login.username.lower()),
+        (login_ip_rate_limiter, client),
+    ):
+        retry_after = await limiter.hit(db, key)
+        if retry_after:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many login attempts, please retry later",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
     result = await db.exec(select(User).where(User.username == user_login.username))
     user = result.first()
-    if not user or not verify_password(user_login.password, user.hashed_password):
+    try:
+        valid = user is not None and await verify_password_async(
+            user_login.password, user.hashed_password
+        )
+    except HashingPoolSaturatedError:
+        raise _auth_busy()
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
         )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
+        )
 
     token = create_access_token({"sub": str(user.id)})
     return TokenResponse(access_token=token)
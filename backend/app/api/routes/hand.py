@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, status, Depends
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.api.schemas.hand import (
@@ -6,13 +7,43 @@ from app.api.schemas.hand import (
     HandRead,
     HandUpdate,
 )
+from app.core.analytics_cache import analytics_cache
 from app.db.session import get_db_session
 from app.models.hand import Hand as PokerHand
+from app.models.session import Session
+from app.services.stats_service import StatsService, hand_key
 
 
 router = APIRouter(prefix="/hands", tags=["hands"])
 
 
+async def _lock_hand(db: AsyncSession, hand_id: int) -> PokerHand:
+    """
+    Load a hand that is about to change its session's rollups, or 404.
+
+    Its session is share-locked first, in the same order as
+    SessionService.delete_sessions, so the change cannot interleave with
+    deleting the session. The hand is then re-read FOR UPDATE, so concurrent
+    changes to it apply their rollup deltas one after another, each computed
+    from the latest committed row.
+    """
+    hand = await db.get(PokerHand, hand_id)
+    if hand:
+        await db.execute(
+            select(Session.id)
+            .where(Session.id == hand.session_id)
+            .with_for_update(read=True)
+        )
+        hand = await db.get(
+            PokerHand, hand_id, populate_existing=True, with_for_update=True
+        )
+    if not hand:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Hand not found"
+        )
+    return hand
+
+
 @router.get("/{hand_id}", response_model=HandRead)
 async def get_hand(hand_id: int, db: AsyncSession = Depends(get_db_session)):
     """Retrieve a single hand by ID."""
@@ -31,7 +62,11 @@ async def create_hand(
     """Create a new hand for a session."""
     new_hand = PokerHand(**hand_create.model_dump())
     db.add(new_hand)
+    user_id = await StatsService.record_hands(
+        db, new_hand.session_id, added=[hand_key(new_hand)]
+    )
     await db.commit()
+    analytics_cache.invalidate(user_id)
     await db.refresh(new_hand)
     return new_hand
 
@@ -41,17 +76,21 @@ async def update_hand(
     hand_id: int, hand_update: HandUpdate, db: AsyncSession = Depends(get_db_session)
 ):
     """Update a hand's action_taken or result."""
-    hand = await db.get(PokerHand, hand_id)
-    if not hand:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Hand not found"
-        )
+    hand = await _lock_hand(db, hand_id)
 
+    old_key = hand_key(hand)
     update_data = hand_update.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(hand, key, value)
 
+    user_id = None
+    if hand_key(hand) != old_key:
+        user_id = await StatsService.record_hands(
+            db, hand.session_id, added=[hand_key(hand)], removed=[old_key]
+        )
     await db.commit()
+    if user_id is not None:
+        analytics_cache.invalidate(user_id)
     await db.refresh(hand)
     return hand
 
@@ -59,12 +98,12 @@ async def update_hand(
 @router.delete("/{hand_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_hand(hand_id: int, db: AsyncSession = Depends(get_db_session)):
     """Delete a specific hand."""
-    hand = await db.get(PokerHand, hand_id)
-    if not hand:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Hand not found"
-        )
+    hand = await _lock_hand(db, hand_id)
 
+    user_id = await StatsService.record_hands(
+        db, hand.session_id, removed=[hand_key(hand)]
+    )
     await db.delete(hand)
     await db.commit()
+    analytics_cache.invalidate(user_id)
     return None
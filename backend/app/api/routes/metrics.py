@@ -0,0 +1,39 @@
+from fastapi import APIRouter
+
+from app.core.analytics_cache import analytics_cache
+from app.core.odds.cache import odds_cache
+from app.core.rate_limit import login_ip_rate_limiter, login_user_rate_limiter
+from app.core.security import password_hashing_pool
+from app.db.session import engine
+
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get("/odds-cache")
+async def get_odds_cache_metrics():
+    """Get size and hit/miss counters of the odds result cache."""
+    return odds_cache.stats()
+
+
+@router.get("/analytics-cache")
+async def get_analytics_cache_metrics():
+    """Get hit/miss counters of the analytics response cache."""
+    return analytics_cache.stats()
+
+
+@router.get("/db-pool")
+async def get_db_pool_metrics():
+    """Get connection pool usage, checkout wait times and connection churn."""
+    return engine.pool.stats()
+
+
+@router.get("/auth")
+async def get_auth_metrics():
+    """Get password hashing pool queue depth and login rate limiting counts."""
+    return {
+        "password_hashing": password_hashing_pool.stats(),
+        "logins_rate_limited": (
+            login_user_rate_limiter.limited + login_ip_rate_limiter.limited
+        ),
+    }
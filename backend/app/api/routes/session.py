@@ -1,52 +1,181 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from sqlmodel import select, func, desc
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request, status, Depends
+from pydantic import ValidationError
+from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.schemas.session import SessionCreate, SessionRead
-from app.api.schemas.hand import HandRead
+from app.api.pagination import (
+    PAGE_RESPONSES,
+    decode_cursor,
+    page_response,
+    page_size,
+    parse_fields,
+)
+from app.api.schemas.session import (
+    SessionBulkDeleteResponse,
+    SessionCreate,
+    SessionListItem,
+    SessionRead,
+)
+from app.api.schemas.hand import (
+    HandBulkItem,
+    HandBulkResponse,
+    HandImportResponse,
+    HandListItem,
+)
 from app.models.session import Session as PokerSession
-from app.models.hand import Hand as PokerHand
-from app.models.user import User
 from app.db.session import get_db_session
-from app.core.deps import get_current_user
+from app.core.analytics_cache import analytics_cache
+from app.core.config import settings
+from app.core.deps import get_current_user_id
+from app.core.history.parser import HandHistoryParser, parse_hand_history_async
+from app.services.hand_service import HAND_COLUMNS, HandService
+from app.services.session_service import SESSION_COLUMNS, SessionService
 
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
 
-@router.get("", response_model=list[SessionRead])
-async def get_sessions(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db_session),
-):
-    """Retrieve all poker sessions for the current user with hand counts."""
+class _LineTooLong(Exception):
+    """Raised while streaming a body when a line exceeds the length limit."""
+
+    def __init__(self, line: int, max_bytes: int):
+        super().__init__(f"Line {line} is longer than {max_bytes} bytes")
+        self.line = line
+        self.max_bytes = max_bytes
+
+
+class _InvalidHandLine(Exception):
+    """Raised while streaming NDJSON hands when a line fails validation."""
+
+    def __init__(self, line: int, parsed: int, message: str):
+        super().__init__(message)
+        self.line = line
+        self.parsed = parsed
+        self.message = message
+
+
+async def _get_user_session(
+    db: AsyncSession, session_id: int, user_id: int
+) -> PokerSession:
+    """Load a session owned by the user or raise 404."""
     result = await db.exec(
-        select(PokerSession, func.count(PokerHand.id).label("hand_count"))
-        .outerjoin(PokerHand, PokerSession.id == PokerHand.session_id)
-        .where(PokerSession.user_id == current_user.id)
-        .group_by(PokerSession.id)
-        .order_by(desc(PokerSession.start_time))
+        select(PokerSession).where(
+            PokerSession.id == session_id, PokerSession.user_id == user_id
+        )
     )
-    sessions_with_counts = []
+    poker_session = result.first()
+    if not poker_session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Poker session not found"
+        )
+    return poker_session
+
+
+async def _body_lines(request: Request) -> AsyncIterator[bytes]:
+    """
+    Yield the lines of a streamed body without their newlines.
 
-    for session, hand_count in result.all():
-        session_dict = session.model_dump()
-        session_dict["hand_count"] = hand_count
-        sessions_with_counts.append(session_dict)
+    Raises _LineTooLong once a line exceeds HAND_IMPORT_MAX_LINE_BYTES, so a
+    body without newlines cannot grow the buffer without bound.
+    """
+    max_bytes = settings.HAND_IMPORT_MAX_LINE_BYTES
+    buffer = bytearray()
+    line_number = 0
+    async for chunk in request.stream():
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            buffer += chunk[start:end]
+            start = end + 1
+            line_number += 1
+            if len(buffer) > max_bytes:
+                raise _LineTooLong(line_number, max_bytes)
+            yield bytes(buffer)
+            buffer.clear()
+        buffer += chunk[start:]
+        if len(buffer) > max_bytes:
+            raise _LineTooLong(line_number + 1, max_bytes)
+    if buffer:
+        yield bytes(buffer)
 
-    return sessions_with_counts
+
+async def _ndjson_hands(request: Request) -> AsyncIterator[dict]:
+    """Parse and validate one hand per line of a streamed NDJSON body."""
+    line_number = 0
+    parsed = 0
+
+    def parse(line: bytes) -> dict:
+        try:
+            hand = HandBulkItem.model_validate_json(line)
+        except ValidationError as e:
+            raise _InvalidHandLine(line_number, parsed, e.errors()[0]["msg"])
+        return hand.model_dump(mode="json")
+
+    try:
+        async for line in _body_lines(request):
+            line_number += 1
+            if line.strip():
+                yield parse(line)
+                parsed += 1
+    except _LineTooLong as e:
+        raise _InvalidHandLine(
+            e.line, parsed, f"line is longer than {e.max_bytes} bytes"
+        )
+
+
+async def _text_lines(request: Request) -> AsyncIterator[str]:
+    """
+    Decode a streamed text body and yield it line by line.
+
+    Raises _LineTooLong like _body_lines.
+    """
+    # A newline byte never occurs inside a multi-byte UTF-8 character, so
+    # every line decodes on its own; utf-8-sig drops an export's BOM
+    async for line in _body_lines(request):
+        yield line.decode("utf-8-sig", errors="replace")
+
+
+@router.get("", response_model=list[SessionListItem], responses=PAGE_RESPONSES)
+async def get_sessions(
+    fields: Optional[str] = Query(
+        default=None, description="Comma-separated fields to return"
+    ),
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.LIST_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Retrieve the current user's poker sessions with hand counts, newest
+    first.
+
+    Every session is returned unless `limit` or `cursor` is given; pages
+    then hold `limit` sessions (LIST_PAGE_SIZE by default) and the
+    X-Next-Cursor header of a page is the `cursor` of the next one.
+    `fields` limits the fields returned for each session.
+    """
+    sessions, next_keyset = await SessionService.list_sessions(
+        db,
+        user_id,
+        parse_fields(fields, tuple(SESSION_COLUMNS)),
+        page_size(limit, cursor),
+        decode_cursor(cursor),
+    )
+    return page_response(sessions, next_keyset)
 
 
 @router.get("/{session_id}", response_model=SessionRead)
 async def get_session(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """Retrieve a single poker session by ID."""
     result = await db.exec(
         select(PokerSession).where(
-            PokerSession.id == session_id, PokerSession.user_id == current_user.id
+            PokerSession.id == session_id, PokerSession.user_id == user_id
         )
     )
     poker_session = result.first()
@@ -60,65 +189,207 @@ async def get_session(
 @router.post("", response_model=SessionRead, status_code=status.HTTP_201_CREATED)
 async def create_session(
     session_create: SessionCreate,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """Create a new poker session for the current user."""
-    new_session = PokerSession(user_id=current_user.id, notes=session_create.notes)
+    new_session = PokerSession(user_id=user_id, notes=session_create.notes)
     db.add(new_session)
     await db.commit()
+    analytics_cache.invalidate(user_id)
     await db.refresh(new_session)
     return new_session
 
 
+@router.delete("", response_model=SessionBulkDeleteResponse)
+async def delete_sessions(
+    ids: Optional[list[int]] = Query(default=None),
+    before: Optional[datetime] = Query(default=None),
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Delete many poker sessions and their hands at once.
+
+    Deletes the sessions listed in `ids`, those started before `before`,
+    or, when both are given, the listed sessions started before it.
+    """
+    if ids is None and before is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Pass ids and/or before to choose the sessions to delete",
+        )
+    session_ids = await SessionService.delete_sessions(
+        db, user_id, session_ids=ids, before=before
+    )
+    await db.commit()
+    analytics_cache.invalidate(user_id)
+    return SessionBulkDeleteResponse(deleted=len(session_ids), session_ids=session_ids)
+
+
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_session(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
     """Delete a poker session and all its associated hands."""
-    result = await db.exec(
-        select(PokerSession).where(
-            PokerSession.id == session_id, PokerSession.user_id == current_user.id
-        )
+    deleted = await SessionService.delete_sessions(
+        db, user_id, session_ids=[session_id]
     )
-    poker_session = result.first()
-    if not poker_session:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Poker session not found"
         )
-
-    hand_result = await db.exec(
-        select(PokerHand).where(PokerHand.session_id == session_id)
-    )
-    for hand in hand_result.all():
-        await db.delete(hand)
-
-    await db.delete(poker_session)
     await db.commit()
+    analytics_cache.invalidate(user_id)
     return None
 
 
-@router.get("/{session_id}/hands", response_model=list[HandRead])
+@router.get(
+    "/{session_id}/hands",
+    response_model=list[HandListItem],
+    responses=PAGE_RESPONSES,
+)
 async def get_session_hands(
     session_id: int,
-    current_user: User = Depends(get_current_user),
+    fields: Optional[str] = Query(
+        default=None, description="Comma-separated fields to return"
+    ),
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.LIST_MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    user_id: int = Depends(get_current_user_id),
     db: AsyncSession = Depends(get_db_session),
 ):
-    """Get all hands for a specific session."""
-    result = await db.exec(
-        select(PokerSession).where(
-            PokerSession.id == session_id, PokerSession.user_id == current_user.id
-        )
+    """
+    Get the hands of a specific session in the order they were played.
+
+    Every hand is returned unless `limit` or `cursor` is given; pages then
+    hold `limit` hands (LIST_PAGE_SIZE by default) and the X-Next-Cursor
+    header of a page is the `cursor` of the next one. `fields` limits the
+    fields returned for each hand.
+    """
+    await _get_user_session(db, session_id, user_id)
+    hands, next_keyset = await HandService.list_hands(
+        db,
+        session_id,
+        parse_fields(fields, tuple(HAND_COLUMNS)),
+        page_size(limit, cursor),
+        decode_cursor(cursor),
     )
-    poker_session = result.first()
-    if not poker_session:
+    return page_response(hands, next_keyset)
+
+
+@router.post(
+    "/{session_id}/hands/bulk",
+    response_model=HandBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_session_hands_bulk(
+    session_id: int,
+    hands: list[HandBulkItem],
+    batch_size: Optional[int] = Query(default=None, ge=1, le=2000),
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Add many hands to a session at once.
+
+    Every hand is validated before anything is written; hands are then
+    inserted with multi-row INSERTs, committing every `batch_size` hands.
+    """
+    await _get_user_session(db, session_id, user_id)
+    try:
+        hand_ids = await HandService.bulk_insert(
+            db,
+            user_id,
+            session_id,
+            (hand.model_dump(mode="json") for hand in hands),
+            batch_size or settings.HAND_BULK_BATCH_SIZE,
+        )
+    finally:
+        # Batches committed before a failure are kept
+        analytics_cache.invalidate(user_id)
+    return HandBulkResponse(inserted=len(hand_ids), hand_ids=hand_ids)
+
+
+@router.post(
+    "/{session_id}/hands/bulk/ndjson",
+    response_model=HandBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_session_hands_ndjson(
+    session_id: int,
+    request: Request,
+    batch_size: Optional[int] = Query(default=None, ge=1, le=2000),
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Stream hands into a session as newline-delimited JSON, one hand per line.
+
+    The body is parsed as it arrives and committed every `batch_size` hands,
+    so memory use does not grow with the upload. If a line is invalid, the
+    batches committed before it are kept and the error reports how many.
+    """
+    await _get_user_session(db, session_id, user_id)
+    batch_size = batch_size or settings.HAND_BULK_BATCH_SIZE
+    try:
+        hand_ids = await HandService.bulk_insert(
+            db, user_id, session_id, _ndjson_hands(request), batch_size
+        )
+    except _InvalidHandLine as e:
+        await db.rollback()
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Poker session not found"
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"Invalid hand on line {e.line}: {e.message}; "
+                f"{e.parsed - e.parsed % batch_size} hands were imported"
+            ),
         )
+    finally:
+        analytics_cache.invalidate(user_id)
+    return HandBulkResponse(inserted=len(hand_ids), hand_ids=hand_ids)
 
-    hands_result = await db.exec(
-        select(PokerHand).where(PokerHand.session_id == session_id)
-    )
-    return hands_result.all()
+
+@router.post(
+    "/{session_id}/hands/import",
+    response_model=HandImportResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_session_hand_history(
+    session_id: int,
+    request: Request,
+    batch_size: Optional[int] = Query(default=None, ge=1, le=2000),
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Import a text hand-history export (PokerStars format) into a session.
+
+    The raw file is sent as the request body and parsed as it streams in,
+    committing every `batch_size` hands. Hands the hero was not dealt into,
+    or that cannot be mapped, are skipped and counted. A line longer than
+    the line limit stops the import with 413, keeping committed batches.
+    """
+    await _get_user_session(db, session_id, user_id)
+    parser = HandHistoryParser()
+    imported = 0
+    try:
+        async for batch_ids in HandService.insert_batches(
+            db,
+            user_id,
+            session_id,
+            parse_hand_history_async(_text_lines(request), parser),
+            batch_size or settings.HAND_BULK_BATCH_SIZE,
+        ):
+            imported += len(batch_ids)
+    except _LineTooLong as e:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"{e}; {imported} hands were imported",
+        )
+    finally:
+        analytics_cache.invalidate(user_id)
+    return HandImportResponse(imported=imported, skipped=parser.skipped)
@@ -1,4 +1,6 @@
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, HTTPException, status
 
 from app.api.schemas.hand import (
     HandEvaluationRequest,
@@ -7,18 +9,37 @@ from app.api.schemas.hand import (
     HandOddsResponse,
 )
 from app.core.evaluator.evaluator import evaluate_hand as evaluate_hand_core
-from app.core.odds.odds_calculator import calculate_odds as calculate_odds_core
+from app.core.odds.cache import canonical_key, odds_cache
+from app.core.odds.enumeration import check_cards, check_deal
+from app.core.odds.odds_calculator import (
+    calculate_odds_adaptive_async,
+    calculate_odds_async,
+)
+from app.core.odds.pool import PoolSaturatedError
 from app.core.models.card import Card
+from app.core.config import settings
 
 
 router = APIRouter(prefix="/tools", tags=["tools"])
 
+# Simulations allowed to run at once in this server process
+_simulation_slots = asyncio.Semaphore(settings.ODDS_MAX_CONCURRENT)
+
 
 def _parse_cards(cards: list[str]) -> list[Card]:
     """Convert a list of string representations into Card objects."""
     return [Card(c) for c in cards]
 
 
+def _odds_busy() -> HTTPException:
+    """Build the error returned when no simulation capacity is available."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Odds calculator is busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/evaluate", response_model=HandEvaluationResponse)
 async def evaluate_hand(request: HandEvaluationRequest):
     """
@@ -33,8 +54,72 @@ async def evaluate_hand(request: HandEvaluationRequest):
 async def calculate_odds(request: HandOddsRequest):
     """
     Calculate winning odds for the given hole cards and board state.
+
+    If `target_stderr` is given, simulation runs until that precision or the
+    time budget is reached and the response includes the trials used and a
+    confidence interval for the win rate.
+
+    Results are cached per suit-isomorphic situation, so repeated spots are
+    answered without simulating.
     """
-    hole_cards = _parse_cards(request.hole_cards)
-    board_cards = _parse_cards(request.board_cards)
-    odds = calculate_odds_core(hole_cards, board_cards, request.num_opponents)
-    return HandOddsResponse(win=odds["win"], tie=odds["tie"], loss=odds["loss"])
+    try:
+        hole_cards = _parse_cards(request.hole_cards)
+        board_cards = _parse_cards(request.board_cards)
+        check_cards(hole_cards, board_cards)
+        check_deal(
+            len(hole_cards) + len(board_cards), len(board_cards), request.num_opponents
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+        )
+
+    time_budget = None
+    if request.target_stderr is not None:
+        time_budget = min(
+            request.time_budget or settings.ODDS_MAX_TIME_BUDGET,
+            settings.ODDS_MAX_TIME_BUDGET,
+        )
+
+    cache_key = (
+        canonical_key(hole_cards, board_cards, request.num_opponents),
+        request.target_stderr,
+        time_budget,
+    )
+    odds = odds_cache.get(cache_key)
+    if odds is not None:
+        return HandOddsResponse(**odds)
+
+    try:
+        await asyncio.wait_for(
+            _simulation_slots.acquire(), timeout=settings.ODDS_QUEUE_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        raise _odds_busy()
+
+    try:
+        if request.target_stderr is not None:
+            odds = await calculate_odds_adaptive_async(
+                hole_cards,
+                board_cards,
+                request.num_opponents,
+                target_stderr=request.target_stderr,
+                time_budget=time_budget,
+                workers=settings.ODDS_WORKERS,
+                exact_threshold=settings.ODDS_EXACT_THRESHOLD,
+            )
+        else:
+            odds = await calculate_odds_async(
+                hole_cards,
+                board_cards,
+                request.num_opponents,
+                workers=settings.ODDS_WORKERS,
+                exact_threshold=settings.ODDS_EXACT_THRESHOLD,
+            )
+    except PoolSaturatedError:
+        raise _odds_busy()
+    finally:
+        _simulation_slots.release()
+
+    odds_cache.set(cache_key, odds)
+    return HandOddsResponse(**odds)
@@ -1,12 +1,16 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from app.core.models.card import Card
+from app.models.hand import Action, Position, Result
 
 
 class HandEvaluationRequest(BaseModel):
-    hole_cards: list[str]
-    board_cards: list[str]
+    # At most 7 cards in total, which the evaluator scores in one pass
+    hole_cards: list[str] = Field(max_length=2)
+    board_cards: list[str] = Field(max_length=5)
 
 
 class HandEvaluationResponse(BaseModel):
@@ -15,15 +19,23 @@ class HandEvaluationResponse(BaseModel):
 
 
 class HandOddsRequest(BaseModel):
-    hole_cards: list[str]
-    board_cards: list[str]
-    num_opponents: int
+    hole_cards: list[str] = Field(min_length=2, max_length=2)
+    board_cards: list[str] = Field(max_length=5)
+    # At most 22 opponents fit in a 52-card deck with a full board
+    num_opponents: int = Field(ge=1, le=22)
+    # Adaptive precision: simulate until the standard error reaches this target
+    target_stderr: Optional[float] = Field(default=None, gt=0)
+    time_budget: Optional[float] = Field(default=None, gt=0)
 
 
 class HandOddsResponse(BaseModel):
     win: float
     tie: float
     loss: float
+    mode: str = "monte_carlo"
+    trials: Optional[int] = None
+    stderr: Optional[float] = None
+    win_ci: Optional[tuple[float, float]] = None
 
 
 class HandCreate(BaseModel):
@@ -48,6 +60,53 @@ class HandRead(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class HandListItem(BaseModel):
+    """A listed hand; fields not chosen with `fields` are left out."""
+
+    id: Optional[int] = None
+    session_id: Optional[int] = None
+    hole_cards: Optional[list[str]] = None
+    board_cards: Optional[list[str]] = None
+    player_position: Optional[str] = None
+    action_taken: Optional[str] = None
+    result: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
 class HandUpdate(BaseModel):
     action_taken: Optional[str] = None
     result: Optional[str] = None
+
+
+class HandBulkItem(BaseModel):
+    """One hand of a bulk import; cards and enum fields are validated up front."""
+
+    hole_cards: list[str] = Field(default=[], max_length=2)
+    board_cards: list[str] = Field(default=[], max_length=5)
+    player_position: Position
+    action_taken: Optional[Action] = None
+    result: Optional[Result] = None
+
+    @field_validator("hole_cards", "board_cards")
+    @classmethod
+    def check_card_codes(cls, cards: list[str]) -> list[str]:
+        for code in cards:
+            Card(code)
+        return cards
+
+    @model_validator(mode="after")
+    def check_duplicate_cards(self) -> "HandBulkItem":
+        cards = self.hole_cards + self.board_cards
+        if len(set(cards)) != len(cards):
+            raise ValueError("A card appears more than once in the hand")
+        return self
+
+
+class HandBulkResponse(BaseModel):
+    inserted: int
+    hand_ids: list[int]
+
+
+class HandImportResponse(BaseModel):
+    imported: int
+    skipped: int
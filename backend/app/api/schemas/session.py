@@ -17,3 +17,19 @@ class SessionRead(BaseModel):
     hand_count: int = 0
 
     model_config = {"from_attributes": True}
+
+
+class SessionListItem(BaseModel):
+    """A listed session; fields not chosen with `fields` are left out."""
+
+    id: Optional[int] = None
+    user_id: Optional[int] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    notes: Optional[str] = None
+    hand_count: Optional[int] = None
+
+
+class SessionBulkDeleteResponse(BaseModel):
+    deleted: int
+    session_ids: list[int]
@@ -0,0 +1,164 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional, Protocol
+
+from .config import settings
+
+
+class AnalyticsCacheBackend(Protocol):
+    """
+    Storage behind AnalyticsCache.
+
+    Entries may be evicted at any time. Counters may only move forward for
+    as long as the backend lives, and `epoch` must change whenever they are
+    reset, so versions from before the reset are never reused. A backend
+    shared by every server process (e.g. Redis) makes invalidations visible
+    to all of them at once.
+    """
+
+    epoch: str
+
+    def get(self, key: str) -> Optional[Any]: ...
+
+    def set(self, key: str, value: Any) -> None: ...
+
+    def counter(self, name: str) -> int: ...
+
+    def incr(self, name: str) -> int: ...
+
+
+class LocalCacheBackend:
+    """
+    In-process LRU backend whose entries expire `ttl` seconds after being set.
+
+    Counters also move forward on their own `ttl` seconds after they last
+    changed. Other processes cannot bump them, so this bounds how long the
+    process keeps answering from versions another process has invalidated.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.epoch = uuid.uuid4().hex[:8]
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._counters: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def counter(self, name: str) -> int:
+        with self._lock:
+            return self._current(name, time.monotonic())
+
+    def incr(self, name: str) -> int:
+        now = time.monotonic()
+        with self._lock:
+            value = self._current(name, now) + 1
+            self._counters[name] = (value, now + self.ttl)
+            return value
+
+    def _current(self, name: str, now: float) -> int:
+        """Return a counter's value, moving it forward once it expires."""
+        entry = self._counters.get(name)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        value = entry[0] + 1 if entry is not None else 0
+        self._counters[name] = (value, now + self.ttl)
+        return value
+
+
+class AnalyticsCache:
+    """
+    Cache of analytics responses keyed by user, endpoint and a per-user
+    data version.
+
+    Write routes call `invalidate` after committing changes to a user's
+    hands or sessions, which bumps the user's version. Entries and ETags
+    are derived from the version, so stale entries are never looked up
+    again and simply age out of the backend.
+
+    With the default LocalCacheBackend, versions are per process: an
+    invalidation only reaches the process that made it, and the others
+    serve the user's old responses and 304s for up to
+    ANALYTICS_CACHE_TTL seconds.
+    """
+
+    def __init__(self, backend: AnalyticsCacheBackend) -> None:
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def etag(self, user_id: int, key: str) -> str:
+        """Return the ETag of the user's current data for an endpoint key."""
+        version = self.backend.counter(f"user:{user_id}")
+        raw = f"{self.backend.epoch}:{user_id}:{version}:{key}"
+        return '"' + hashlib.sha1(raw.encode()).hexdigest()[:20] + '"'
+
+    def get(self, etag: str) -> Optional[Any]:
+        """Return the response cached under an ETag, or None on a miss."""
+        value = self.backend.get(etag)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, etag: str, value: Any) -> None:
+        self.backend.set(etag, value)
+
+    def invalidate(self, user_id: int) -> None:
+        """Mark every cached response of the user as stale."""
+        self.backend.incr(f"user:{user_id}")
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Summarize cache usage.
+
+        Returns a dictionary with:
+            - hits (int): Lookups answered from the cache.
+            - misses (int): Lookups that had to be computed.
+            - hit_rate (float): Fraction of lookups that were hits.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+analytics_cache = AnalyticsCache(
+    LocalCacheBackend(settings.ANALYTICS_CACHE_SIZE, settings.ANALYTICS_CACHE_TTL)
+)
@@ -11,6 +11,15 @@ class Settings:
 
     # Database settings
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 20))
+    # Seconds to wait for a free connection before failing
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 10.0))
+    # Reopen connections older than this many seconds; -1 keeps them forever
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "True").lower() == "true"
+    # Prepared statements cached per connection (asyncpg); 0 for pgbouncer
+    DB_STATEMENT_CACHE_SIZE: int = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 500))
 
     # App settings
     APP_NAME: str = "Poker Analytics API"
@@ -20,6 +29,52 @@ class Settings:
     SECRET_KEY: str = os.getenv("SECRET_KEY")
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+    # Password hashing thread pool and login rate limiting
+    AUTH_HASH_WORKERS: int = int(os.getenv("AUTH_HASH_WORKERS", 2))
+    AUTH_HASH_MAX_PENDING: int = int(os.getenv("AUTH_HASH_MAX_PENDING", 32))
+    # Login attempts allowed per username, and per client address, in each
+    # window; the address limit is looser since users can share one
+    AUTH_LOGIN_ATTEMPTS: int = int(os.getenv("AUTH_LOGIN_ATTEMPTS", 10))
+    AUTH_LOGIN_IP_ATTEMPTS: int = int(os.getenv("AUTH_LOGIN_IP_ATTEMPTS", 100))
+    AUTH_LOGIN_WINDOW: float = float(os.getenv("AUTH_LOGIN_WINDOW", 60))
+    # Comma-separated proxy addresses/CIDRs whose X-Forwarded-For is trusted
+    AUTH_TRUSTED_PROXIES: str = os.getenv("AUTH_TRUSTED_PROXIES", "")
+    # Active users cached by the auth dependencies; the TTL bounds how long
+    # a user deactivated in the database keeps access
+    USER_CACHE_SIZE: int = int(os.getenv("USER_CACHE_SIZE", 10_000))
+    USER_CACHE_TTL: float = float(os.getenv("USER_CACHE_TTL", 60))
+
+    # Default and maximum page sizes of session and hand listings
+    LIST_PAGE_SIZE: int = int(os.getenv("LIST_PAGE_SIZE", 100))
+    LIST_MAX_PAGE_SIZE: int = int(os.getenv("LIST_MAX_PAGE_SIZE", 1000))
+
+    # Concurrent queries and overall time limit of one dashboard request
+    DASHBOARD_MAX_CONCURRENCY: int = int(os.getenv("DASHBOARD_MAX_CONCURRENCY", 3))
+    DASHBOARD_TIMEOUT: float = float(os.getenv("DASHBOARD_TIMEOUT", 10.0))
+
+    # Analytics responses kept in the in-process cache, and for how long
+    # another server process's writes can go unnoticed
+    ANALYTICS_CACHE_SIZE: int = int(os.getenv("ANALYTICS_CACHE_SIZE", 10_000))
+    ANALYTICS_CACHE_TTL: float = float(os.getenv("ANALYTICS_CACHE_TTL", 30))
+
+    # Hands per transaction for bulk hand imports
+    HAND_BULK_BATCH_SIZE: int = int(os.getenv("HAND_BULK_BATCH_SIZE", 500))
+    # Longest line accepted in a streamed hand upload
+    HAND_IMPORT_MAX_LINE_BYTES: int = int(
+        os.getenv("HAND_IMPORT_MAX_LINE_BYTES", 65_536)
+    )
+
+    # Odds calculator worker pool
+    ODDS_WORKERS: int = int(os.getenv("ODDS_WORKERS", os.cpu_count() or 4))
+    ODDS_MAX_PENDING: int = int(os.getenv("ODDS_MAX_PENDING", 16))
+    ODDS_QUEUE_TIMEOUT: float = float(os.getenv("ODDS_QUEUE_TIMEOUT", 2.0))
+    ODDS_MAX_CONCURRENT: int = int(os.getenv("ODDS_MAX_CONCURRENT", 4))
+    ODDS_EXACT_THRESHOLD: int = int(os.getenv("ODDS_EXACT_THRESHOLD", 100_000))
+    ODDS_MAX_TIME_BUDGET: float = float(os.getenv("ODDS_MAX_TIME_BUDGET", 5.0))
+    ODDS_CACHE_SIZE: int = int(os.getenv("ODDS_CACHE_SIZE", 10_000))
+    ODDS_CACHE_TTL: float = float(os.getenv("ODDS_CACHE_TTL", 3600))
+    # Path to a preflop equity table; defaults to the one shipped with the app
+    ODDS_PREFLOP_TABLE: str = os.getenv("ODDS_PREFLOP_TABLE")
 
 
 settings = Settings()
@@ -4,6 +4,7 @@ from jose import jwt, JWTError
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.core.user_cache import user_cache
 from app.db.session import get_db_session
 from app.models.user import User
 
@@ -11,33 +12,59 @@ from app.models.user import User
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db_session),
-) -> User:
-    """Get the current authenticated user from JWT token."""
+def _token_user_id(credentials: HTTPAuthorizationCredentials) -> int:
+    """Decode the JWT token and return the user id it was issued for."""
     token = credentials.credentials
 
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        user_id = int(payload.get("sub"))
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-            )
-    except JWTError:
+        return int(payload.get("sub"))
+    except (JWTError, TypeError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         )
 
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db_session),
+) -> User:
+    """
+    Get the current authenticated user from JWT token.
+
+    Active users are served from a short-lived cache; the returned User is
+    detached and must not be modified. A user deactivated in the database
+    is rejected once their cache entry expires, within USER_CACHE_TTL
+    seconds in every server process.
+    """
+    user_id = _token_user_id(credentials)
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+
     user = await db.get(User, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
+        )
 
+    db.expunge(user)
+    user_cache.set(user)
     return user
+
+
+async def get_current_user_id(user: User = Depends(get_current_user)) -> int:
+    """
+    Get the current user's id, for routes that only need the id.
+
+    Checks the user is active like get_current_user, so a request only
+    queries the database when the user is not cached.
+    """
+    return user.id
@@ -1,27 +1,30 @@
-from itertools import combinations
 from collections import Counter
 
 from ..models.card import Card, RANK_ORDER
-
-
-HAND_RANKS = {
-    "High Card": 1,
-    "One Pair": 2,
-    "Two Pair": 3,
-    "Three of a Kind": 4,
-    "Straight": 5,
-    "Flush": 6,
-    "Full House": 7,
-    "Four of a Kind": 8,
-    "Straight Flush": 9,
-    "Royal Flush": 10,
-}
+from .lookup import HAND_RANKS, describe_strength, encode_card, evaluate_best
 
 
 def evaluate_five_card_hand(cards: list[Card]) -> dict[str, int | str | tuple[int]]:
     """
     Evaluate the best 5-card poker hand.
 
+    Returns a dictionary with:
+        - label (str): Hand name (e.g., "Flush", "Two Pair").
+        - rank (int): Hand strength.
+        - kickers (tuple[int]): Rank indices for tie-breaking.
+    """
+    if len(cards) == 5:
+        return describe_strength(evaluate_best([encode_card(c) for c in cards]))
+    return _classify_cards(cards)
+
+
+def _classify_cards(cards: list[Card]) -> dict[str, int | str | tuple[int]]:
+    """
+    Classify up to five cards directly, without the lookup tables.
+
+    Used for partial hands (fewer than 5 cards) and as the reference
+    implementation the lookup tables are checked against.
+
     Returns a dictionary with:
         - label (str): Hand name (e.g., "Flush", "Two Pair").
         - rank (int): Hand strength.
@@ -159,15 +162,18 @@ def evaluate_hand(cards: list[Card]) -> dict[str, int | str | tuple[int]]:
         raise ValueError(f"At least 1 card is required to evaluate a hand.")
 
     if num_cards < 5:
-        return evaluate_five_card_hand(cards)
-
-    best_hand = None
-    for combo in combinations(cards, 5):
-        current = evaluate_five_card_hand(list(combo))
-        if not best_hand or (current["rank"], tuple(current["kickers"])) > (
-            best_hand["rank"],
-            best_hand["kickers"],
-        ):
-            best_hand = current
-
-    return best_hand
+        return _classify_cards(cards)
+
+    return describe_strength(hand_strength(cards))
+
+
+def hand_strength(cards: list[Card]) -> int:
+    """
+    Return the strength of the best 5-card hand from 5-7 cards as a single int.
+
+    Strengths order hands exactly like their (rank, kickers) pairs, so hands can
+    be compared with plain integer comparison.
+    """
+    if not 5 <= len(cards) <= 7:
+        raise ValueError("Between 5 and 7 cards are required to score a hand.")
+    return evaluate_best([encode_card(c) for c in cards])
@@ -0,0 +1,256 @@
+from collections import Counter
+from itertools import combinations_with_replacement
+
+from ..models.card import Card, RANK_ORDER, SUITS
+
+HAND_RANKS = {
+    "High Card": 1,
+    "One Pair": 2,
+    "Two Pair": 3,
+    "Three of a Kind": 4,
+    "Straight": 5,
+    "Flush": 6,
+    "Full House": 7,
+    "Four of a Kind": 8,
+    "Straight Flush": 9,
+    "Royal Flush": 10,
+}
+
+HAND_LABELS = {rank: label for label, rank in HAND_RANKS.items()}
+
+# Number of kicker ranks packed into a strength for each hand rank.
+KICKER_COUNTS = {1: 5, 2: 4, 3: 3, 4: 3, 5: 1, 6: 5, 7: 2, 8: 2, 9: 1, 10: 0}
+
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+SUIT_BITS = {"C": 0x8000, "D": 0x4000, "H": 0x2000, "S": 0x1000}
+
+
+def _encode(rank: int, suit: str) -> int:
+    """
+    Encode a card as a 32-bit integer:
+
+        xxxbbbbb bbbbbbbb cdhsrrrr xxpppppp
+
+    where b is the rank bit, cdhs the suit bit, r the rank index and p the rank
+    prime.
+    """
+    return (1 << (16 + rank)) | SUIT_BITS[suit] | (rank << 8) | RANK_PRIMES[rank]
+
+
+CARD_INTS = {
+    rank + suit: _encode(i, suit) for i, rank in enumerate(RANK_ORDER) for suit in SUITS
+}
+
+
+def encode_card(card: Card) -> int:
+    """Return the integer encoding of a Card."""
+    return CARD_INTS[card.code]
+
+
+def _straight_high(mask: int) -> int:
+    """Return the high rank index of the best straight in a rank bitmask, or -1."""
+    for high in range(12, 3, -1):
+        if (mask >> (high - 4)) & 0x1F == 0x1F:
+            return high
+    # Ace-low straight (A-2-3-4-5) is five-high
+    if mask & 0x100F == 0x100F:
+        return RANK_ORDER.index("5")
+    return -1
+
+
+def _top_ranks(mask: int) -> int:
+    """Pack the (up to) five highest rank indices of a bitmask into kicker slots."""
+    packed, slot = 0, 0
+    for rank in range(12, -1, -1):
+        if mask & (1 << rank) and slot < 5:
+            packed |= rank << (16 - 4 * slot)
+            slot += 1
+    return packed
+
+
+STRAIGHT_HIGH = [_straight_high(mask) for mask in range(1 << 13)]
+TOP_RANKS = [_top_ranks(mask) for mask in range(1 << 13)]
+POPCOUNT = [bin(mask).count("1") for mask in range(1 << 13)]
+
+
+def pack_strength(rank: int, kickers: tuple[int, ...]) -> int:
+    """Pack a hand rank and up to five kicker indices into one comparable int."""
+    strength = rank << 20
+    for i, kicker in enumerate(kickers):
+        strength |= kicker << (16 - 4 * i)
+    return strength
+
+
+def _score_ranks(ranks: tuple[int, ...], is_flush: bool) -> int:
+    """Score five rank indices (sorted high to low) using the standard hand order."""
+    groups = sorted(Counter(ranks).items(), key=lambda x: (-x[1], -x[0]))
+    mask = 0
+    for r in ranks:
+        mask |= 1 << r
+    straight_high = STRAIGHT_HIGH[mask] if len(groups) == 5 else -1
+
+    if straight_high >= 0 and is_flush:
+        if straight_high == RANK_ORDER.index("A"):
+            return pack_strength(HAND_RANKS["Royal Flush"], ())
+        return pack_strength(HAND_RANKS["Straight Flush"], (straight_high,))
+    if groups[0][1] == 4:
+        return pack_strength(HAND_RANKS["Four of a Kind"], (groups[0][0], groups[1][0]))
+    if groups[0][1] == 3 and groups[1][1] == 2:
+        return pack_strength(HAND_RANKS["Full House"], (groups[0][0], groups[1][0]))
+    if is_flush:
+        return pack_strength(HAND_RANKS["Flush"], ranks)
+    if straight_high >= 0:
+        return pack_strength(HAND_RANKS["Straight"], (straight_high,))
+    if groups[0][1] == 3:
+        return pack_strength(HAND_RANKS["Three of a Kind"], tuple(r for r, _ in groups))
+    if groups[0][1] == 2 and groups[1][1] == 2:
+        return pack_strength(HAND_RANKS["Two Pair"], tuple(r for r, _ in groups))
+    if groups[0][1] == 2:
+        return pack_strength(HAND_RANKS["One Pair"], tuple(r for r, _ in groups))
+    return pack_strength(HAND_RANKS["High Card"], ranks)
+
+
+def _build_tables() -> tuple[list[int], list[int], dict[int, int]]:
+    """
+    Precompute strengths for every distinct 5-card rank pattern.
+
+    Returns a tuple with:
+        - flushes (list[int]): Strength by rank bitmask for suited hands.
+        - unique5 (list[int]): Strength by rank bitmask for five distinct ranks.
+        - paired (dict[int, int]): Strength by rank-prime product for paired hands.
+    """
+    flushes = [0] * (1 << 13)
+    unique5 = [0] * (1 << 13)
+    paired = {}
+
+    for ranks in combinations_with_replacement(range(12, -1, -1), 5):
+        if ranks[0] == ranks[4]:
+            continue  # five of a kind
+        if len(set(ranks)) == 5:
+            mask = sum(1 << r for r in ranks)
+            flushes[mask] = _score_ranks(ranks, True)
+            unique5[mask] = _score_ranks(ranks, False)
+        else:
+            product = 1
+            for r in ranks:
+                product *= RANK_PRIMES[r]
+            paired[product] = _score_ranks(ranks, False)
+
+    return flushes, unique5, paired
+
+
+FLUSHES, UNIQUE5, PAIRED = _build_tables()
+
+
+def evaluate_five(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """Return the strength of five encoded cards; higher is better."""
+    q = (c1 | c2 | c3 | c4 | c5) >> 16
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return FLUSHES[q]
+    strength = UNIQUE5[q]
+    if strength:
+        return strength
+    return PAIRED[(c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)]
+
+
+_ROYAL_FLUSH = HAND_RANKS["Royal Flush"] << 20
+_STRAIGHT_FLUSH = HAND_RANKS["Straight Flush"] << 20
+_FOUR_OF_A_KIND = HAND_RANKS["Four of a Kind"] << 20
+_FULL_HOUSE = HAND_RANKS["Full House"] << 20
+_FLUSH = HAND_RANKS["Flush"] << 20
+_STRAIGHT = HAND_RANKS["Straight"] << 20
+_THREE_OF_A_KIND = HAND_RANKS["Three of a Kind"] << 20
+_TWO_PAIR = HAND_RANKS["Two Pair"] << 20
+_ONE_PAIR = HAND_RANKS["One Pair"] << 20
+_HIGH_CARD = HAND_RANKS["High Card"] << 20
+
+
+def evaluate_seven(cards: list[int]) -> int:
+    """
+    Return the strength of the best 5-card hand among 5-7 encoded cards.
+
+    Builds per-suit rank bitmasks and rank multiplicity bitmasks in one pass
+    instead of scoring every 5-card combination.
+    """
+    suits = [0] * 9
+    seen1 = seen2 = seen3 = seen4 = 0
+    for c in cards:
+        bit = c >> 16
+        suits[(c >> 12) & 0xF] |= bit
+        if seen3 & bit:
+            seen4 |= bit
+        elif seen2 & bit:
+            seen3 |= bit
+        elif seen1 & bit:
+            seen2 |= bit
+        else:
+            seen1 |= bit
+
+    flush = 0
+    for mask in (suits[1], suits[2], suits[4], suits[8]):
+        if POPCOUNT[mask] >= 5:
+            flush = mask
+            high = STRAIGHT_HIGH[mask]
+            if high == 12:
+                return _ROYAL_FLUSH
+            if high >= 0:
+                return _STRAIGHT_FLUSH | high << 16
+            break
+
+    if seen4:
+        quad = seen4.bit_length() - 1
+        kicker = (seen1 & ~(1 << quad)).bit_length() - 1
+        return _FOUR_OF_A_KIND | quad << 16 | kicker << 12
+
+    if seen3:
+        trip = seen3.bit_length() - 1
+        pairs = seen2 & ~(1 << trip)
+        if pairs:
+            return _FULL_HOUSE | trip << 16 | (pairs.bit_length() - 1) << 12
+
+    if flush:
+        return _FLUSH | TOP_RANKS[flush]
+
+    high = STRAIGHT_HIGH[seen1]
+    if high >= 0:
+        return _STRAIGHT | high << 16
+
+    if seen3:
+        rest = seen1 & ~(1 << trip)
+        return _THREE_OF_A_KIND | trip << 16 | (TOP_RANKS[rest] >> 4) & 0xFF00
+
+    if seen2:
+        pair = seen2.bit_length() - 1
+        second = (seen2 & ~(1 << pair)).bit_length() - 1
+        if second >= 0:
+            rest = seen1 & ~(1 << pair) & ~(1 << second)
+            return (
+                _TWO_PAIR | pair << 16 | second << 12 | (TOP_RANKS[rest] >> 8) & 0xF00
+            )
+        rest = seen1 & ~(1 << pair)
+        return _ONE_PAIR | pair << 16 | (TOP_RANKS[rest] >> 4) & 0xFFF0
+
+    return _HIGH_CARD | TOP_RANKS[seen1]
+
+
+def evaluate_best(cards: list[int]) -> int:
+    """Return the strength of the best 5-card hand among 5-7 encoded cards."""
+    if len(cards) == 5:
+        return evaluate_five(*cards)
+    return evaluate_seven(cards)
+
+
+def describe_strength(strength: int) -> dict[str, int | str | tuple[int]]:
+    """
+    Expand a packed strength into the evaluator's dictionary form.
+
+    Returns a dictionary with:
+        - label (str): Hand name (e.g., "Flush", "Two Pair").
+        - rank (int): Hand strength.
+        - kickers (tuple[int]): Rank indices for tie-breaking.
+    """
+    rank = strength >> 20
+    kickers = tuple(
+        (strength >> (16 - 4 * i)) & 0xF for i in range(KICKER_COUNTS[rank])
+    )
+    return {"label": HAND_LABELS[rank], "rank": rank, "kickers": kickers}
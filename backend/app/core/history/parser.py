@@ -0,0 +1,207 @@
+import re
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Optional
+
+from ..models.card import Card
+
+
+# Hands longer than this are assumed to be corrupt and are skipped
+MAX_HAND_LINES = 500
+
+_HEADER = re.compile(r"^\ufeff?[A-Za-z][\w ]* Hand #\d+")
+_TIMESTAMP = re.compile(r"(\d{4})/(\d{2})/(\d{2}) (\d{1,2}):(\d{2}):(\d{2})")
+_BUTTON = re.compile(r"Seat #(\d+) is the button")
+_SEAT = re.compile(r"^Seat (\d+): (.+?) \([^()]*in chips[^()]*\)(.*)$")
+_DEALT = re.compile(r"^Dealt to (.+?) \[([^\]]+)\]")
+_BOARD = re.compile(r"^Board \[([^\]]*)\]")
+_COLLECTED = re.compile(r"^(.+?) collected \S+ from (.+)$")
+
+_ACTIONS = {
+    "folds": "fold",
+    "checks": "check",
+    "calls": "call",
+    "bets": "raise",
+    "raises": "raise",
+}
+
+
+def _card_code(card: str) -> str:
+    """Convert a hand-history card such as "Ah" or "10d" to a code like "AH"."""
+    code = card[:-1].replace("10", "T").upper() + card[-1].upper()
+    return Card(code).code
+
+
+def _position(distance: int, players: int) -> str:
+    """
+    Bucket a seat by its distance after the button.
+
+    The button and, from four players up, the cutoff are late; the blinds
+    are early; the seats in between are split into early and middle halves.
+    """
+    if distance == 0 or (players >= 4 and distance == players - 1):
+        return "late"
+    if distance <= 2:
+        return "early"
+    between = players - 4
+    return "early" if distance - 3 < (between + 1) // 2 else "middle"
+
+
+def parse_hand(lines: list[str]) -> Optional[dict[str, Any]]:
+    """
+    Map one hand's text to Hand fields.
+
+    Returns a dictionary with hole_cards, board_cards, player_position,
+    action_taken, result and created_at, or None if the hand cannot be
+    mapped (the hero was not dealt two cards, or the table layout is
+    missing or malformed).
+    """
+    header = _TIMESTAMP.search(lines[0])
+    button = _BUTTON.search(lines[1]) if len(lines) > 1 else None
+    if header is None or button is None:
+        return None
+
+    seats: dict[str, int] = {}
+    hero = None
+    hole_cards: list[str] = []
+    board_cards: list[str] = []
+    action = None
+    street = None
+    collected: dict[str, set[str]] = {}
+
+    for line in lines[2:]:
+        if line.startswith("*** "):
+            street = line.split(" ***")[0][4:]
+            continue
+        if street is None:
+            seat = _SEAT.match(line)
+            if seat and "sitting out" not in seat.group(3):
+                seats[seat.group(2)] = int(seat.group(1))
+        elif street == "HOLE CARDS" and hero is None:
+            dealt = _DEALT.match(line)
+            if dealt:
+                hero = dealt.group(1)
+                hole_cards = dealt.group(2).split()
+        elif street == "SUMMARY":
+            board = _BOARD.match(line)
+            if board:
+                board_cards = board.group(1).split()
+            continue
+
+        if hero is not None and street == "HOLE CARDS" and action is None:
+            if line.startswith(hero + ": "):
+                verb = line[len(hero) + 2 :].split(" ", 1)[0]
+                action = _ACTIONS.get(verb)
+
+        pot = _COLLECTED.match(line)
+        if pot:
+            collected.setdefault(pot.group(2), set()).add(pot.group(1))
+
+    if hero not in seats or len(hole_cards) != 2:
+        return None
+    try:
+        hole_cards = [_card_code(card) for card in hole_cards]
+        board_cards = [_card_code(card) for card in board_cards]
+    except (ValueError, IndexError):
+        return None
+
+    order = sorted(seats.values())
+    button_seat = int(button.group(1))
+    first = max(
+        (i for i, seat in enumerate(order) if seat <= button_seat),
+        default=len(order) - 1,
+    )
+    distance = (order.index(seats[hero]) - first) % len(order)
+
+    won = [winners for winners in collected.values() if hero in winners]
+    if not won:
+        result = "loss"
+    elif any(len(winners) > 1 for winners in won):
+        result = "tie"
+    else:
+        result = "win"
+
+    return {
+        "hole_cards": hole_cards,
+        "board_cards": board_cards,
+        "player_position": _position(distance, len(order)),
+        "action_taken": action,
+        "result": result,
+        "created_at": datetime(*map(int, header.groups())),
+    }
+
+
+class HandHistoryParser:
+    """
+    Incremental parser for text hand-history exports (PokerStars format).
+
+    Lines are fed one at a time and each hand is mapped as soon as the next
+    one starts, so only the current hand is ever held in memory. Hands that
+    cannot be mapped are counted in `skipped`.
+    """
+
+    def __init__(self) -> None:
+        self.parsed = 0
+        self.skipped = 0
+        self._lines: list[str] = []
+
+    def feed(self, line: str) -> Optional[dict[str, Any]]:
+        """Consume one line; return the previous hand if this line ends it."""
+        line = line.rstrip("\r\n")
+        if _HEADER.match(line):
+            hand = self._finish()
+            self._lines = [line.lstrip("\ufeff")]
+            return hand
+        if self._lines and line.strip():
+            if len(self._lines) >= MAX_HAND_LINES:
+                self._lines = []
+                self.skipped += 1
+            else:
+                self._lines.append(line)
+        return None
+
+    def close(self) -> Optional[dict[str, Any]]:
+        """Return the last hand once the input is exhausted."""
+        return self._finish()
+
+    def _finish(self) -> Optional[dict[str, Any]]:
+        if not self._lines:
+            return None
+        hand = parse_hand(self._lines)
+        self._lines = []
+        if hand is None:
+            self.skipped += 1
+        else:
+            self.parsed += 1
+        return hand
+
+
+def parse_hand_history(
+    lines: Iterable[str], parser: Optional[HandHistoryParser] = None
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily yield the hands of a hand-history export, one per mapped hand.
+
+    Pass a `parser` to read its parsed and skipped counts afterwards.
+    """
+    parser = parser or HandHistoryParser()
+    for line in lines:
+        hand = parser.feed(line)
+        if hand is not None:
+            yield hand
+    hand = parser.close()
+    if hand is not None:
+        yield hand
+
+
+async def parse_hand_history_async(
+    lines: AsyncIterable[str], parser: Optional[HandHistoryParser] = None
+) -> AsyncIterator[dict[str, Any]]:
+    """Async variant of parse_hand_history for streamed input."""
+    parser = parser or HandHistoryParser()
+    async for line in lines:
+        hand = parser.feed(line)
+        if hand is not None:
+            yield hand
+    hand = parser.close()
+    if hand is not None:
+        yield hand
@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict
+from itertools import permutations
+from typing import Any, Hashable, Optional
+
+from ..config import settings
+from ..models.card import Card, RANK_ORDER, SUITS
+
+
+_SUIT_PERMUTATIONS = [dict(zip(SUITS, p)) for p in permutations(SUITS)]
+
+
+def canonical_key(
+    hole_cards: list[Card], board_cards: list[Card], num_opponents: int
+) -> tuple:
+    """
+    Map an odds query to a key shared by every suit-isomorphic query.
+
+    Suits are interchangeable, so AhKh on 2h7d9s and AsKs on 2s7c9d have the
+    same odds. The key is the smallest relabelling of the sorted hole and
+    board cards over all 24 suit permutations, so card order is ignored too.
+    """
+    hole = [(RANK_ORDER.index(c.rank), c.suit) for c in hole_cards]
+    board = [(RANK_ORDER.index(c.rank), c.suit) for c in board_cards]
+    best = None
+    for mapping in _SUIT_PERMUTATIONS:
+        candidate = (
+            tuple(sorted((r, mapping[s]) for r, s in hole)),
+            tuple(sorted((r, mapping[s]) for r, s in board)),
+        )
+        if best is None or candidate < best:
+            best = candidate
+    return best + (num_opponents,)
+
+
+class OddsCache:
+    """
+    Bounded LRU cache of odds results with a time-to-live.
+
+    Safe to share between threads; entries older than `ttl` seconds count
+    as misses and are evicted when looked up.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store `value`, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Summarize cache usage.
+
+        Returns a dictionary with:
+            - size (int): Number of cached entries.
+            - maxsize (int): Maximum number of entries.
+            - hits (int): Lookups answered from the cache.
+            - misses (int): Lookups that had to be computed.
+            - hit_rate (float): Fraction of lookups that were hits.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+odds_cache = OddsCache(maxsize=settings.ODDS_CACHE_SIZE, ttl=settings.ODDS_CACHE_TTL)
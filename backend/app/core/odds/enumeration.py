@@ -0,0 +1,103 @@
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from ..models.card import Card
+from .vectorized import DECK_SIZE, card_index, evaluate_strengths
+
+
+# Largest number of outcomes calculate_odds enumerates exactly by default
+EXACT_THRESHOLD = 100_000
+
+
+def check_cards(hole_cards: list[Card], board_cards: list[Card]) -> None:
+    """Raise ValueError unless there are two hole cards and no card repeats."""
+    if len(hole_cards) != 2:
+        raise ValueError("Exactly 2 hole cards are required")
+    cards = hole_cards + board_cards
+    if len(set(cards)) != len(cards):
+        raise ValueError("Hole and board cards must all be different")
+
+
+def check_deal(num_known: int, num_board: int, num_opponents: int) -> None:
+    """
+    Raise ValueError unless the unknown cards can be dealt from the deck.
+
+    The missing board cards and two hole cards per opponent must fit in
+    the cards that are not already known.
+    """
+    if num_opponents < 1:
+        raise ValueError("At least 1 opponent is required")
+    if num_board > 5:
+        raise ValueError("The board has at most 5 cards")
+    needed = 5 - num_board + 2 * num_opponents
+    if needed > DECK_SIZE - num_known:
+        raise ValueError(
+            f"Dealing {num_opponents} opponents needs {needed} cards, "
+            f"only {DECK_SIZE - num_known} are left"
+        )
+
+
+def count_outcomes(num_known: int, num_board: int, num_opponents: int) -> int:
+    """
+    Count the equally likely deals of the unknown cards.
+
+    Covers every runout of the missing board cards combined with every
+    ordered assignment of two hole cards to each opponent. Raises
+    ValueError if the deal does not fit in the deck.
+    """
+    check_deal(num_known, num_board, num_opponents)
+    remaining = DECK_SIZE - num_known
+    missing_board = 5 - num_board
+    total = comb(remaining, missing_board)
+    remaining -= missing_board
+    for _ in range(num_opponents):
+        total *= comb(remaining, 2)
+        remaining -= 2
+    return total
+
+
+def enumerate_outcomes(
+    hole_cards: list[Card],
+    board_cards: list[Card],
+    num_opponents: int,
+) -> tuple[int, int, int]:
+    """
+    Evaluate every possible deal of the unknown cards.
+
+    Returns a tuple with:
+        - wins (int): Number of deals the player won.
+        - ties (int): Number of deals the player tied.
+        - total (int): Number of deals evaluated.
+    """
+    hole = np.asarray([card_index(c) for c in hole_cards], dtype=np.intp)
+    board = np.asarray([card_index(c) for c in board_cards], dtype=np.intp)
+    deck = np.setdiff1d(np.arange(DECK_SIZE), np.concatenate([hole, board]))
+    missing_board = 5 - len(board)
+
+    # Each row is one deal: the missing board cards, then two per opponent
+    deals = np.asarray(list(combinations(deck, missing_board)), dtype=np.intp)
+    pairs = np.asarray(list(combinations(deck, 2)), dtype=np.intp)
+    for _ in range(num_opponents):
+        conflict = (deals[:, None, :, None] == pairs[None, :, None, :]).any(axis=(2, 3))
+        rows, cols = np.nonzero(~conflict)
+        deals = np.concatenate([deals[rows], pairs[cols]], axis=1)
+
+    full_board = np.concatenate(
+        [np.broadcast_to(board, (len(deals), len(board))), deals[:, :missing_board]],
+        axis=1,
+    )
+    player_score = evaluate_strengths(
+        np.concatenate([np.broadcast_to(hole, (len(deals), 2)), full_board], axis=1)
+    )
+
+    opponents = deals[:, missing_board:].reshape(len(deals), num_opponents, 2)
+    boards = np.broadcast_to(full_board[:, None, :], (len(deals), num_opponents, 5))
+    max_opponent = evaluate_strengths(np.concatenate([opponents, boards], axis=2)).max(
+        axis=1
+    )
+
+    wins = int(np.count_nonzero(player_score > max_opponent))
+    ties = int(np.count_nonzero(player_score == max_opponent))
+    return wins, ties, len(deals)
@@ -1,34 +1,92 @@
+import asyncio
 import concurrent.futures
+import math
+import time
+from statistics import NormalDist
+from typing import Optional
 
+import numpy as np
+
+from .enumeration import (
+    EXACT_THRESHOLD,
+    check_cards,
+    check_deal,
+    count_outcomes,
+    enumerate_outcomes,
+)
+from .pool import odds_pool
+from .preflop import preflop_table
 from .simulation import simulate_chunk
+from .vectorized import simulate_batch
 from ..models.card import Card
 
 
+ENGINES = ("process", "vectorized")
+
+# Trials per streamed batch in adaptive mode, sized to a fraction of a second
+ADAPTIVE_BATCH_SIZES = {"process": 2_000, "vectorized": 50_000}
+
+
 def calculate_odds(
     hole_cards: list[Card],
     board_cards: list[Card],
     num_opponents: int,
     simulations: int = 10_000,
     workers: int = 4,
-) -> dict[str, float]:
+    engine: str = "process",
+    exact_threshold: int = EXACT_THRESHOLD,
+    seed: Optional[int] = None,
+) -> dict[str, float | str]:
     """
-    Calculate poker winning odds using Monte Carlo simulation with concurrency.
+    Calculate poker winning odds.
+
+    Preflop odds come from the precomputed preflop table when it is loaded.
+    When the unknown cards can be dealt in at most `exact_threshold` ways,
+    every outcome is enumerated exactly. Otherwise odds are estimated by
+    Monte Carlo simulation: the "process" engine splits trials across worker
+    processes, using the shared odds pool when it is running; the
+    "vectorized" engine runs every trial in-process with NumPy batches.
+
+    Each worker's chunk gets an independent random stream spawned from
+    `seed`, so a fixed seed makes the estimate reproducible. Raises
+    ValueError unless there are exactly two hole cards, no card repeats, and
+    the opponents' cards and the board fit in the deck.
 
     Returns a dictionary with:
         - win (float): Probability of winning.
         - tie (float): Probability of tying.
         - loss (float): Probability of losing.
+        - mode (str): "preflop_table", "exact" or "monte_carlo".
     """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown odds engine: {engine}")
+    _check_deal(hole_cards, board_cards, num_opponents)
+
+    if not board_cards:
+        odds = preflop_table.lookup(hole_cards, num_opponents)
+        if odds is not None:
+            return odds
+
+    if _is_exact(hole_cards, board_cards, num_opponents, exact_threshold):
+        wins, ties, total = enumerate_outcomes(hole_cards, board_cards, num_opponents)
+        return _to_probabilities(wins, ties, total, mode="exact")
+
+    if engine == "vectorized":
+        wins, ties = simulate_batch(
+            hole_cards, board_cards, num_opponents, simulations, seed
+        )
+        return _to_probabilities(wins, ties, simulations)
+
     chunk_size = simulations // workers
-    futures = []
+    chunks = _seeded_chunks(
+        hole_cards, board_cards, num_opponents, chunk_size, workers, seed
+    )
 
-    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
-        for _ in range(workers):
-            futures.append(
-                executor.submit(
-                    simulate_chunk, hole_cards, board_cards, num_opponents, chunk_size
-                )
-            )
+    if odds_pool.running:
+        futures = odds_pool.submit_many(simulate_chunk, chunks)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(simulate_chunk, *args) for args in chunks]
 
     wins, ties = 0, 0
     for f in concurrent.futures.as_completed(futures):
@@ -36,7 +94,340 @@ def calculate_odds(
         wins += w
         ties += t
 
-    total = chunk_size * workers
-    losses = total - wins - ties
+    return _to_probabilities(wins, ties, chunk_size * workers)
+
+
+async def calculate_odds_async(
+    hole_cards: list[Card],
+    board_cards: list[Card],
+    num_opponents: int,
+    simulations: int = 10_000,
+    workers: int = 4,
+    engine: str = "process",
+    exact_threshold: int = EXACT_THRESHOLD,
+    seed: Optional[int] = None,
+) -> dict[str, float | str]:
+    """
+    Awaitable version of calculate_odds that never blocks the event loop.
+
+    Enumeration and simulation chunks run on the shared odds pool and are
+    awaited as asyncio futures. Without a running pool the synchronous
+    calculation is moved to a thread instead.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown odds engine: {engine}")
+    _check_deal(hole_cards, board_cards, num_opponents)
+
+    if not board_cards:
+        odds = preflop_table.lookup(hole_cards, num_opponents)
+        if odds is not None:
+            return odds
+
+    if not odds_pool.running:
+        return await asyncio.to_thread(
+            calculate_odds,
+            hole_cards,
+            board_cards,
+            num_opponents,
+            simulations,
+            workers,
+            engine,
+            exact_threshold,
+            seed,
+        )
+
+    if _is_exact(hole_cards, board_cards, num_opponents, exact_threshold):
+        futures = await asyncio.to_thread(
+            odds_pool.submit_many,
+            enumerate_outcomes,
+            [(hole_cards, board_cards, num_opponents)],
+        )
+        wins, ties, total = await asyncio.wrap_future(futures[0])
+        return _to_probabilities(wins, ties, total, mode="exact")
+
+    chunk_size = simulations // workers
+    chunks = _seeded_chunks(
+        hole_cards, board_cards, num_opponents, chunk_size, workers, seed
+    )
+    simulate = simulate_batch if engine == "vectorized" else simulate_chunk
+
+    # Waiting for a pool slot blocks, so do it off the event loop
+    futures = await asyncio.to_thread(odds_pool.submit_many, simulate, chunks)
+    results = await asyncio.gather(*(asyncio.wrap_future(f) for f in futures))
+
+    wins = sum(w for w, _ in results)
+    ties = sum(t for _, t in results)
+    return _to_probabilities(wins, ties, chunk_size * workers)
+
+
+class _StreamingEstimate:
+    """Win/tie counts aggregated from simulation batches as they finish."""
+
+    def __init__(self) -> None:
+        self.wins = 0
+        self.ties = 0
+        self.trials = 0
+
+    def add(self, wins: int, ties: int, trials: int) -> None:
+        self.wins += wins
+        self.ties += ties
+        self.trials += trials
+
+    def stderr(self) -> float:
+        """Largest standard error among the win, tie and loss estimates."""
+        if self.trials == 0:
+            return math.inf
+        losses = self.trials - self.wins - self.ties
+        return max(
+            math.sqrt(p * (1 - p) / self.trials)
+            for p in (c / self.trials for c in (self.wins, self.ties, losses))
+        )
+
+    def result(self, confidence: float) -> dict[str, float | str | int | tuple]:
+        odds = _to_probabilities(self.wins, self.ties, self.trials, mode="adaptive")
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        half_width = z * math.sqrt(odds["win"] * (1 - odds["win"]) / self.trials)
+        odds["trials"] = self.trials
+        odds["stderr"] = self.stderr()
+        odds["win_ci"] = (
+            max(0.0, odds["win"] - half_width),
+            min(1.0, odds["win"] + half_width),
+        )
+        return odds
+
+
+def calculate_odds_adaptive(
+    hole_cards: list[Card],
+    board_cards: list[Card],
+    num_opponents: int,
+    target_stderr: float = 0.005,
+    time_budget: float = 2.0,
+    max_simulations: int = 1_000_000,
+    batch_size: Optional[int] = None,
+    workers: int = 4,
+    engine: str = "process",
+    exact_threshold: int = EXACT_THRESHOLD,
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+) -> dict[str, float | str | int | tuple]:
+    """
+    Estimate poker winning odds until a precision target or time budget is met.
+
+    Batches of trials run on `workers` processes and are aggregated as they
+    finish. Simulation stops once the largest standard error of the win, tie
+    and loss estimates is at most `target_stderr`, `time_budget` seconds have
+    passed, or `max_simulations` trials have been run. Every batch draws
+    from its own random stream spawned from `seed`.
+
+    Returns a dictionary with:
+        - win (float): Probability of winning.
+        - tie (float): Probability of tying.
+        - loss (float): Probability of losing.
+        - mode (str): "adaptive", or "exact" if outcomes were enumerated.
+        - trials (int): Number of simulated trials.
+        - stderr (float): Largest standard error of the three estimates.
+        - win_ci (tuple[float, float]): Confidence interval for the win rate.
+    """
+    _check_adaptive_args(engine, target_stderr)
+    _check_deal(hole_cards, board_cards, num_opponents)
+    if _is_exact(hole_cards, board_cards, num_opponents, exact_threshold):
+        return calculate_odds(
+            hole_cards, board_cards, num_opponents, exact_threshold=exact_threshold
+        )
+
+    simulate = simulate_batch if engine == "vectorized" else simulate_chunk
+    batch_size = batch_size or ADAPTIVE_BATCH_SIZES[engine]
+    deadline = time.monotonic() + time_budget
+    estimate = _StreamingEstimate()
+    seeds = np.random.SeedSequence(seed)
+
+    executor = None
+    if odds_pool.running:
+        odds_pool.acquire_slot()
+        submit = odds_pool.submit
+    else:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        submit = executor.submit
+
+    pending = {}
+    submitted = 0
+    try:
+        while True:
+            while len(pending) < workers and submitted < max_simulations:
+                trials = min(batch_size, max_simulations - submitted)
+                future = submit(
+                    simulate,
+                    hole_cards,
+                    board_cards,
+                    num_opponents,
+                    trials,
+                    seeds.spawn(1)[0],
+                )
+                pending[future] = trials
+                submitted += trials
+            if not pending:
+                break
+
+            # Always wait for at least one batch, however long it takes
+            timeout = max(0.0, deadline - time.monotonic()) if estimate.trials else None
+            done, _ = concurrent.futures.wait(
+                pending, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                wins, ties = future.result()
+                estimate.add(wins, ties, pending.pop(future))
+
+            if estimate.stderr() <= target_stderr or time.monotonic() >= deadline:
+                break
+    finally:
+        for future in pending:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            odds_pool.release_slot()
+
+    return estimate.result(confidence)
+
+
+async def calculate_odds_adaptive_async(
+    hole_cards: list[Card],
+    board_cards: list[Card],
+    num_opponents: int,
+    target_stderr: float = 0.005,
+    time_budget: float = 2.0,
+    max_simulations: int = 1_000_000,
+    batch_size: Optional[int] = None,
+    workers: int = 4,
+    engine: str = "process",
+    exact_threshold: int = EXACT_THRESHOLD,
+    confidence: float = 0.95,
+    seed: Optional[int] = None,
+) -> dict[str, float | str | int | tuple]:
+    """
+    Awaitable version of calculate_odds_adaptive that never blocks the event loop.
+
+    Batches stream through the shared odds pool while the request holds one
+    pool slot. Without a running pool the synchronous calculation is moved
+    to a thread instead.
+    """
+    _check_adaptive_args(engine, target_stderr)
+    _check_deal(hole_cards, board_cards, num_opponents)
+    if not odds_pool.running or _is_exact(
+        hole_cards, board_cards, num_opponents, exact_threshold
+    ):
+        return await asyncio.to_thread(
+            calculate_odds_adaptive,
+            hole_cards,
+            board_cards,
+            num_opponents,
+            target_stderr,
+            time_budget,
+            max_simulations,
+            batch_size,
+            workers,
+            engine,
+            exact_threshold,
+            confidence,
+            seed,
+        )
+
+    simulate = simulate_batch if engine == "vectorized" else simulate_chunk
+    batch_size = batch_size or ADAPTIVE_BATCH_SIZES[engine]
+    deadline = time.monotonic() + time_budget
+    estimate = _StreamingEstimate()
+    seeds = np.random.SeedSequence(seed)
 
-    return {"win": wins / total, "tie": ties / total, "loss": losses / total}
+    await odds_pool.acquire_slot_async()
+    pending = {}
+    submitted = 0
+    try:
+        while True:
+            while len(pending) < workers and submitted < max_simulations:
+                trials = min(batch_size, max_simulations - submitted)
+                future = asyncio.wrap_future(
+                    odds_pool.submit(
+                        simulate,
+                        hole_cards,
+                        board_cards,
+                        num_opponents,
+                        trials,
+                        seeds.spawn(1)[0],
+                    )
+                )
+                pending[future] = trials
+                submitted += trials
+            if not pending:
+                break
+
+            timeout = max(0.0, deadline - time.monotonic()) if estimate.trials else None
+            done, _ = await asyncio.wait(
+                pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for future in done:
+                wins, ties = future.result()
+                estimate.add(wins, ties, pending.pop(future))
+
+            if estimate.stderr() <= target_stderr or time.monotonic() >= deadline:
+                break
+    finally:
+        for future in pending:
+            future.cancel()
+        odds_pool.release_slot()
+
+    return estimate.result(confidence)
+
+
+def _seeded_chunks(
+    hole_cards: list[Card],
+    board_cards: list[Card],
+    num_opponents: int,
+    chunk_size: int,
+    workers: int,
+    seed: Optional[int],
+) -> list[tuple]:
+    """Build one simulation chunk per worker, each with an independent seed."""
+    return [
+        (hole_cards, board_cards, num_opponents, chunk_size, child)
+        for child in np.random.SeedSequence(seed).spawn(workers)
+    ]
+
+
+def _check_adaptive_args(engine: str, target_stderr: float) -> None:
+    """Validate arguments shared by both adaptive entry points."""
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown odds engine: {engine}")
+    if target_stderr <= 0:
+        raise ValueError("target_stderr must be positive")
+
+
+def _check_deal(
+    hole_cards: list[Card], board_cards: list[Card], num_opponents: int
+) -> None:
+    """Raise ValueError if the cards are invalid or cannot be dealt."""
+    check_cards(hole_cards, board_cards)
+    check_deal(len(hole_cards) + len(board_cards), len(board_cards), num_opponents)
+
+
+def _is_exact(
+    hole_cards: list[Card],
+    board_cards: list[Card],
+    num_opponents: int,
+    exact_threshold: int,
+) -> bool:
+    """Return whether the remaining outcomes are few enough to enumerate."""
+    num_known = len(hole_cards) + len(board_cards)
+    return count_outcomes(num_known, len(board_cards), num_opponents) <= exact_threshold
+
+
+def _to_probabilities(
+    wins: int, ties: int, total: int, mode: str = "monte_carlo"
+) -> dict[str, float | str]:
+    """Convert win/tie counts over `total` outcomes into probabilities."""
+    losses = total - wins - ties
+    return {
+        "win": wins / total,
+        "tie": ties / total,
+        "loss": losses / total,
+        "mode": mode,
+    }
@@ -0,0 +1,138 @@
+import asyncio
+import concurrent.futures
+import multiprocessing
+import threading
+from typing import Any, Callable, Optional
+
+from .vectorized import _tables
+
+
+class PoolSaturatedError(RuntimeError):
+    """Raised when the odds worker pool has no free request slots."""
+
+
+def _warm_up() -> None:
+    """Build lookup tables once per worker so requests never pay for it."""
+    _tables()
+
+
+class OddsWorkerPool:
+    """
+    Long-lived process pool shared by all odds requests.
+
+    Each request holds one slot while its chunks run; at most `max_pending`
+    requests are queued or running, and further requests wait up to
+    `queue_timeout` seconds for a slot before being rejected.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._slots: Optional[threading.BoundedSemaphore] = None
+        self.workers = 0
+        self.max_pending = 0
+        self.queue_timeout = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def start(self, workers: int, max_pending: int, queue_timeout: float) -> None:
+        """Spawn the worker processes and wait until they are warmed up."""
+        if self.running:
+            return
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        # Spawn rather than fork: the server process already runs threads
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_up,
+        )
+        concurrent.futures.wait([self._executor.submit(int) for _ in range(workers)])
+
+    def shutdown(self) -> None:
+        """Stop accepting work and terminate the worker processes."""
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        self._slots = None
+
+    def acquire_slot(self) -> None:
+        """
+        Reserve a request slot, waiting up to the queue timeout.
+
+        Raises PoolSaturatedError if no slot frees up in time.
+        """
+        if self._executor is None:
+            raise RuntimeError("Odds worker pool is not running")
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise PoolSaturatedError("Odds worker pool is saturated")
+
+    async def acquire_slot_async(self) -> None:
+        """
+        Awaitable acquire_slot that waits off the event loop.
+
+        If the caller is cancelled while waiting, a slot acquired afterwards
+        is given back instead of leaking.
+        """
+        future = asyncio.get_running_loop().run_in_executor(None, self.acquire_slot)
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            future.add_done_callback(self._release_abandoned_slot)
+            raise
+
+    def _release_abandoned_slot(self, future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self.release_slot()
+
+    def release_slot(self) -> None:
+        """Give back a slot reserved with acquire_slot."""
+        if self._slots is not None:
+            self._slots.release()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+        """Run `fn(*args)` on a worker for a request that already holds a slot."""
+        if self._executor is None:
+            raise RuntimeError("Odds worker pool is not running")
+        return self._executor.submit(fn, *args)
+
+    def submit_many(
+        self, fn: Callable[..., Any], arg_sets: list[tuple]
+    ) -> list[concurrent.futures.Future]:
+        """
+        Submit one request's chunks, each as `fn(*args)`.
+
+        The request's slot is released once every chunk has finished.
+        Raises PoolSaturatedError if no request slot frees up within the
+        queue timeout.
+        """
+        self.acquire_slot()
+        try:
+            futures = [self.submit(fn, *args) for args in arg_sets]
+        except BaseException:
+            self.release_slot()
+            raise
+        if not futures:
+            self.release_slot()
+            return futures
+
+        remaining = len(futures)
+        lock = threading.Lock()
+
+        def _release(_: concurrent.futures.Future) -> None:
+            nonlocal remaining
+            with lock:
+                remaining -= 1
+                if remaining == 0:
+                    self.release_slot()
+
+        for future in futures:
+            future.add_done_callback(_release)
+        return futures
+
+
+odds_pool = OddsWorkerPool()
@@ -0,0 +1,134 @@
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from ..models.card import Card, RANK_ORDER
+from .vectorized import simulate_batch
+
+
+# Bump whenever the table layout or the simulation behind it changes
+PREFLOP_TABLE_VERSION = 1
+PREFLOP_TABLE_PATH = (
+    Path(__file__).parent / "data" / f"preflop_v{PREFLOP_TABLE_VERSION}.npy"
+)
+
+NUM_CLASSES = 169
+MAX_OPPONENTS = 9
+
+
+def hand_class_index(hole_cards: list[Card]) -> int:
+    """
+    Return the 0-168 starting-hand class of two hole cards.
+
+    Classes form a 13x13 grid of rank indices: pairs on the diagonal, suited
+    hands as (high, low) and offsuit hands as (low, high).
+    """
+    high, low = sorted((c.rank_value() for c in hole_cards), reverse=True)
+    if hole_cards[0].suit == hole_cards[1].suit:
+        return high * 13 + low
+    return low * 13 + high
+
+
+def hand_class_label(index: int) -> str:
+    """Return the conventional name of a hand class (e.g., "AKs", "T9o", "77")."""
+    row, col = divmod(index, 13)
+    if row == col:
+        return RANK_ORDER[row] * 2
+    suffix = "s" if row > col else "o"
+    return RANK_ORDER[max(row, col)] + RANK_ORDER[min(row, col)] + suffix
+
+
+def class_representative(index: int) -> list[Card]:
+    """Return one pair of hole cards belonging to a hand class."""
+    row, col = divmod(index, 13)
+    if row > col:
+        return [Card(RANK_ORDER[row] + "S"), Card(RANK_ORDER[col] + "S")]
+    return [Card(RANK_ORDER[col] + "S"), Card(RANK_ORDER[row] + "H")]
+
+
+def build_table(
+    simulations: int, seed: int = 0, classes: Optional[list[int]] = None
+) -> np.ndarray:
+    """
+    Simulate preflop equity for every hand class against 1-9 opponents.
+
+    Each entry gets its own generator seeded from (seed, class, opponents) so
+    rebuilding any part of the table reproduces the same numbers.
+
+    Returns a float64 array of shape (169, 9, 3) holding win, tie and loss
+    probabilities; entry [c, n - 1] is class c against n opponents.
+    """
+    table = np.zeros((NUM_CLASSES, MAX_OPPONENTS, 3), dtype=np.float64)
+    for index in classes if classes is not None else range(NUM_CLASSES):
+        table[index] = build_class(index, simulations, seed)
+    return table
+
+
+def build_class(index: int, simulations: int, seed: int = 0) -> np.ndarray:
+    """Simulate one hand class against 1-9 opponents; see build_table."""
+    hole_cards = class_representative(index)
+    rows = np.zeros((MAX_OPPONENTS, 3), dtype=np.float64)
+    for opponents in range(1, MAX_OPPONENTS + 1):
+        wins, ties = simulate_batch(
+            hole_cards, [], opponents, simulations, seed=[seed, index, opponents]
+        )
+        losses = simulations - wins - ties
+        rows[opponents - 1] = (wins, ties, losses)
+    return rows / simulations
+
+
+class PreflopTable:
+    """
+    Precomputed preflop equity, memory-mapped from disk.
+
+    The table is optional: until `load` succeeds every lookup misses and odds
+    are simulated as usual.
+    """
+
+    def __init__(self) -> None:
+        self._table: Optional[np.ndarray] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._table is not None
+
+    def load(self, path: Path = PREFLOP_TABLE_PATH) -> bool:
+        """
+        Memory-map the table at `path`.
+
+        Returns False, leaving the table unloaded, if the file does not exist.
+        Raises ValueError if the file does not have the expected shape.
+        """
+        if not Path(path).exists():
+            return False
+        table = np.load(path, mmap_mode="r")
+        if table.shape != (NUM_CLASSES, MAX_OPPONENTS, 3):
+            raise ValueError(f"Unexpected preflop table shape: {table.shape}")
+        self._table = table
+        return True
+
+    def unload(self) -> None:
+        self._table = None
+
+    def lookup(
+        self, hole_cards: list[Card], num_opponents: int
+    ) -> Optional[dict[str, float | str]]:
+        """
+        Return preflop odds for the hole cards, or None if the table cannot
+        answer (not loaded, opponents outside 1-9, or not two distinct cards).
+        """
+        if self._table is None or not 1 <= num_opponents <= MAX_OPPONENTS:
+            return None
+        if len(hole_cards) != 2 or hole_cards[0] == hole_cards[1]:
+            return None
+        win, tie, loss = self._table[hand_class_index(hole_cards), num_opponents - 1]
+        return {
+            "win": float(win),
+            "tie": float(tie),
+            "loss": float(loss),
+            "mode": "preflop_table",
+        }
+
+
+preflop_table = PreflopTable()
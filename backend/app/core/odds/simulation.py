@@ -1,7 +1,12 @@
-import random
+import numpy as np
 
-from ..models.card import Card, RANK_ORDER, SUITS
-from ..evaluator.evaluator import evaluate_hand
+from ..models.card import Card
+from ..evaluator.lookup import CARD_INTS, evaluate_best
+from .vectorized import DECK_SIZE, MAX_BATCH_KEYS, SeedLike, _deal, card_index
+
+
+# Encoded card for each 0-51 deck index
+_DECK_INTS = np.asarray(list(CARD_INTS.values()), dtype=np.int64)
 
 
 def simulate_chunk(
@@ -9,53 +14,54 @@ def simulate_chunk(
     board_cards: list[Card],
     num_opponents: int,
     simulations: int,
+    seed: SeedLike = None,
 ) -> tuple[int, int]:
     """
     Run a Monte Carlo simulation chunk to estimate poker winning odds.
 
+    Cards are dealt from a NumPy generator seeded with `seed`, so the same
+    seed always reproduces the same chunk.
+
     Returns a tuple with:
         - wins (int): Number of simulations the player won.
         - ties (int): Number of simulations the player tied.
     """
-    # Build known and remaining deck
-    known = set(hole_cards + board_cards)
-    deck = [
-        Card(rank + suit)
-        for rank in RANK_ORDER
-        for suit in SUITS
-        if Card(rank + suit) not in known
-    ]
+    rng = np.random.default_rng(seed)
+
+    # Build known cards as encoded ints and the remaining deck as indices
+    hole = [CARD_INTS[c.code] for c in hole_cards]
+    board = [CARD_INTS[c.code] for c in board_cards]
+    known = [card_index(c) for c in hole_cards + board_cards]
+    deck = np.setdiff1d(np.arange(DECK_SIZE), known)
+
+    missing_board = 5 - len(board)
+    num_dealt = missing_board + 2 * num_opponents
+    batch_size = max(1, MAX_BATCH_KEYS // len(deck)) * (len(deck) // num_dealt)
 
     wins, ties = 0, 0
+    remaining = simulations
+    while remaining > 0:
+        trials = min(batch_size, remaining)
+        remaining -= trials
+
+        for dealt in _DECK_INTS[_deal(rng, deck, trials, num_dealt)].tolist():
+            # Fill in missing community cards
+            full_board = board + dealt[:missing_board]
+
+            # Deal opponent hands
+            opponents_hands = [
+                dealt[i : i + 2] for i in range(missing_board, num_dealt, 2)
+            ]
+
+            # Evaluate hands; strengths compare like (rank, kickers)
+            player_score = evaluate_best(hole + full_board)
+            max_opponent = max(
+                evaluate_best(opp + full_board) for opp in opponents_hands
+            )
 
-    for _ in range(simulations):
-        random.shuffle(deck)
-
-        # Fill in missing community cards
-        missing_board = 5 - len(board_cards)
-        full_board = board_cards + deck[:missing_board]
-
-        # Deal opponent hands
-        idx = missing_board
-        opponents_hands = [
-            deck[idx + i * 2 : idx + i * 2 + 2] for i in range(num_opponents)
-        ]
-
-        # Evaluate hands
-        player_score = evaluate_hand(hole_cards + full_board)
-        opponents_scores = [evaluate_hand(opp + full_board) for opp in opponents_hands]
-
-        # Compare by rank then kickers
-        max_opponent = max(opponents_scores, key=lambda s: (s["rank"], s["kickers"]))
-        if (player_score["rank"], player_score["kickers"]) > (
-            max_opponent["rank"],
-            max_opponent["kickers"],
-        ):
-            wins += 1
-        elif (player_score["rank"], player_score["kickers"]) == (
-            max_opponent["rank"],
-            max_opponent["kickers"],
-        ):
-            ties += 1
+            if player_score > max_opponent:
+                wins += 1
+            elif player_score == max_opponent:
+                ties += 1
 
     return wins, ties
@@ -0,0 +1,176 @@
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from ..models.card import Card, RANK_ORDER, SUITS
+from ..evaluator.lookup import (
+    CARD_INTS,
+    HAND_RANKS,
+    POPCOUNT,
+    STRAIGHT_HIGH,
+    TOP_RANKS,
+    evaluate_seven,
+)
+
+
+# Cards are indexed 0-51 as rank * 4 + suit
+DECK_SIZE = 52
+
+# Anything np.random.default_rng accepts: None, an int or sequence of ints,
+# a SeedSequence or a Generator
+SeedLike = Optional[
+    Union[int, Sequence[int], np.random.SeedSequence, np.random.Generator]
+]
+
+# Upper bound on random keys drawn per batch (shuffled decks * deck size)
+MAX_BATCH_KEYS = 4_000_000
+
+# Per-rank keys whose sums are unique for every 7-card rank multiset
+RANK_KEYS = (0, 1, 5, 22, 98, 453, 2031, 8698, 22854, 83661, 262349, 636345, 1479181)
+
+_CARD_RANK_KEY = np.asarray(
+    [RANK_KEYS[i >> 2] for i in range(DECK_SIZE)], dtype=np.int32
+)
+# Each suit owns a 16-bit lane holding a rank bitmask
+_CARD_SUIT_BIT = np.asarray(
+    [1 << (16 * (i & 3) + (i >> 2)) for i in range(DECK_SIZE)], dtype=np.int64
+)
+
+
+def card_index(card: Card) -> int:
+    """Return the 0-51 deck index of a Card."""
+    return RANK_ORDER.index(card.rank) * 4 + SUITS.index(card.suit)
+
+
+@lru_cache(maxsize=None)
+def _tables() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build the 7-card lookup tables on first use.
+
+    Returns a tuple with:
+        - ranks (np.ndarray): Best non-flush strength by summed rank key.
+        - flushes (np.ndarray): Best flush strength by suit rank bitmask, or 0.
+    """
+    ranks = np.zeros(4 * RANK_KEYS[-1] + 3 * RANK_KEYS[-2] + 1, dtype=np.int32)
+    for multiset in combinations_with_replacement(range(13), 7):
+        if any(multiset[i] == multiset[i + 4] for i in range(3)):
+            continue  # five of a kind
+        # Cycle suits so no suit holds more than two cards
+        cards = [
+            CARD_INTS[RANK_ORDER[r] + SUITS[i % 4]] for i, r in enumerate(multiset)
+        ]
+        ranks[sum(RANK_KEYS[r] for r in multiset)] = evaluate_seven(cards)
+
+    flushes = np.zeros(1 << 13, dtype=np.int32)
+    for mask in range(1 << 13):
+        if POPCOUNT[mask] < 5:
+            continue
+        high = STRAIGHT_HIGH[mask]
+        if high == 12:
+            flushes[mask] = HAND_RANKS["Royal Flush"] << 20
+        elif high >= 0:
+            flushes[mask] = HAND_RANKS["Straight Flush"] << 20 | high << 16
+        else:
+            flushes[mask] = HAND_RANKS["Flush"] << 20 | TOP_RANKS[mask]
+
+    return ranks, flushes
+
+
+def _strengths(rank_keys: np.ndarray, suit_bits: np.ndarray) -> np.ndarray:
+    """Look up strengths from summed rank keys and summed suit bits of 7 cards."""
+    ranks, flushes = _tables()
+    best = ranks[rank_keys]
+    for lane in range(4):
+        np.maximum(best, flushes[(suit_bits >> (16 * lane)) & 0x1FFF], out=best)
+    return best
+
+
+def evaluate_strengths(cards: np.ndarray) -> np.ndarray:
+    """
+    Evaluate many 7-card hands at once.
+
+    `cards` is an integer array of deck indices with shape (..., 7). Returns an
+    int32 array of shape (...) holding the same packed strengths as
+    `app.core.evaluator.lookup.evaluate_seven`.
+    """
+    return _strengths(
+        _CARD_RANK_KEY[cards].sum(axis=-1), _CARD_SUIT_BIT[cards].sum(axis=-1)
+    )
+
+
+def _deal(
+    rng: np.random.Generator, deck: np.ndarray, trials: int, num_dealt: int
+) -> np.ndarray:
+    """
+    Deal `num_dealt` cards from `deck` for each of `trials` trials.
+
+    Each row of random keys shuffles the deck once and is split into as many
+    disjoint deals as fit, so every deal is uniformly random.
+    """
+    per_deck = len(deck) // num_dealt
+    decks = -(-trials // per_deck)
+    keys = rng.random((decks, len(deck)), dtype=np.float32)
+    order = keys.argsort(axis=1)[:, : per_deck * num_dealt]
+    return deck[order].reshape(decks * per_deck, num_dealt)[:trials]
+
+
+def simulate_batch(
+    hole_cards: list[Card],
+    board_cards: list[Card],
+    num_opponents: int,
+    simulations: int,
+    seed: SeedLike = None,
+) -> tuple[int, int]:
+    """
+    Run a vectorized Monte Carlo simulation to estimate poker winning odds.
+
+    Trials are dealt as one integer array per batch and every player's hand
+    is evaluated with array operations; the shared board is summed once.
+    Cards are dealt from a NumPy generator seeded with `seed`.
+
+    Returns a tuple with:
+        - wins (int): Number of simulations the player won.
+        - ties (int): Number of simulations the player tied.
+    """
+    rng = np.random.default_rng(seed)
+
+    hole = np.asarray([card_index(c) for c in hole_cards], dtype=np.intp)
+    board = np.asarray([card_index(c) for c in board_cards], dtype=np.intp)
+    deck = np.setdiff1d(np.arange(DECK_SIZE), np.concatenate([hole, board]))
+
+    missing_board = 5 - len(board)
+    num_dealt = missing_board + 2 * num_opponents
+    batch_size = max(1, MAX_BATCH_KEYS // len(deck)) * (len(deck) // num_dealt)
+
+    known_keys = _CARD_RANK_KEY[board].sum()
+    known_bits = _CARD_SUIT_BIT[board].sum()
+    hole_keys = _CARD_RANK_KEY[hole].sum()
+    hole_bits = _CARD_SUIT_BIT[hole].sum()
+
+    wins, ties = 0, 0
+    remaining = simulations
+    while remaining > 0:
+        trials = min(batch_size, remaining)
+        remaining -= trials
+
+        dealt = _deal(rng, deck, trials, num_dealt)
+        runout = dealt[:, :missing_board]
+        board_keys = known_keys + _CARD_RANK_KEY[runout].sum(axis=1)
+        board_bits = known_bits + _CARD_SUIT_BIT[runout].sum(axis=1)
+
+        player_score = _strengths(board_keys + hole_keys, board_bits + hole_bits)
+
+        # Opponent hole cards: (trials, opponents, 2)
+        opponents = dealt[:, missing_board:].reshape(trials, num_opponents, 2)
+        opponent_scores = _strengths(
+            board_keys[:, None] + _CARD_RANK_KEY[opponents].sum(axis=2),
+            board_bits[:, None] + _CARD_SUIT_BIT[opponents].sum(axis=2),
+        )
+        max_opponent = opponent_scores.max(axis=1)
+
+        wins += int(np.count_nonzero(player_score > max_opponent))
+        ties += int(np.count_nonzero(player_score == max_opponent))
+
+    return wins, ties
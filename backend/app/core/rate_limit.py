@@ -0,0 +1,132 @@
+import ipaddress
+from datetime import timedelta
+from typing import Iterable, Union
+
+from fastapi import Request
+from sqlalchemy import case, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from .config import settings
+from ..models.login_throttle import LoginThrottle
+
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+# Expired windows are deleted once every this many hits per process
+_PRUNE_EVERY = 1_000
+
+
+class RateLimiter:
+    """
+    Fixed-window rate limiter allowing `limit` hits per key every `window`
+    seconds.
+
+    Counts live in the login throttle table, so every server process enforces
+    the same limit. Keys are prefixed with `scope` to keep limiters apart.
+    """
+
+    def __init__(self, scope: str, limit: int, window: float) -> None:
+        self.scope = scope
+        self.limit = limit
+        self.window = window
+        self.limited = 0
+        self._hits = 0
+
+    def _hit_statement(self, key: str):
+        """Upsert counting one hit, returning the count and seconds to reset."""
+        window = timedelta(seconds=self.window)
+        stmt = insert(LoginThrottle).values(
+            key=f"{self.scope}:{key}", window_start=func.now(), attempts=1
+        )
+        expired = LoginThrottle.window_start <= func.now() - window
+        return stmt.on_conflict_do_update(
+            index_elements=[LoginThrottle.key],
+            set_={
+                "window_start": case(
+                    (expired, stmt.excluded.window_start),
+                    else_=LoginThrottle.window_start,
+                ),
+                "attempts": case((expired, 1), else_=LoginThrottle.attempts + 1),
+            },
+        ).returning(
+            LoginThrottle.attempts,
+            func.extract("epoch", LoginThrottle.window_start + window - func.now()),
+        )
+
+    async def hit(self, db: AsyncSession, key: str) -> float:
+        """
+        Count one hit for `key` and commit it.
+
+        Returns 0 if the hit is allowed, otherwise the seconds until the
+        key's window resets.
+        """
+        result = await db.execute(self._hit_statement(key))
+        attempts, reset_in = result.one()
+        self._hits += 1
+        if self._hits % _PRUNE_EVERY == 0:
+            await db.execute(
+                delete(LoginThrottle).where(
+                    LoginThrottle.key.startswith(f"{self.scope}:"),
+                    LoginThrottle.window_start
+                    <= func.now() - timedelta(seconds=self.window),
+                )
+            )
+        await db.commit()
+        if attempts <= self.limit:
+            return 0.0
+        self.limited += 1
+        return max(float(reset_in), 0.0)
+
+
+def parse_networks(value: str) -> list[IPNetwork]:
+    """Parse a comma-separated list of addresses and CIDR ranges."""
+    return [
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in value.split(",")
+        if item.strip()
+    ]
+
+
+def _is_trusted(address: str, trusted: Iterable[IPNetwork]) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in trusted)
+
+
+def client_address(request: Request, trusted: Iterable[IPNetwork]) -> str:
+    """
+    Return the address of the client behind any trusted proxies.
+
+    X-Forwarded-For is only honoured when the connection comes from a trusted
+    proxy, and is read from the right so a client cannot spoof its address by
+    sending the header itself.
+    """
+    trusted = list(trusted)
+    address = request.client.host if request.client else "unknown"
+    if not _is_trusted(address, trusted):
+        return address
+    forwarded = request.headers.get("x-forwarded-for", "")
+    for hop in reversed([hop.strip() for hop in forwarded.split(",")]):
+        if not hop:
+            continue
+        address = hop
+        if not _is_trusted(hop, trusted):
+            break
+    return address
+
+
+trusted_proxies = parse_networks(settings.AUTH_TRUSTED_PROXIES)
+
+login_user_rate_limiter = RateLimiter(
+    scope="user",
+    limit=settings.AUTH_LOGIN_ATTEMPTS,
+    window=settings.AUTH_LOGIN_WINDOW,
+)
+login_ip_rate_limiter = RateLimiter(
+    scope="ip",
+    limit=settings.AUTH_LOGIN_IP_ATTEMPTS,
+    window=settings.AUTH_LOGIN_WINDOW,
+)
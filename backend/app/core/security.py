@@ -1,5 +1,9 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from jose import jwt
 from passlib.context import CryptContext
@@ -24,6 +28,135 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class HashingPoolSaturatedError(RuntimeError):
+    """Raised when too many password hashes are already queued."""
+
+
+class PasswordHashingPool:
+    """
+    Small dedicated thread pool for bcrypt work, which would otherwise
+    block the event loop for hundreds of milliseconds per call.
+
+    At most `max_pending` calls are queued or running; further calls are
+    rejected immediately rather than piling up behind a login storm.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.workers = 0
+        self.max_pending = 0
+        self._pending = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def start(self, workers: int, max_pending: int) -> None:
+        if self.running:
+            return
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hashing"
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run `fn(*args)` on the pool and await its result.
+
+        Raises HashingPoolSaturatedError if `max_pending` calls are already
+        queued or running.
+        """
+        if self._executor is None:
+            raise RuntimeError("Password hashing pool is not running")
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HashingPoolSaturatedError("Password hashing pool is saturated")
+            self._pending += 1
+        submitted = time.perf_counter()
+
+        def job() -> Any:
+            wait = time.perf_counter() - submitted
+            with self._lock:
+                self._running += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self.completed += 1
+
+        def done(_: concurrent.futures.Future) -> None:
+            # Also runs for calls cancelled before a worker picked them up
+            with self._lock:
+                self._pending -= 1
+
+        try:
+            future = self._executor.submit(job)
+        except BaseException:
+            done(None)
+            raise
+        future.add_done_callback(done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Summarize pool usage.
+
+        Returns a dictionary with:
+            - workers (int): Hashing threads.
+            - max_pending (int): Calls allowed to be queued or running.
+            - queued (int): Calls waiting for a thread.
+            - running (int): Calls being hashed or verified.
+            - completed (int): Calls finished.
+            - rejected (int): Calls refused because the pool was full.
+            - wait_avg_ms (float): Mean time calls waited for a thread.
+            - wait_max_ms (float): Longest time a call waited for a thread.
+        """
+        with self._lock:
+            started = self.completed + self._running
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "queued": self._pending - self._running,
+                "running": self._running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "wait_avg_ms": self._total_wait / started * 1000 if started else 0.0,
+                "wait_max_ms": self._max_wait * 1000,
+            }
+
+
+password_hashing_pool = PasswordHashingPool()
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password, run on the password hashing pool."""
+    return await password_hashing_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password, run on the password hashing pool."""
+    return await password_hashing_pool.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a new JWT access token."""
     payload = data.copy()
@@ -0,0 +1,52 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from .config import settings
+from ..models.user import User
+
+
+class UserCache:
+    """
+    Short-lived cache of active users, so authenticated requests rarely
+    query the database.
+
+    Inactive users are never cached, and `ttl` bounds how long a user
+    deactivated in the database keeps access. The cache is per-process.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._users: OrderedDict[int, tuple[float, User]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[User]:
+        """Return the cached user, or None if missing or expired."""
+        with self._lock:
+            entry = self._users.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._users[user_id]
+                return None
+            self._users.move_to_end(user_id)
+            return entry[1]
+
+    def set(self, user: User) -> None:
+        """Cache an active user; inactive users are never cached."""
+        if self.maxsize <= 0 or not user.is_active:
+            return
+        with self._lock:
+            self._users[user.id] = (time.monotonic() + self.ttl, user)
+            self._users.move_to_end(user.id)
+            while len(self._users) > self.maxsize:
+                self._users.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+
+user_cache = UserCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import ColumnElement, Select, tuple_
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+# A (timestamp, id) position in a keyset-paginated listing
+Keyset = tuple[datetime, int]
+
+
+def keyset_page_query(
+    stmt: Select,
+    columns: dict[str, ColumnElement],
+    fields: tuple[str, ...],
+    keyset: tuple[ColumnElement, ColumnElement],
+    after: Optional[Keyset],
+    limit: Optional[int],
+    descending: bool = False,
+) -> Select:
+    """
+    Build the query for one page of rows ordered by a (timestamp, id) keyset.
+
+    `stmt` is a select with its FROM and WHERE clauses; only the columns
+    named in `fields` are added to it. Rows start strictly after the `after`
+    position and the keyset columns are selected even when not requested.
+    With a `limit`, one extra row is fetched to tell whether another page
+    follows.
+    """
+    time_column, id_column = keyset
+    selected = [columns[field].label(field) for field in fields]
+    selected += [time_column.label("_keyset_time"), id_column.label("_keyset_id")]
+    stmt = stmt.with_only_columns(*selected)
+    if after is not None:
+        position = tuple_(time_column, id_column)
+        stmt = stmt.where(position < after if descending else position > after)
+    order = [time_column, id_column]
+    if descending:
+        order = [column.desc() for column in order]
+    stmt = stmt.order_by(*order)
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
+
+
+async def fetch_keyset_page(
+    db: AsyncSession,
+    stmt: Select,
+    fields: tuple[str, ...],
+    limit: Optional[int],
+) -> tuple[list[dict[str, Any]], Optional[Keyset]]:
+    """
+    Run a query built by keyset_page_query, returning rows as plain
+    dictionaries without building ORM objects. With no `limit`, every
+    remaining row is returned.
+
+    Returns the page and the keyset of its last row, or None if there are
+    no further rows.
+    """
+    result = await db.execute(stmt)
+    rows = result.mappings().all()
+
+    page = [{field: row[field] for field in fields} for row in rows[:limit]]
+    if limit is None or len(rows) <= limit:
+        return page, None
+    last = rows[limit - 1]
+    return page, (last["_keyset_time"], last["_keyset_id"])
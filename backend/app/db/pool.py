@@ -0,0 +1,128 @@
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class PoolMetrics:
+    """Counters describing how connections are obtained from a pool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.errors = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self.connects = 0
+            self.invalidations = 0
+
+    def record_checkout(self, wait: float, outcome: str) -> None:
+        """Record one checkout attempt; `outcome` is "ok", "timeout" or "error"."""
+        with self._lock:
+            if outcome == "ok":
+                self.checkouts += 1
+            elif outcome == "timeout":
+                self.timeouts += 1
+            else:
+                self.errors += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records checkout wait times and connection
+    churn in `metrics`.
+
+    The wait covers everything up to handing out a connection: queueing
+    for a free one, opening a new one and the pre-ping. Connection churn is
+    only counted once track_pool_events has been called for the engine.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # Keep counting across engine.dispose()
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def connect(self) -> Any:
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            connection = super().connect()
+            outcome = "ok"
+            return connection
+        except exc.TimeoutError:
+            outcome = "timeout"
+            raise
+        finally:
+            self.metrics.record_checkout(time.perf_counter() - start, outcome)
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Summarize the pool's state and checkout history.
+
+        Returns a dictionary with:
+            - pool_size (int): Connections kept open by the pool.
+            - max_overflow (int): Extra connections allowed under load.
+            - checked_out (int): Connections currently in use.
+            - checked_in (int): Idle connections in the pool.
+            - overflow (int): Current overflow connections (negative while
+              the pool has not opened all of `pool_size` yet).
+            - checkouts (int): Connections handed out.
+            - timeouts (int): Checkouts that gave up waiting.
+            - errors (int): Checkouts that failed to connect.
+            - wait_avg_ms (float): Mean time to obtain a connection.
+            - wait_max_ms (float): Longest time to obtain a connection.
+            - connects (int): New database connections opened.
+            - invalidations (int): Connections discarded as broken or stale.
+        """
+        metrics = self.metrics
+        attempts = metrics.checkouts + metrics.timeouts + metrics.errors
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": self.overflow(),
+            "checkouts": metrics.checkouts,
+            "timeouts": metrics.timeouts,
+            "errors": metrics.errors,
+            "wait_avg_ms": metrics.total_wait / attempts * 1000 if attempts else 0.0,
+            "wait_max_ms": metrics.max_wait * 1000,
+            "connects": metrics.connects,
+            "invalidations": metrics.invalidations,
+        }
+
+
+def track_pool_events(engine: AsyncEngine) -> None:
+    """Count new and invalidated connections of an instrumented engine."""
+    sync_engine = engine.sync_engine
+    event.listen(
+        sync_engine, "connect", lambda *_: sync_engine.pool.metrics.record_connect()
+    )
+    event.listen(
+        sync_engine,
+        "invalidate",
+        lambda *_: sync_engine.pool.metrics.record_invalidation(),
+    )
@@ -1,13 +1,43 @@
+from typing import Any
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.db.pool import InstrumentedAsyncQueuePool, track_pool_events
+
+
+def _engine_options(url: str) -> dict[str, Any]:
+    """Pool settings, plus statement cache sizes when the driver is asyncpg."""
+    options: dict[str, Any] = {
+        "poolclass": InstrumentedAsyncQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    if make_url(url).get_driver_name() == "asyncpg":
+        # SQLAlchemy keeps its own prepared statement cache on top of
+        # asyncpg's; both must be 0 behind transaction-pooling pgbouncer
+        options["connect_args"] = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
+    return options
 
 
 # Async engine
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG, future=True)
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DEBUG,
+    future=True,
+    **_engine_options(settings.DATABASE_URL),
+)
+track_pool_events(engine)
 
 # Session factory
 async_session = sessionmaker(
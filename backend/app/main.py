@@ -6,15 +6,33 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.routes import tools, analytics, hand, session, user, auth
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.api.routes import tools, analytics, hand, session, user, auth, metrics
 from app.db.session import create_db_and_tables, get_db_session
 from app.core.config import settings
+from app.core.odds.pool import odds_pool
+from app.core.security import password_hashing_pool
+from app.core.odds.preflop import PREFLOP_TABLE_PATH, preflop_table
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await create_db_and_tables()
-    yield
+    preflop_table.load(settings.ODDS_PREFLOP_TABLE or PREFLOP_TABLE_PATH)
+    odds_pool.start(
+        workers=settings.ODDS_WORKERS,
+        max_pending=settings.ODDS_MAX_PENDING,
+        queue_timeout=settings.ODDS_QUEUE_TIMEOUT,
+    )
+    password_hashing_pool.start(
+        workers=settings.AUTH_HASH_WORKERS,
+        max_pending=settings.AUTH_HASH_MAX_PENDING,
+    )
+    try:
+        yield
+    finally:
+        password_hashing_pool.shutdown()
+        odds_pool.shutdown()
 
 
 app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
@@ -30,6 +48,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
 app.include_router(tools.router)
@@ -38,6 +57,7 @@ app.include_router(hand.router)
 app.include_router(session.router)
 app.include_router(user.router)
 app.include_router(auth.router)
+app.include_router(metrics.router)
 
 
 @app.get("/")
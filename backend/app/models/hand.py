@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import String, ARRAY
+from sqlalchemy import String, ARRAY, Index
 from sqlmodel import SQLModel, Column, Field, Relationship
 
 if TYPE_CHECKING:
@@ -29,8 +29,20 @@ class Result(str, Enum):
 
 
 class Hand(SQLModel, table=True):
+    __table_args__ = (
+        # Covers per-session hand reads and the timeline's (created_at, id)
+        # keyset; with result included the timeline can use index-only scans
+        Index(
+            "ix_hand_session_id_created_at_id",
+            "session_id",
+            "created_at",
+            "id",
+            postgresql_include=["result"],
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    session_id: int = Field(foreign_key="session.id")
+    session_id: int = Field(foreign_key="session.id", ondelete="CASCADE")
 
     hole_cards: list[str] = Field(sa_column=Column(ARRAY(String)), default_factory=list)
     board_cards: list[str] = Field(
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime
+from sqlmodel import SQLModel, Column, Field
+
+
+class LoginThrottle(SQLModel, table=True):
+    """
+    Login attempts counted against one rate-limit key (a username or client
+    address) in its current fixed window.
+
+    Kept in the database so every server process shares the same counts.
+    """
+
+    key: str = Field(primary_key=True)
+    window_start: datetime = Field(
+        sa_column=Column(DateTime(timezone=True), nullable=False)
+    )
+    attempts: int = 0
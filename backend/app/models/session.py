@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlmodel import SQLModel, Field, Relationship
 
 if TYPE_CHECKING:
@@ -9,6 +10,11 @@ if TYPE_CHECKING:
 
 
 class Session(SQLModel, table=True):
+    __table_args__ = (
+        # A user's sessions, newest first
+        Index("ix_session_user_id_start_time", "user_id", "start_time"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="user.id")
     start_time: datetime = Field(default_factory=lambda: datetime.now())
@@ -16,7 +22,8 @@ class Session(SQLModel, table=True):
     notes: Optional[str] = None
 
     user: Optional["User"] = Relationship(back_populates="sessions")
-    hands: list["Hand"] = Relationship(back_populates="session")
+    # Hands are removed by the database's ON DELETE CASCADE, never loaded
+    hands: list["Hand"] = Relationship(back_populates="session", passive_deletes="all")
 
 
 from .hand import Hand
@@ -0,0 +1,29 @@
+from sqlmodel import SQLModel, Field
+
+
+class UserStats(SQLModel, table=True):
+    """
+    Hand counts per user for each (position, action, result) combination.
+
+    Maintained alongside every hand write so analytics never scan hands.
+    A missing action or result is stored as an empty string because the
+    columns are part of the primary key.
+    """
+
+    user_id: int = Field(foreign_key="user.id", primary_key=True)
+    player_position: str = Field(primary_key=True)
+    action_taken: str = Field(default="", primary_key=True)
+    result: str = Field(default="", primary_key=True)
+    hand_count: int = 0
+
+
+class SessionStats(SQLModel, table=True):
+    """Hand counts per session for each (position, action, result) combination."""
+
+    session_id: int = Field(
+        foreign_key="session.id", ondelete="CASCADE", primary_key=True
+    )
+    player_position: str = Field(primary_key=True)
+    action_taken: str = Field(default="", primary_key=True)
+    result: str = Field(default="", primary_key=True)
+    hand_count: int = 0
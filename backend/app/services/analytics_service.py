@@ -1,234 +1,540 @@
-from typing import Any
+import asyncio
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterable, Optional, TypeVar
 from sqlmodel import select, func
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+import numpy as np
+from sqlalchemy import literal_column, tuple_
+
 from app.models.hand import Hand
 from app.models.session import Session
+from app.models.stats import SessionStats
+from app.services.stats_service import StatsService
+
+
+_T = TypeVar("_T")
+
+# A timeline position: the (created_at, id) of the last hand returned, with
+# the hand number and cumulative wins reached at that hand
+TimelineCursor = tuple[datetime, int, int, int]
+
+
+def _user_hands(user_id: int, *columns: Any) -> Any:
+    """Select `columns` over every hand in the user's sessions."""
+    return (
+        select(*columns)
+        .select_from(Hand)
+        .join(Session)
+        .where(Session.user_id == user_id)
+    )
+
+
+# Counter keys tallied for each hand result and action
+_RESULT_KEYS = {"win": "wins", "loss": "losses", "tie": "ties"}
+_ACTION_KEYS = {"raise": "raises", "call": "calls", "check": "checks", "fold": "folds"}
+
+# Calendar periods accepted for timeline bucketing
+_TIMELINE_PERIODS = ("day", "week")
+
+_POSITION_ORDER = {"early": 0, "middle": 1, "late": 2}
+_ACTION_ORDER = {"fold": 0, "check": 1, "call": 2, "raise": 3}
+
+
+def _new_counts() -> dict[str, int]:
+    """Zeroed counters for every tally kept by _tally."""
+    return dict.fromkeys(
+        ("total", "wins", "losses", "ties", "vpip_hands")
+        + tuple(_ACTION_KEYS.values()),
+        0,
+    )
+
+
+def _tally(
+    counts: dict[str, int], action: Optional[str], result: Optional[str], n: int
+) -> None:
+    """Add `n` hands with the given action and result to `counts`."""
+    counts["total"] += n
+    if result in _RESULT_KEYS:
+        counts[_RESULT_KEYS[result]] += n
+    if action in _ACTION_KEYS:
+        counts[_ACTION_KEYS[action]] += n
+    if action is not None and action != "fold":
+        counts["vpip_hands"] += n
+
+
+def summarize_breakdown(
+    breakdown: Iterable[tuple[str, Optional[str], Optional[str], int]],
+) -> dict[str, Any]:
+    """
+    Fold (position, action, result, count) rows into every counter the
+    analytics views need.
+
+    Returns a dictionary with:
+        - overall (dict[str, int]): Counters across all hands.
+        - positions (dict[str, dict[str, int]]): Counters by position.
+        - actions (dict[str, dict[str, int]]): Counters by action taken.
+    """
+    overall = _new_counts()
+    positions: dict[str, dict[str, int]] = {}
+    actions: dict[str, dict[str, int]] = {}
+    for position, action, result, n in breakdown:
+        _tally(overall, action, result, n)
+        _tally(positions.setdefault(position, _new_counts()), action, result, n)
+        if action is not None:
+            _tally(actions.setdefault(action, _new_counts()), action, result, n)
+    return {"overall": overall, "positions": positions, "actions": actions}
+
+
+def overall_from_counts(counts: dict[str, int], total_sessions: int) -> dict[str, Any]:
+    """Build the overall stats view from aggregate counters."""
+    total_hands = counts["total"]
+    if not total_hands:
+        return {
+            "total_hands": 0,
+            "win_rate": 0.0,
+            "total_sessions": 0,
+            "vpip": 0.0,
+            "aggression_factor": 0.0,
+        }
 
+    # VPIP: % of hands where didn't fold
+    vpip = counts["vpip_hands"] / total_hands * 100
+
+    # Aggression Factor: (raises) / (calls + checks)
+    passive = counts["calls"] + counts["checks"]
+    aggression = (counts["raises"] / passive) if passive > 0 else 0.0
+
+    return {
+        "total_hands": total_hands,
+        "win_rate": counts["wins"] / total_hands * 100,
+        "wins": counts["wins"],
+        "losses": counts["losses"],
+        "ties": counts["ties"],
+        "total_sessions": total_sessions,
+        "vpip": round(vpip, 2),
+        "aggression_factor": round(aggression, 2),
+    }
+
+
+def positions_from_counts(groups: dict[str, dict[str, int]]) -> dict[str, Any]:
+    """Build the position stats view from per-position counters."""
+    # Calculate win rates
+    position_data = []
+    for pos, stats in groups.items():
+        win_rate = (stats["wins"] / stats["total"] * 100) if stats["total"] > 0 else 0.0
+        position_data.append(
+            {
+                "position": pos,
+                "total_hands": stats["total"],
+                "wins": stats["wins"],
+                "losses": stats["losses"],
+                "ties": stats["ties"],
+                "win_rate": round(win_rate, 2),
+            }
+        )
 
-class AnalyticsService:
-    """Service for calculating poker analytics and statistics."""
+    # Sort by position order: early, middle, late
+    position_data.sort(key=lambda x: _POSITION_ORDER.get(x["position"], 99))
+
+    return {"positions": position_data}
 
-    @staticmethod
-    async def get_overall_stats(db: AsyncSession, user_id: int) -> dict[str, Any]:
-        """Calculate overall statistics for a user."""
-        # Get all hands for user
-        stmt = select(Hand).join(Session).where(Session.user_id == user_id)
-        result = await db.exec(stmt)
-        hands = result.all()
-
-        if not hands:
-            return {
-                "total_hands": 0,
-                "win_rate": 0.0,
-                "total_sessions": 0,
-                "vpip": 0.0,
-                "aggression_factor": 0.0,
-            }
 
-        total_hands = len(hands)
-        wins = sum(1 for h in hands if h.result == "win")
-        losses = sum(1 for h in hands if h.result == "loss")
-        ties = sum(1 for h in hands if h.result == "tie")
+def actions_from_counts(groups: dict[str, dict[str, int]]) -> dict[str, Any]:
+    """Build the action stats view from per-action counters."""
+    # Calculate win rates and distribution
+    action_data = []
+    total_actions = sum(stats["total"] for stats in groups.values())
 
-        # VPIP: % of hands where didn't fold
-        vpip_hands = sum(
-            1 for h in hands if h.action_taken and h.action_taken != "fold"
+    for action, stats in groups.items():
+        win_rate = (stats["wins"] / stats["total"] * 100) if stats["total"] > 0 else 0.0
+        distribution = (
+            (stats["total"] / total_actions * 100) if total_actions > 0 else 0.0
         )
-        vpip = (vpip_hands / total_hands * 100) if total_hands > 0 else 0.0
 
-        # Aggression Factor: (raises) / (calls + checks)
-        raises = sum(1 for h in hands if h.action_taken == "raise")
-        calls = sum(1 for h in hands if h.action_taken == "call")
-        checks = sum(1 for h in hands if h.action_taken == "check")
-        aggression = (raises / (calls + checks)) if (calls + checks) > 0 else 0.0
+        action_data.append(
+            {
+                "action": action,
+                "total_hands": stats["total"],
+                "wins": stats["wins"],
+                "losses": stats["losses"],
+                "ties": stats["ties"],
+                "win_rate": round(win_rate, 2),
+                "distribution": round(distribution, 2),
+            }
+        )
 
-        # Get total sessions
-        session_stmt = select(func.count(Session.id)).where(Session.user_id == user_id)
-        session_result = await db.exec(session_stmt)
-        total_sessions = session_result.one()
+    # Sort by action order
+    action_data.sort(key=lambda x: _ACTION_ORDER.get(x["action"], 99))
+
+    return {"actions": action_data}
+
+
+def timeline_point(
+    created_at: datetime, hand_number: int, cumulative_wins: int
+) -> dict[str, Any]:
+    """Build one timeline entry from running totals at a hand."""
+    return {
+        "hand_number": hand_number,
+        "date": created_at.isoformat(),
+        "win_rate": round(cumulative_wins / hand_number * 100, 2),
+        "cumulative_wins": cumulative_wins,
+        "cumulative_hands": hand_number,
+    }
+
+
+def lttb_indices(xs: np.ndarray, ys: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Pick at most `max_points` indices of a series with Largest-Triangle-
+    Three-Buckets downsampling.
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the average of the next bucket, which preserves the visual shape.
+    """
+    n = len(xs)
+    if max_points >= n:
+        return np.arange(n)
+    if max_points < 3:
+        raise ValueError("max_points must be at least 3")
+
+    edges = (np.arange(max_points - 1) * (n - 2) / (max_points - 2)).astype(int) + 1
+    edges[-1] = n - 1
+    selected = np.empty(max_points, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = xs[end:next_end].mean()
+        avg_y = ys[end:next_end].mean()
+        area = np.abs(
+            (xs[a] - avg_x) * (ys[start:end] - ys[a])
+            - (xs[a] - xs[start:end]) * (avg_y - ys[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    return selected
 
+
+def style_from_counts(counts: dict[str, int]) -> dict[str, Any]:
+    """Build the playing style profile from aggregate counters."""
+    total_hands = counts["total"]
+    if not total_hands:
         return {
-            "total_hands": total_hands,
-            "win_rate": (wins / total_hands * 100) if total_hands > 0 else 0.0,
-            "wins": wins,
-            "losses": losses,
-            "ties": ties,
-            "total_sessions": total_sessions,
-            "vpip": round(vpip, 2),
-            "aggression_factor": round(aggression, 2),
+            "vpip": 0.0,
+            "aggression_factor": 0.0,
+            "fold_frequency": 0.0,
+            "raise_frequency": 0.0,
+            "style_rating": "Unknown",
         }
 
+    # VPIP
+    vpip = counts["vpip_hands"] / total_hands * 100
+
+    # Aggression
+    passive = counts["calls"] + counts["checks"]
+    aggression = (counts["raises"] / passive) if passive > 0 else 0.0
+
+    # Fold frequency
+    fold_freq = counts["folds"] / total_hands * 100
+
+    # Raise frequency
+    raise_freq = counts["raises"] / total_hands * 100
+
+    # Determine style
+    if vpip < 20:
+        tight_loose = "Very Tight"
+    elif vpip < 30:
+        tight_loose = "Tight"
+    elif vpip < 40:
+        tight_loose = "Balanced"
+    elif vpip < 50:
+        tight_loose = "Loose"
+    else:
+        tight_loose = "Very Loose"
+
+    if aggression < 0.5:
+        passive_aggressive = "Very Passive"
+    elif aggression < 1.0:
+        passive_aggressive = "Passive"
+    elif aggression < 2.0:
+        passive_aggressive = "Balanced"
+    elif aggression < 3.0:
+        passive_aggressive = "Aggressive"
+    else:
+        passive_aggressive = "Very Aggressive"
+
+    style_rating = f"{tight_loose} & {passive_aggressive}"
+
+    return {
+        "vpip": round(vpip, 2),
+        "aggression_factor": round(aggression, 2),
+        "fold_frequency": round(fold_freq, 2),
+        "raise_frequency": round(raise_freq, 2),
+        "tight_loose": tight_loose,
+        "passive_aggressive": passive_aggressive,
+        "style_rating": style_rating,
+    }
+
+
+def _rollup_sum(*conditions: Any) -> Any:
+    """Sum a session's rollup counts, optionally only rows matching `conditions`."""
+    total = func.sum(SessionStats.hand_count)
+    if conditions:
+        total = total.filter(*conditions)
+    return func.coalesce(total, 0)
+
+
+class AnalyticsService:
+    """
+    Service for calculating poker analytics and statistics.
+
+    Aggregate views read the rollups kept by StatsService, so their cost does
+    not grow with the number of hands played.
+    """
+
     @staticmethod
-    async def get_position_stats(db: AsyncSession, user_id: int) -> dict[str, Any]:
-        """Calculate statistics by position."""
-        stmt = select(Hand).join(Session).where(Session.user_id == user_id)
-        result = await db.exec(stmt)
-        hands = result.all()
-
-        positions = {}
-        for hand in hands:
-            pos = hand.player_position
-            if pos not in positions:
-                positions[pos] = {"total": 0, "wins": 0, "losses": 0, "ties": 0}
-
-            positions[pos]["total"] += 1
-            if hand.result == "win":
-                positions[pos]["wins"] += 1
-            elif hand.result == "loss":
-                positions[pos]["losses"] += 1
-            elif hand.result == "tie":
-                positions[pos]["ties"] += 1
-
-        # Calculate win rates
-        position_data = []
-        for pos, stats in positions.items():
-            win_rate = (
-                (stats["wins"] / stats["total"] * 100) if stats["total"] > 0 else 0.0
-            )
-            position_data.append(
-                {
-                    "position": pos,
-                    "total_hands": stats["total"],
-                    "wins": stats["wins"],
-                    "losses": stats["losses"],
-                    "ties": stats["ties"],
-                    "win_rate": round(win_rate, 2),
-                }
-            )
+    async def _get_summary(db: AsyncSession, user_id: int) -> dict[str, Any]:
+        """Summarize the user's rollup rows; see summarize_breakdown."""
+        breakdown = await StatsService.get_user_breakdown(db, user_id)
+        return summarize_breakdown(breakdown)
 
-        # Sort by position order: early, middle, late
-        order = {"early": 0, "middle": 1, "late": 2}
-        position_data.sort(key=lambda x: order.get(x["position"], 99))
+    @staticmethod
+    async def _count_sessions(db: AsyncSession, user_id: int) -> int:
+        result = await db.exec(
+            select(func.count(Session.id)).where(Session.user_id == user_id)
+        )
+        return result.one()
 
-        return {"positions": position_data}
+    @staticmethod
+    async def get_overall_stats(db: AsyncSession, user_id: int) -> dict[str, Any]:
+        """Calculate overall statistics for a user."""
+        summary = await AnalyticsService._get_summary(db, user_id)
+        sessions = await AnalyticsService._count_sessions(db, user_id)
+        return overall_from_counts(summary["overall"], sessions)
+
+    @staticmethod
+    async def get_position_stats(db: AsyncSession, user_id: int) -> dict[str, Any]:
+        """Calculate statistics by position."""
+        summary = await AnalyticsService._get_summary(db, user_id)
+        return positions_from_counts(summary["positions"])
 
     @staticmethod
     async def get_action_stats(db: AsyncSession, user_id: int) -> dict[str, Any]:
         """Calculate statistics by action."""
-        stmt = select(Hand).join(Session).where(Session.user_id == user_id)
-        result = await db.exec(stmt)
-        hands = result.all()
-
-        actions = {}
-        for hand in hands:
-            if not hand.action_taken:
-                continue
-
-            action = hand.action_taken
-            if action not in actions:
-                actions[action] = {"total": 0, "wins": 0, "losses": 0, "ties": 0}
-
-            actions[action]["total"] += 1
-            if hand.result == "win":
-                actions[action]["wins"] += 1
-            elif hand.result == "loss":
-                actions[action]["losses"] += 1
-            elif hand.result == "tie":
-                actions[action]["ties"] += 1
-
-        # Calculate win rates and distribution
-        action_data = []
-        total_actions = sum(stats["total"] for stats in actions.values())
-
-        for action, stats in actions.items():
-            win_rate = (
-                (stats["wins"] / stats["total"] * 100) if stats["total"] > 0 else 0.0
-            )
-            distribution = (
-                (stats["total"] / total_actions * 100) if total_actions > 0 else 0.0
-            )
+        summary = await AnalyticsService._get_summary(db, user_id)
+        return actions_from_counts(summary["actions"])
 
-            action_data.append(
-                {
-                    "action": action,
-                    "total_hands": stats["total"],
-                    "wins": stats["wins"],
-                    "losses": stats["losses"],
-                    "ties": stats["ties"],
-                    "win_rate": round(win_rate, 2),
-                    "distribution": round(distribution, 2),
-                }
-            )
+    @staticmethod
+    def win_rate_query(
+        user_id: int,
+        bucket: Optional[str] = None,
+        bucket_size: int = 100,
+        cursor: Optional[TimelineCursor] = None,
+        limit: Optional[int] = None,
+    ) -> Any:
+        """
+        Build the query get_win_rate_over_time runs, selecting created_at,
+        hand number, cumulative wins and, unless bucketed, the hand id.
+
+        Running totals come from SQL window functions over the user's hands.
+        A page only scans hands after the cursor's (created_at, id): the
+        running totals restart there from the counts the cursor carries.
+        """
+        paginated = bucket is None and (cursor is not None or limit is not None)
+        order = (Hand.created_at, Hand.id)
+        hand_number = func.row_number().over(order_by=order)
+        cumulative_wins = (
+            func.count(Hand.id).filter(Hand.result == "win").over(order_by=order)
+        )
+        if paginated and cursor is not None:
+            after_time, after_id, after_hands, after_wins = cursor
+            hand_number = hand_number + after_hands
+            cumulative_wins = cumulative_wins + after_wins
+
+        running = _user_hands(
+            user_id,
+            Hand.created_at,
+            hand_number.label("hand_number"),
+            cumulative_wins.label("cumulative_wins"),
+            Hand.id,
+        )
 
-        # Sort by action order
-        order = {"fold": 0, "check": 1, "call": 2, "raise": 3}
-        action_data.sort(key=lambda x: order.get(x["action"], 99))
+        if bucket is not None:
+            running = running.subquery()
+            if bucket == "hands":
+                group = (running.c.hand_number - 1) // bucket_size
+            elif bucket in _TIMELINE_PERIODS:
+                group = func.date_trunc(
+                    literal_column(f"'{bucket}'"), running.c.created_at
+                )
+            else:
+                raise ValueError(f"Unknown timeline bucket: {bucket}")
+            return (
+                select(
+                    func.max(running.c.created_at),
+                    func.max(running.c.hand_number),
+                    func.max(running.c.cumulative_wins),
+                )
+                .group_by(group)
+                .order_by(func.max(running.c.hand_number))
+            )
 
-        return {"actions": action_data}
+        stmt = running.order_by(*order)
+        if cursor is not None:
+            stmt = stmt.where(tuple_(*order) > (after_time, after_id))
+        if limit is not None:
+            # One extra row tells whether another page follows
+            stmt = stmt.limit(limit + 1)
+        return stmt
 
     @staticmethod
-    async def get_win_rate_over_time(db: AsyncSession, user_id: int) -> dict[str, Any]:
-        """Calculate cumulative win rate over time."""
-        stmt = (
-            select(Hand)
-            .join(Session)
-            .where(Session.user_id == user_id)
-            .order_by(Hand.created_at)
+    async def get_win_rate_over_time(
+        db: AsyncSession,
+        user_id: int,
+        max_points: Optional[int] = None,
+        bucket: Optional[str] = None,
+        bucket_size: int = 100,
+        cursor: Optional[TimelineCursor] = None,
+        limit: Optional[int] = None,
+    ) -> dict[str, Any]:
+        """
+        Calculate cumulative win rate over time.
+
+        The series is returned in one of these forms:
+            - bucketed: the last point of every `bucket_size` hands
+              (bucket="hands") or of every calendar day/week;
+            - paginated (`cursor` or `limit` given): raw points after the
+              `cursor` position, `limit` at a time, with `next_cursor` set
+              while more remain;
+            - downsampled: at most `max_points` points chosen with LTTB;
+            - otherwise every hand.
+
+        See win_rate_query for how the series is computed.
+        """
+        paginated = bucket is None and (cursor is not None or limit is not None)
+        stmt = AnalyticsService.win_rate_query(
+            user_id, bucket, bucket_size, cursor, limit
         )
         result = await db.exec(stmt)
-        hands = result.all()
-
-        timeline = []
-        cumulative_wins = 0
-        cumulative_total = 0
-
-        for hand in hands:
-            cumulative_total += 1
-            if hand.result == "win":
-                cumulative_wins += 1
-
-            win_rate = (
-                (cumulative_wins / cumulative_total * 100)
-                if cumulative_total > 0
-                else 0.0
+        rows = result.all()
+
+        next_cursor = None
+        if paginated and limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            created_at, hand_number, cumulative_wins, hand_id = rows[-1]
+            next_cursor = (created_at, hand_id, hand_number, cumulative_wins)
+        elif not paginated and max_points is not None and len(rows) > max_points:
+            hand_numbers = np.fromiter((r[1] for r in rows), dtype=np.float64)
+            win_rates = (
+                np.fromiter((r[2] for r in rows), dtype=np.float64) / hand_numbers
             )
+            rows = [rows[i] for i in lttb_indices(hand_numbers, win_rates, max_points)]
 
-            timeline.append(
-                {
-                    "hand_number": cumulative_total,
-                    "date": hand.created_at.isoformat(),
-                    "win_rate": round(win_rate, 2),
-                    "cumulative_wins": cumulative_wins,
-                    "cumulative_hands": cumulative_total,
-                }
-            )
+        timeline = [timeline_point(*row[:3]) for row in rows]
+        return {"timeline": timeline, "next_cursor": next_cursor}
 
-        return {"timeline": timeline}
+    @staticmethod
+    async def get_dashboard(
+        session_factory: Callable[[], AsyncSession],
+        user_id: int,
+        timeline_points: Optional[int] = 500,
+        max_concurrency: int = 3,
+        timeout: Optional[float] = None,
+    ) -> dict[str, Any]:
+        """
+        Calculate every dashboard view with a single read of the rollups.
+
+        Overall, position, action and style stats share one summary of the
+        user's rollup rows; only the timeline reads individual hands, and it is
+        downsampled to at most `timeline_points` points.
+
+        The independent queries run concurrently, each on its own session
+        from `session_factory` (so on its own pooled connection), at most
+        `max_concurrency` at a time. Raises TimeoutError, cancelling the
+        queries still running, if they take longer than `timeout` seconds;
+        if a query fails, the others are cancelled and its error is raised.
+        """
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def run(query: Callable[[AsyncSession], Awaitable[_T]]) -> _T:
+            async with slots:
+                async with session_factory() as db:
+                    return await query(db)
+
+        async with asyncio.timeout(timeout):
+            try:
+                async with asyncio.TaskGroup() as tasks:
+                    summary = tasks.create_task(
+                        run(lambda db: AnalyticsService._get_summary(db, user_id))
+                    )
+                    sessions = tasks.create_task(
+                        run(lambda db: AnalyticsService._count_sessions(db, user_id))
+                    )
+                    timeline = tasks.create_task(
+                        run(
+                            lambda db: AnalyticsService.get_win_rate_over_time(
+                                db, user_id, max_points=timeline_points
+                            )
+                        )
+                    )
+            except ExceptionGroup as group:
+                # Callers handle the failed query's own error, not the group
+                raise group.exceptions[0]
+
+        summary = summary.result()
+        return {
+            "overall": overall_from_counts(summary["overall"], sessions.result()),
+            "positions": positions_from_counts(summary["positions"]),
+            "actions": actions_from_counts(summary["actions"]),
+            "timeline": timeline.result(),
+            "style": style_from_counts(summary["overall"]),
+        }
 
     @staticmethod
-    async def get_session_performance(db: AsyncSession, user_id: int) -> dict[str, Any]:
-        """Calculate performance by session."""
+    async def get_session_performance(
+        db: AsyncSession, user_id: int, limit: Optional[int] = None, offset: int = 0
+    ) -> dict[str, Any]:
+        """
+        Calculate performance by session, newest first.
+
+        Counts come from each session's rollup rows in one grouped query;
+        `limit` and `offset` page through the sessions.
+        """
         stmt = (
-            select(Session)
+            select(
+                Session.id,
+                Session.notes,
+                Session.start_time,
+                _rollup_sum().label("total"),
+                _rollup_sum(SessionStats.result == "win").label("wins"),
+                _rollup_sum(SessionStats.result == "loss").label("losses"),
+                _rollup_sum(SessionStats.result == "tie").label("ties"),
+            )
+            .select_from(Session)
+            .outerjoin(SessionStats, SessionStats.session_id == Session.id)
             .where(Session.user_id == user_id)
-            .order_by(Session.start_time.desc())
+            .group_by(Session.id)
+            .order_by(Session.start_time.desc(), Session.id.desc())
+            .offset(offset)
+            .limit(limit)
         )
         result = await db.exec(stmt)
-        sessions = result.all()
 
         session_data = []
-        for session in sessions:
-            # Get hands for this session
-            hands_stmt = select(Hand).where(Hand.session_id == session.id)
-            hands_result = await db.exec(hands_stmt)
-            hands = hands_result.all()
-
-            total_hands = len(hands)
-            wins = sum(1 for h in hands if h.result == "win")
-            losses = sum(1 for h in hands if h.result == "loss")
-            ties = sum(1 for h in hands if h.result == "tie")
-            win_rate = (wins / total_hands * 100) if total_hands > 0 else 0.0
-
+        for row in result.all():
+            win_rate = (row.wins / row.total * 100) if row.total > 0 else 0.0
             session_data.append(
                 {
-                    "session_id": session.id,
-                    "notes": session.notes,
-                    "start_time": session.start_time.isoformat(),
-                    "total_hands": total_hands,
-                    "wins": wins,
-                    "losses": losses,
-                    "ties": ties,
+                    "session_id": row.id,
+                    "notes": row.notes,
+                    "start_time": row.start_time.isoformat(),
+                    "total_hands": row.total,
+                    "wins": row.wins,
+                    "losses": row.losses,
+                    "ties": row.ties,
                     "win_rate": round(win_rate, 2),
                 }
             )
@@ -257,71 +563,5 @@ class AnalyticsService:
         db: AsyncSession, user_id: int
     ) -> dict[str, Any]:
         """Calculate playing style metrics."""
-        stmt = select(Hand).join(Session).where(Session.user_id == user_id)
-        result = await db.exec(stmt)
-        hands = result.all()
-
-        if not hands:
-            return {
-                "vpip": 0.0,
-                "aggression_factor": 0.0,
-                "fold_frequency": 0.0,
-                "raise_frequency": 0.0,
-                "style_rating": "Unknown",
-            }
-
-        total_hands = len(hands)
-
-        # VPIP
-        vpip_hands = sum(
-            1 for h in hands if h.action_taken and h.action_taken != "fold"
-        )
-        vpip = (vpip_hands / total_hands * 100) if total_hands > 0 else 0.0
-
-        # Aggression
-        raises = sum(1 for h in hands if h.action_taken == "raise")
-        calls = sum(1 for h in hands if h.action_taken == "call")
-        checks = sum(1 for h in hands if h.action_taken == "check")
-        aggression = (raises / (calls + checks)) if (calls + checks) > 0 else 0.0
-
-        # Fold frequency
-        folds = sum(1 for h in hands if h.action_taken == "fold")
-        fold_freq = (folds / total_hands * 100) if total_hands > 0 else 0.0
-
-        # Raise frequency
-        raise_freq = (raises / total_hands * 100) if total_hands > 0 else 0.0
-
-        # Determine style
-        if vpip < 20:
-            tight_loose = "Very Tight"
-        elif vpip < 30:
-            tight_loose = "Tight"
-        elif vpip < 40:
-            tight_loose = "Balanced"
-        elif vpip < 50:
-            tight_loose = "Loose"
-        else:
-            tight_loose = "Very Loose"
-
-        if aggression < 0.5:
-            passive_aggressive = "Very Passive"
-        elif aggression < 1.0:
-            passive_aggressive = "Passive"
-        elif aggression < 2.0:
-            passive_aggressive = "Balanced"
-        elif aggression < 3.0:
-            passive_aggressive = "Aggressive"
-        else:
-            passive_aggressive = "Very Aggressive"
-
-        style_rating = f"{tight_loose} & {passive_aggressive}"
-
-        return {
-            "vpip": round(vpip, 2),
-            "aggression_factor": round(aggression, 2),
-            "fold_frequency": round(fold_freq, 2),
-            "raise_frequency": round(raise_freq, 2),
-            "tight_loose": tight_loose,
-            "passive_aggressive": passive_aggressive,
-            "style_rating": style_rating,
-        }
+        summary = await AnalyticsService._get_summary(db, user_id)
+        return style_from_counts(summary["overall"])
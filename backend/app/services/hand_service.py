@@ -0,0 +1,150 @@
+from collections import Counter
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Optional, Union
+
+from sqlalchemy import Select, insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.pagination import Keyset, fetch_keyset_page, keyset_page_query
+from app.models.hand import Hand
+from app.services.stats_service import StatsService
+
+
+# Hand fields accepted by bulk inserts, besides session_id and created_at
+HAND_FIELDS = (
+    "hole_cards",
+    "board_cards",
+    "player_position",
+    "action_taken",
+    "result",
+)
+
+# Columns hand listings can select
+HAND_COLUMNS = {
+    "id": Hand.id,
+    "session_id": Hand.session_id,
+    **{field: getattr(Hand, field) for field in HAND_FIELDS},
+    "created_at": Hand.created_at,
+}
+
+
+async def _as_async(
+    hands: Union[Iterable[dict[str, Any]], AsyncIterable[dict[str, Any]]],
+) -> AsyncIterable[dict[str, Any]]:
+    """Iterate a sync or async iterable of hands asynchronously."""
+    if hasattr(hands, "__aiter__"):
+        async for hand in hands:
+            yield hand
+    else:
+        for hand in hands:
+            yield hand
+
+
+class HandService:
+    """Service for listing and writing hands in bulk."""
+
+    @staticmethod
+    def list_hands_query(
+        session_id: int,
+        fields: tuple[str, ...],
+        limit: Optional[int],
+        after: Optional[Keyset] = None,
+    ) -> Select:
+        """Build the query list_hands runs for one page."""
+        return keyset_page_query(
+            select(Hand).where(Hand.session_id == session_id),
+            HAND_COLUMNS,
+            fields,
+            (Hand.created_at, Hand.id),
+            after,
+            limit,
+        )
+
+    @staticmethod
+    async def list_hands(
+        db: AsyncSession,
+        session_id: int,
+        fields: tuple[str, ...],
+        limit: Optional[int],
+        after: Optional[Keyset] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[Keyset]]:
+        """
+        Return one page of a session's hands in the order they were played,
+        with only the given HAND_COLUMNS fields; every hand when `limit` is
+        None.
+
+        Returns the page and the keyset to continue after, or None on the
+        last page.
+        """
+        stmt = HandService.list_hands_query(session_id, fields, limit, after)
+        return await fetch_keyset_page(db, stmt, fields, limit)
+
+    @staticmethod
+    async def insert_batch(
+        db: AsyncSession, user_id: int, session_id: int, hands: list[dict[str, Any]]
+    ) -> list[int]:
+        """
+        Insert hands into a session with one multi-row INSERT ... RETURNING,
+        update the stats rollups and commit.
+
+        Returns the new hand ids.
+        """
+        now = datetime.now()
+        rows = [
+            {
+                **{field: hand.get(field) for field in HAND_FIELDS},
+                "session_id": session_id,
+                "created_at": hand.get("created_at") or now,
+            }
+            for hand in hands
+        ]
+        result = await db.execute(insert(Hand).values(rows).returning(Hand.id))
+        hand_ids = list(result.scalars())
+
+        keys = Counter(
+            (row["player_position"], row["action_taken"], row["result"]) for row in rows
+        )
+        await StatsService.apply(db, user_id, session_id, keys)
+        await db.commit()
+        return hand_ids
+
+    @staticmethod
+    async def insert_batches(
+        db: AsyncSession,
+        user_id: int,
+        session_id: int,
+        hands: Union[Iterable[dict[str, Any]], AsyncIterable[dict[str, Any]]],
+        batch_size: int,
+    ) -> AsyncIterator[list[int]]:
+        """
+        Insert a stream of hands into a session, committing every
+        `batch_size` hands and yielding each batch's new hand ids.
+
+        Hands are consumed lazily, so only one batch is held in memory.
+        Batches committed before an error stay committed.
+        """
+        batch = []
+        async for hand in _as_async(hands):
+            batch.append(hand)
+            if len(batch) >= batch_size:
+                yield await HandService.insert_batch(db, user_id, session_id, batch)
+                batch = []
+        if batch:
+            yield await HandService.insert_batch(db, user_id, session_id, batch)
+
+    @staticmethod
+    async def bulk_insert(
+        db: AsyncSession,
+        user_id: int,
+        session_id: int,
+        hands: Union[Iterable[dict[str, Any]], AsyncIterable[dict[str, Any]]],
+        batch_size: int,
+    ) -> list[int]:
+        """Insert a stream of hands like insert_batches; return all new ids."""
+        hand_ids = []
+        async for batch_ids in HandService.insert_batches(
+            db, user_id, session_id, hands, batch_size
+        ):
+            hand_ids += batch_ids
+        return hand_ids
@@ -0,0 +1,100 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Select, delete
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.pagination import Keyset, fetch_keyset_page, keyset_page_query
+from app.models.session import Session
+from app.models.stats import SessionStats
+from app.services.stats_service import StatsService
+
+
+# Hand counts come from the session rollup rather than counting hands
+_HAND_COUNT = (
+    select(func.coalesce(func.sum(SessionStats.hand_count), 0))
+    .where(SessionStats.session_id == Session.id)
+    .scalar_subquery()
+)
+
+SESSION_COLUMNS = {
+    "id": Session.id,
+    "user_id": Session.user_id,
+    "start_time": Session.start_time,
+    "end_time": Session.end_time,
+    "notes": Session.notes,
+    "hand_count": _HAND_COUNT,
+}
+
+
+class SessionService:
+    """Service for listing and removing poker sessions in bulk."""
+
+    @staticmethod
+    def list_sessions_query(
+        user_id: int,
+        fields: tuple[str, ...],
+        limit: Optional[int],
+        after: Optional[Keyset] = None,
+    ) -> Select:
+        """Build the query list_sessions runs for one page."""
+        return keyset_page_query(
+            select(Session).where(Session.user_id == user_id),
+            SESSION_COLUMNS,
+            fields,
+            (Session.start_time, Session.id),
+            after,
+            limit,
+            descending=True,
+        )
+
+    @staticmethod
+    async def list_sessions(
+        db: AsyncSession,
+        user_id: int,
+        fields: tuple[str, ...],
+        limit: Optional[int],
+        after: Optional[Keyset] = None,
+    ) -> tuple[list[dict[str, Any]], Optional[Keyset]]:
+        """
+        Return one page of a user's sessions, newest first, with only the
+        given SESSION_COLUMNS fields; every session when `limit` is None.
+
+        Returns the page and the keyset to continue after, or None on the
+        last page.
+        """
+        stmt = SessionService.list_sessions_query(user_id, fields, limit, after)
+        return await fetch_keyset_page(db, stmt, fields, limit)
+
+    @staticmethod
+    async def delete_sessions(
+        db: AsyncSession,
+        user_id: int,
+        session_ids: Optional[list[int]] = None,
+        before: Optional[datetime] = None,
+    ) -> list[int]:
+        """
+        Delete a user's sessions, optionally only those in `session_ids`
+        and/or started before `before`, together with their hands.
+
+        Runs as a handful of set-based statements: the user rollups are
+        decremented in one INSERT ... SELECT, and one DELETE removes the
+        sessions while the database cascades to their hands and session
+        rollups. The caller commits.
+
+        Returns the ids of the deleted sessions.
+        """
+        filters = [Session.user_id == user_id]
+        if session_ids is not None:
+            filters.append(Session.id.in_(session_ids))
+        if before is not None:
+            filters.append(Session.start_time < before)
+        selected = select(Session.id).where(*filters)
+
+        # Lock the sessions first so hands cannot be added to them between
+        # updating the rollups and deleting
+        await db.execute(selected.with_for_update())
+        await StatsService.remove_sessions(db, selected)
+        result = await db.execute(delete(Session).where(*filters).returning(Session.id))
+        return list(result.scalars())
@@ -0,0 +1,175 @@
+from collections import Counter
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import Select, delete, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select, func
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.hand import Hand
+from app.models.session import Session
+from app.models.stats import SessionStats, UserStats
+
+# (position, action, result) with a missing action or result as None
+StatsKey = tuple[str, Optional[str], Optional[str]]
+
+_KEY_COLUMNS = ("player_position", "action_taken", "result")
+
+
+def hand_key(hand: Hand) -> StatsKey:
+    """Return the rollup key a hand is counted under."""
+    return (hand.player_position, hand.action_taken or None, hand.result or None)
+
+
+async def _upsert(
+    db: AsyncSession,
+    table: Any,
+    owner_column: str,
+    owner_id: int,
+    deltas: Counter[StatsKey],
+) -> None:
+    """Add signed counts to one owner's rollup rows, creating missing rows."""
+    rows = [
+        {
+            owner_column: owner_id,
+            "player_position": position,
+            "action_taken": action or "",
+            "result": result or "",
+            "hand_count": n,
+        }
+        for (position, action, result), n in deltas.items()
+        if n
+    ]
+    if not rows:
+        return
+    stmt = insert(table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[owner_column, *_KEY_COLUMNS],
+        set_={"hand_count": table.hand_count + stmt.excluded.hand_count},
+    )
+    await db.execute(stmt)
+
+
+class StatsService:
+    """
+    Service maintaining the per-user and per-session hand count rollups.
+
+    Every write to hands goes through here within the caller's transaction,
+    so the rollups always match the hand table once it commits.
+    """
+
+    @staticmethod
+    async def apply(
+        db: AsyncSession,
+        user_id: int,
+        session_id: int,
+        deltas: Counter[StatsKey],
+    ) -> None:
+        """Add signed hand counts to the user's and the session's rollups."""
+        await _upsert(db, UserStats, "user_id", user_id, deltas)
+        await _upsert(db, SessionStats, "session_id", session_id, deltas)
+
+    @staticmethod
+    async def record_hands(
+        db: AsyncSession,
+        session_id: int,
+        added: Iterable[StatsKey] = (),
+        removed: Iterable[StatsKey] = (),
+    ) -> int:
+        """
+        Count `added` hands and uncount `removed` hands of one session.
+
+        Returns the id of the user owning the session.
+        """
+        result = await db.exec(select(Session.user_id).where(Session.id == session_id))
+        user_id = result.one()
+        deltas = Counter(added)
+        deltas.subtract(removed)
+        await StatsService.apply(db, user_id, session_id, deltas)
+        return user_id
+
+    @staticmethod
+    async def remove_sessions(db: AsyncSession, session_ids: Select) -> None:
+        """
+        Subtract the hands of the sessions selected by `session_ids` from
+        their users' rollups.
+
+        The sessions' own rollups are left for the database to drop along
+        with the sessions (ON DELETE CASCADE).
+        """
+        key_columns = [getattr(SessionStats, column) for column in _KEY_COLUMNS]
+        totals = (
+            select(Session.user_id, *key_columns, -func.sum(SessionStats.hand_count))
+            .join(Session, Session.id == SessionStats.session_id)
+            .where(SessionStats.session_id.in_(session_ids))
+            .group_by(Session.user_id, *key_columns)
+        )
+        stmt = insert(UserStats).from_select(
+            ["user_id", *_KEY_COLUMNS, "hand_count"], totals
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", *_KEY_COLUMNS],
+            set_={"hand_count": UserStats.hand_count + stmt.excluded.hand_count},
+        )
+        await db.execute(stmt)
+
+    @staticmethod
+    async def get_user_breakdown(
+        db: AsyncSession, user_id: int
+    ) -> list[tuple[str, Optional[str], Optional[str], int]]:
+        """Return the user's non-empty (position, action, result, count) rows."""
+        result = await db.exec(
+            select(UserStats).where(
+                UserStats.user_id == user_id, UserStats.hand_count > 0
+            )
+        )
+        return [
+            (
+                row.player_position,
+                row.action_taken or None,
+                row.result or None,
+                row.hand_count,
+            )
+            for row in result.all()
+        ]
+
+    @staticmethod
+    async def rebuild(db: AsyncSession, user_id: Optional[int] = None) -> None:
+        """
+        Recompute the rollups from the hand table.
+
+        Rebuilds one user's rollups, or every user's when `user_id` is None.
+        The caller commits.
+        """
+        user_filter = [] if user_id is None else [Session.user_id == user_id]
+        session_ids = select(Session.id).where(*user_filter)
+        await db.execute(
+            delete(SessionStats).where(SessionStats.session_id.in_(session_ids))
+        )
+        await db.execute(
+            delete(UserStats).where(
+                *([] if user_id is None else [UserStats.user_id == user_id])
+            )
+        )
+
+        key_columns = (
+            Hand.player_position,
+            func.coalesce(Hand.action_taken, literal_column("''")),
+            func.coalesce(Hand.result, literal_column("''")),
+        )
+        for table, owner_column, owner in (
+            (UserStats, "user_id", Session.user_id),
+            (SessionStats, "session_id", Hand.session_id),
+        ):
+            counts = (
+                select(owner, *key_columns, func.count(Hand.id))
+                .select_from(Hand)
+                .join(Session)
+                .where(*user_filter)
+                .group_by(owner, *key_columns)
+            )
+            await db.execute(
+                insert(table).from_select(
+                    [owner_column, *_KEY_COLUMNS, "hand_count"], counts
+                )
+            )
@@ -0,0 +1,217 @@
+import asyncio
+import random
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.analytics_service import (
+    AnalyticsService,
+    actions_from_counts,
+    lttb_indices,
+    overall_from_counts,
+    positions_from_counts,
+    style_from_counts,
+    summarize_breakdown,
+    timeline_point,
+)
+
+
+def _random_hands(count: int, seed: int = 3) -> list[tuple]:
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    return [
+        (
+            start + timedelta(minutes=i),
+            rng.choice(["early", "middle", "late"]),
+            rng.choice(["fold", "check", "call", "raise", None]),
+            rng.choice(["win", "loss", "tie", None]),
+        )
+        for i in range(count)
+    ]
+
+
+def _summarize(hands: list[tuple]) -> dict:
+    breakdown = Counter((pos, action, result) for _, pos, action, result in hands)
+    return summarize_breakdown(key + (n,) for key, n in breakdown.items())
+
+
+def test_breakdown_counts_match_per_hand_counts():
+    hands = _random_hands(500)
+    summary = _summarize(hands)
+    overall = summary["overall"]
+
+    assert overall["total"] == 500
+    assert overall["wins"] == sum(1 for h in hands if h[3] == "win")
+    assert overall["vpip_hands"] == sum(1 for h in hands if h[2] and h[2] != "fold")
+    assert overall["raises"] == sum(1 for h in hands if h[2] == "raise")
+    assert summary["positions"]["late"]["losses"] == sum(
+        1 for h in hands if h[1] == "late" and h[3] == "loss"
+    )
+    assert sum(g["total"] for g in summary["actions"].values()) == sum(
+        1 for h in hands if h[2] is not None
+    )
+
+
+def test_dashboard_views_are_derived_from_breakdown():
+    hands = _random_hands(200)
+    summary = _summarize(hands)
+
+    overall = overall_from_counts(summary["overall"], total_sessions=4)
+    positions = positions_from_counts(summary["positions"])["positions"]
+    actions = actions_from_counts(summary["actions"])["actions"]
+    style = style_from_counts(summary["overall"])
+
+    wins = sum(1 for h in hands if h[3] == "win")
+    assert overall["win_rate"] == wins / 200 * 100
+    assert overall["total_sessions"] == 4
+    assert [p["position"] for p in positions] == ["early", "middle", "late"]
+    assert [a["action"] for a in actions] == ["fold", "check", "call", "raise"]
+    assert round(sum(a["distribution"] for a in actions)) == 100
+    assert style["vpip"] == overall["vpip"]
+    assert style["style_rating"] == (
+        f"{style['tight_loose']} & {style['passive_aggressive']}"
+    )
+
+
+def test_empty_history_returns_zeroed_views():
+    summary = summarize_breakdown([])
+
+    assert overall_from_counts(summary["overall"], 3)["total_sessions"] == 0
+    assert positions_from_counts(summary["positions"]) == {"positions": []}
+    assert style_from_counts(summary["overall"])["style_rating"] == "Unknown"
+
+
+def test_timeline_point_reports_running_win_rate():
+    point = timeline_point(datetime(2025, 1, 1, 12), hand_number=8, cumulative_wins=3)
+
+    assert point == {
+        "hand_number": 8,
+        "date": "2025-01-01T12:00:00",
+        "win_rate": 37.5,
+        "cumulative_wins": 3,
+        "cumulative_hands": 8,
+    }
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    xs = np.arange(1_000, dtype=np.float64)
+    ys = np.zeros(1_000)
+    ys[437] = 50.0
+
+    indices = lttb_indices(xs, ys, 20)
+
+    assert len(indices) == 20
+    assert indices[0] == 0 and indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+    assert 437 in indices
+
+
+def test_lttb_returns_short_series_unchanged():
+    xs = np.arange(10, dtype=np.float64)
+
+    assert list(lttb_indices(xs, xs, 10)) == list(range(10))
+    with pytest.raises(ValueError):
+        lttb_indices(xs, xs, 2)
+
+
+def test_timeline_page_continues_running_totals_from_cursor():
+    class FakeDB:
+        async def exec(self, stmt):
+            self.stmt = stmt
+            return self
+
+        def all(self):
+            start = datetime(2025, 1, 1)
+            return [
+                (start + timedelta(minutes=i), 11 + i, 5 + i, 100 + i) for i in range(3)
+            ]
+
+    db = FakeDB()
+    cursor = (datetime(2025, 1, 1), 99, 10, 4)
+    page = asyncio.run(
+        AnalyticsService.get_win_rate_over_time(db, 1, cursor=cursor, limit=2)
+    )
+
+    # Only hands after the cursor are scanned, and counts resume from it
+    sql = str(db.stmt)
+    assert "(hand.created_at, hand.id) >" in sql
+    assert "row_number() OVER (ORDER BY hand.created_at, hand.id) +" in sql
+    assert [p["hand_number"] for p in page["timeline"]] == [11, 12]
+    assert page["next_cursor"] == (datetime(2025, 1, 1, 0, 1), 101, 12, 6)
+
+
+class _FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _slow_dashboard_queries(monkeypatch, delay: float) -> dict[str, int]:
+    """Replace the dashboard queries with sleeps, tracking their overlap."""
+    running = {"now": 0, "peak": 0}
+
+    async def query(result):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(delay)
+        running["now"] -= 1
+        return result
+
+    summary = summarize_breakdown([("late", "raise", "win", 3)])
+    monkeypatch.setattr(
+        AnalyticsService, "_get_summary", lambda db, user_id: query(summary)
+    )
+    monkeypatch.setattr(
+        AnalyticsService, "_count_sessions", lambda db, user_id: query(2)
+    )
+    monkeypatch.setattr(
+        AnalyticsService,
+        "get_win_rate_over_time",
+        lambda db, user_id, max_points: query({"timeline": [], "next_cursor": None}),
+    )
+    return running
+
+
+def test_dashboard_runs_queries_concurrently(monkeypatch):
+    running = _slow_dashboard_queries(monkeypatch, delay=0.2)
+
+    start = time.perf_counter()
+    dashboard = asyncio.run(AnalyticsService.get_dashboard(_FakeSession, 1))
+    elapsed = time.perf_counter() - start
+
+    assert running["peak"] == 3
+    assert elapsed < 0.5
+    assert dashboard["overall"]["total_sessions"] == 2
+    assert dashboard["overall"]["total_hands"] == 3
+
+
+def test_dashboard_concurrency_is_bounded(monkeypatch):
+    running = _slow_dashboard_queries(monkeypatch, delay=0.05)
+
+    asyncio.run(AnalyticsService.get_dashboard(_FakeSession, 1, max_concurrency=1))
+
+    assert running["peak"] == 1
+
+
+def test_dashboard_times_out(monkeypatch):
+    _slow_dashboard_queries(monkeypatch, delay=1.0)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(AnalyticsService.get_dashboard(_FakeSession, 1, timeout=0.1))
+
+
+def test_dashboard_raises_the_failed_querys_error(monkeypatch):
+    _slow_dashboard_queries(monkeypatch, delay=0.05)
+
+    async def fail(db, user_id):
+        raise LookupError("rollups missing")
+
+    monkeypatch.setattr(AnalyticsService, "_count_sessions", fail)
+
+    with pytest.raises(LookupError, match="rollups missing"):
+        asyncio.run(AnalyticsService.get_dashboard(_FakeSession, 1))
@@ -0,0 +1,75 @@
+import pytest
+
+from app.core.analytics_cache import AnalyticsCache, LocalCacheBackend, etag_matches
+
+
+def test_invalidate_changes_only_that_users_etags():
+    cache = AnalyticsCache(LocalCacheBackend(maxsize=10, ttl=60))
+    overview = cache.etag(1, "/analytics/overview")
+    other_user = cache.etag(2, "/analytics/overview")
+
+    assert cache.etag(1, "/analytics/overview") == overview
+    assert cache.etag(1, "/analytics/style") != overview
+
+    cache.invalidate(1)
+    assert cache.etag(1, "/analytics/overview") != overview
+    assert cache.etag(2, "/analytics/overview") == other_user
+
+
+def test_entries_are_dropped_with_their_version():
+    cache = AnalyticsCache(LocalCacheBackend(maxsize=10, ttl=60))
+    etag = cache.etag(1, "/analytics/overview")
+    cache.set(etag, b"{}")
+
+    assert cache.get(etag) == b"{}"
+    cache.invalidate(1)
+    assert cache.get(cache.etag(1, "/analytics/overview")) is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+def test_local_backend_evicts_least_recently_used():
+    backend = LocalCacheBackend(maxsize=2, ttl=60)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    backend.get("a")
+    backend.set("c", 3)
+
+    assert (backend.get("a"), backend.get("b"), backend.get("c")) == (1, None, 3)
+
+
+def test_versions_and_entries_expire(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.core.analytics_cache.time.monotonic", lambda: now[0])
+    cache = AnalyticsCache(LocalCacheBackend(maxsize=10, ttl=30))
+    etag = cache.etag(1, "/analytics/overview")
+    cache.set(etag, b"{}")
+
+    now[0] += 29
+    assert cache.etag(1, "/analytics/overview") == etag
+    assert cache.get(etag) == b"{}"
+    # Another process's writes are picked up once the version expires
+    now[0] += 1
+    assert cache.etag(1, "/analytics/overview") != etag
+    assert cache.get(etag) is None
+
+
+def test_etags_differ_between_backends():
+    first = AnalyticsCache(LocalCacheBackend(maxsize=10, ttl=60))
+    second = AnalyticsCache(LocalCacheBackend(maxsize=10, ttl=60))
+
+    assert first.etag(1, "/analytics/overview") != second.etag(1, "/analytics/overview")
+
+
+@pytest.mark.parametrize(
+    "header, matches",
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ("*", True),
+        ('"abcd"', False),
+    ],
+)
+def test_etag_matches(header, matches):
+    assert etag_matches(header, '"abc"') is matches
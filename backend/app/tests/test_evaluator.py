@@ -1,9 +1,23 @@
+import random
+from itertools import combinations, combinations_with_replacement
+
+import pytest
+from pydantic import ValidationError
+
+from app.api.schemas.hand import HandEvaluationRequest
 from app.core.evaluator.evaluator import (
+    _classify_cards,
     evaluate_five_card_hand,
     evaluate_hand,
+    hand_strength,
     HAND_RANKS,
 )
-from app.core.models.card import Card
+from app.core.evaluator.lookup import (
+    encode_card,
+    evaluate_five,
+    evaluate_seven,
+)
+from app.core.models.card import Card, RANK_ORDER, SUITS
 
 
 def make_hand(codes):
@@ -156,3 +170,85 @@ def test_royal_flush_seven():
     result = evaluate_hand(cards)
     assert result["label"] == "Royal Flush"
     assert result["rank"] == 10
+
+
+def test_lookup_matches_reference_for_every_rank_pattern():
+    """
+    Every distinct 5-card rank pattern (suited and offsuit) evaluates the same
+    through the lookup tables as through the reference classifier.
+    """
+    for ranks in combinations_with_replacement(RANK_ORDER, 5):
+        if len(set(ranks)) == 1:
+            continue
+        # Give repeated ranks different suits so the cards stay distinct
+        offsuit = [Card(r + SUITS[ranks[:i].count(r)]) for i, r in enumerate(ranks)]
+        hands = [offsuit]
+        if len(set(ranks)) == 5:
+            hands.append([Card(r + "H") for r in ranks])
+            offsuit[0] = Card(ranks[0] + "D")
+        for hand in hands:
+            assert evaluate_five_card_hand(hand) == _classify_cards(hand)
+
+
+def test_strength_orders_like_rank_and_kickers():
+    rng = random.Random(7)
+    deck = [Card(r + s) for r in RANK_ORDER for s in SUITS]
+    hands = [rng.sample(deck, 7) for _ in range(200)]
+
+    for cards in hands:
+        best = max(
+            (_classify_cards(list(combo)) for combo in combinations(cards, 5)),
+            key=lambda h: (h["rank"], h["kickers"]),
+        )
+        assert evaluate_hand(cards) == best
+
+    for a, b in zip(hands, hands[1:]):
+        ra, rb = evaluate_hand(a), evaluate_hand(b)
+        key_a, key_b = (ra["rank"], ra["kickers"]), (rb["rank"], rb["kickers"])
+        assert (hand_strength(a) > hand_strength(b)) == (key_a > key_b)
+        assert (hand_strength(a) == hand_strength(b)) == (key_a == key_b)
+
+
+def test_seven_card_evaluator_matches_best_of_combinations():
+    rng = random.Random(11)
+    deck = [encode_card(Card(r + s)) for r in RANK_ORDER for s in SUITS]
+
+    for num_cards in (5, 6, 7):
+        for _ in range(2000):
+            cards = rng.sample(deck, num_cards)
+            best = max(evaluate_five(*combo) for combo in combinations(cards, 5))
+            assert evaluate_seven(cards) == best
+
+
+def test_seven_card_evaluator_edge_cases():
+    cases = {
+        # Two sets of trips make a full house with the lower trips as the pair
+        ("KH", "KS", "KD", "7C", "7H", "7S", "2D"): "Full House",
+        # Three pairs use the best remaining card as the kicker
+        ("AH", "AS", "9D", "9C", "4H", "4S", "KD"): "Two Pair",
+        # Quads beat a flush on the same board
+        ("9H", "9S", "9D", "9C", "2C", "5C", "JC"): "Four of a Kind",
+        # Straight flush beats a higher offsuit straight
+        ("5D", "6D", "7D", "8D", "9D", "TS", "JH"): "Straight Flush",
+        # Wheel straight
+        ("AS", "2D", "3H", "4C", "5S", "9D", "KH"): "Straight",
+    }
+    for codes, label in cases.items():
+        cards = make_hand(codes)
+        result = evaluate_hand(cards)
+        assert result["label"] == label
+        best = max(
+            (_classify_cards(list(combo)) for combo in combinations(cards, 5)),
+            key=lambda h: (h["rank"], h["kickers"]),
+        )
+        assert result == best
+
+
+def test_evaluation_request_allows_at_most_seven_cards():
+    board = ["2D", "7C", "9H", "JD", "KC"]
+    assert HandEvaluationRequest(hole_cards=["AS", "AD"], board_cards=board)
+
+    with pytest.raises(ValidationError):
+        HandEvaluationRequest(hole_cards=["AS", "AD"], board_cards=board + ["3S"])
+    with pytest.raises(ValidationError):
+        HandEvaluationRequest(hole_cards=["AS", "AD", "AH"], board_cards=board)
@@ -0,0 +1,157 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.core.history.parser import (
+    HandHistoryParser,
+    _position,
+    parse_hand_history,
+    parse_hand_history_async,
+)
+
+
+HISTORY = (
+    "\ufeff"
+    + """PokerStars Hand #1001: Hold'em No Limit ($0.01/$0.02 USD) - 2024/03/05 21:14:07 ET
+Table 'Alpha' 6-max Seat #1 is the button
+Seat 1: Villain1 ($2.00 in chips)
+Seat 2: Villain2 ($2.00 in chips)
+Seat 3: Hero ($2.00 in chips)
+Seat 5: Villain3 ($2.00 in chips)
+Seat 6: Villain4 ($2.00 in chips) is sitting out
+Villain2: posts small blind $0.01
+Hero: posts big blind $0.02
+*** HOLE CARDS ***
+Dealt to Hero [Ah Kd]
+Villain3: raises $0.04 to $0.06
+Villain1: folds
+Villain2: folds
+Hero: calls $0.04
+*** FLOP *** [2c 7h 9d]
+Hero: checks
+Villain3: bets $0.10
+Hero: folds
+Uncalled bet ($0.10) returned to Villain3
+Villain3 collected $0.13 from pot
+*** SUMMARY ***
+Total pot $0.13 | Rake $0
+Board [2c 7h 9d]
+Seat 3: Hero (big blind) folded on the Flop
+
+PokerStars Hand #1002: Hold'em No Limit ($0.01/$0.02 USD) - 2024/03/05 21:15:30 ET
+Table 'Alpha' 6-max Seat #3 is the button
+Seat 1: Villain1 ($2.00 in chips)
+Seat 3: Hero ($2.10 in chips)
+Seat 5: Villain3 ($2.00 in chips)
+Villain3: posts small blind $0.01
+Villain1: posts big blind $0.02
+*** HOLE CARDS ***
+Dealt to Hero [10s 10c]
+Hero: raises $0.04 to $0.06
+Villain3: folds
+Villain1: calls $0.04
+*** FLOP *** [Ts 4d 4c]
+*** TURN *** [Ts 4d 4c] [Qh]
+*** RIVER *** [Ts 4d 4c Qh] [3s]
+*** SHOW DOWN ***
+Hero: shows [10s 10c] (a full house, Tens full of Fours)
+Villain1: mucks hand
+Hero collected $0.13 from pot
+*** SUMMARY ***
+Board [Ts 4d 4c Qh 3s]
+
+PokerStars Hand #1003: Hold'em No Limit ($0.01/$0.02 USD) - 2024/03/05 21:16:02 ET
+Table 'Alpha' 6-max Seat #5 is the button
+Seat 1: Villain1 ($2.00 in chips)
+Seat 3: Hero ($2.20 in chips)
+Seat 5: Villain3 ($2.00 in chips)
+Villain1: posts small blind $0.01
+Hero: posts big blind $0.02
+*** HOLE CARDS ***
+Dealt to Hero [Qs Jh]
+Villain3: calls $0.02
+Villain1: calls $0.01
+Hero: checks
+*** FLOP *** [Ac Kc Th]
+*** TURN *** [Ac Kc Th] [2d]
+*** RIVER *** [Ac Kc Th 2d] [2s]
+*** SHOW DOWN ***
+Hero: shows [Qs Jh] (a straight, Ten to Ace)
+Villain3: shows [Qd Js] (a straight, Ten to Ace)
+Hero collected $0.03 from pot
+Villain3 collected $0.03 from pot
+*** SUMMARY ***
+Board [Ac Kc Th 2d 2s]
+
+PokerStars Hand #1004: Omaha Pot Limit ($0.01/$0.02 USD) - 2024/03/05 21:17:00 ET
+Table 'Alpha' 6-max Seat #1 is the button
+Seat 1: Villain1 ($2.00 in chips)
+Seat 3: Hero ($2.20 in chips)
+*** HOLE CARDS ***
+Dealt to Hero [Qs Jh 9c 8c]
+Hero: folds
+*** SUMMARY ***
+"""
+)
+
+
+def test_parses_hands_from_history():
+    parser = HandHistoryParser()
+    hands = list(parse_hand_history(HISTORY.splitlines(keepends=True), parser))
+
+    assert hands == [
+        {
+            "hole_cards": ["AH", "KD"],
+            "board_cards": ["2C", "7H", "9D"],
+            "player_position": "early",
+            "action_taken": "call",
+            "result": "loss",
+            "created_at": datetime(2024, 3, 5, 21, 14, 7),
+        },
+        {
+            "hole_cards": ["TS", "TC"],
+            "board_cards": ["TS", "4D", "4C", "QH", "3S"],
+            "player_position": "late",
+            "action_taken": "raise",
+            "result": "win",
+            "created_at": datetime(2024, 3, 5, 21, 15, 30),
+        },
+        {
+            "hole_cards": ["QS", "JH"],
+            "board_cards": ["AC", "KC", "TH", "2D", "2S"],
+            "player_position": "early",
+            "action_taken": "check",
+            "result": "tie",
+            "created_at": datetime(2024, 3, 5, 21, 16, 2),
+        },
+    ]
+    assert (parser.parsed, parser.skipped) == (3, 1)
+
+
+def test_async_parser_matches_sync_parser():
+    async def lines():
+        for line in HISTORY.splitlines():
+            yield line
+
+    async def collect():
+        return [hand async for hand in parse_hand_history_async(lines())]
+
+    expected = list(parse_hand_history(HISTORY.splitlines()))
+    assert asyncio.run(collect()) == expected
+
+
+@pytest.mark.parametrize(
+    "players, positions",
+    [
+        (2, ["late", "early"]),
+        (6, ["late", "early", "early", "early", "middle", "late"]),
+        (
+            9,
+            ["late", "early", "early", "early", "early", "early"]
+            + ["middle", "middle", "late"],
+        ),
+    ],
+)
+def test_positions_follow_the_button(players, positions):
+    assert [_position(d, players) for d in range(players)] == positions
@@ -0,0 +1,35 @@
+import pytest
+from pydantic import ValidationError
+
+from app.api.schemas.hand import HandBulkItem
+
+
+def test_bulk_item_normalizes_enum_fields():
+    hand = HandBulkItem.model_validate_json(
+        '{"hole_cards": ["AS", "KD"], "board_cards": ["2C", "7H", "9D"],'
+        ' "player_position": "late", "action_taken": "raise", "result": "win"}'
+    )
+
+    assert hand.model_dump(mode="json") == {
+        "hole_cards": ["AS", "KD"],
+        "board_cards": ["2C", "7H", "9D"],
+        "player_position": "late",
+        "action_taken": "raise",
+        "result": "win",
+    }
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"hole_cards": ["AS", "1D"]},
+        {"hole_cards": ["AS", "KD", "QC"]},
+        {"hole_cards": ["AS", "KD"], "board_cards": ["AS", "2C", "3C"]},
+        {"player_position": "button"},
+        {"action_taken": "shove"},
+        {"result": "won"},
+    ],
+)
+def test_bulk_item_rejects_invalid_hands(fields):
+    with pytest.raises(ValidationError):
+        HandBulkItem(**{"player_position": "early", **fields})
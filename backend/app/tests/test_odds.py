@@ -1,5 +1,38 @@
-from app.core.models.card import Card
-from app.core.odds.odds_calculator import calculate_odds
+import asyncio
+import concurrent.futures
+import time
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.api.routes import tools
+from app.api.schemas.hand import HandOddsRequest
+from app.core.evaluator.lookup import CARD_INTS, evaluate_seven
+from app.core.models.card import Card, RANK_ORDER, SUITS
+from app.core.odds.cache import OddsCache, canonical_key
+from app.core.odds.enumeration import count_outcomes
+from app.core.odds.odds_calculator import (
+    ENGINES,
+    _seeded_chunks,
+    calculate_odds,
+    calculate_odds_adaptive,
+    calculate_odds_async,
+)
+from app.core.odds.pool import OddsWorkerPool, PoolSaturatedError
+from app.core.odds.preflop import (
+    MAX_OPPONENTS,
+    NUM_CLASSES,
+    PREFLOP_TABLE_PATH,
+    PreflopTable,
+    build_table,
+    hand_class_index,
+    hand_class_label,
+    preflop_table,
+)
+from app.core.odds.simulation import simulate_chunk
+from app.core.odds.vectorized import evaluate_strengths
 
 
 def test_deterministic_win():
@@ -8,7 +41,8 @@ def test_deterministic_win():
     Should always win against 1 opponent.
     """
     hole = [Card("AS"), Card("AD")]
-    board = [Card("AH"), Card("AC"), Card("2D"), Card("3D"), Card("4D")]
+    # No straight flush is possible, so quads can never lose
+    board = [Card("AH"), Card("AC"), Card("2D"), Card("7S"), Card("JC")]
 
     odds = calculate_odds(hole, board, num_opponents=1, simulations=10)
 
@@ -45,3 +79,357 @@ def test_full_board_tie():
     # Sum should always be 1
     total = odds["win"] + odds["tie"] + odds["loss"]
     assert 0.99 <= total <= 1.01
+
+
+def test_vectorized_engine_deterministic_win():
+    hole = [Card("AS"), Card("AD")]
+    board = [Card("AH"), Card("AC"), Card("2D"), Card("7S"), Card("JC")]
+
+    odds = calculate_odds(
+        hole,
+        board,
+        num_opponents=3,
+        simulations=1000,
+        engine="vectorized",
+        exact_threshold=0,
+    )
+
+    assert odds == {"win": 1.0, "tie": 0.0, "loss": 0.0, "mode": "monte_carlo"}
+
+
+def test_vectorized_engine_matches_process_engine():
+    """
+    Both engines estimate the same equity for a flopped flush draw.
+    """
+    hole = [Card("AH"), Card("KH")]
+    board = [Card("2H"), Card("7H"), Card("9S")]
+
+    process = calculate_odds(hole, board, num_opponents=2, simulations=4000)
+    vectorized = calculate_odds(
+        hole, board, num_opponents=2, simulations=200_000, engine="vectorized"
+    )
+
+    assert abs(process["win"] - vectorized["win"]) < 0.04
+    assert abs(vectorized["win"] + vectorized["tie"] + vectorized["loss"] - 1) < 1e-9
+
+
+def test_vectorized_evaluator_matches_scalar_evaluator():
+    rng = np.random.default_rng(5)
+    hands = np.array([rng.permutation(52)[:7] for _ in range(5000)])
+    codes = [rank + suit for rank in RANK_ORDER for suit in SUITS]
+
+    expected = [evaluate_seven([CARD_INTS[codes[i]] for i in hand]) for hand in hands]
+
+    assert evaluate_strengths(hands).tolist() == expected
+
+
+def test_shared_pool_runs_requests_and_applies_backpressure():
+    pool = OddsWorkerPool()
+    pool.start(workers=2, max_pending=1, queue_timeout=0)
+    try:
+        hole = [Card("KH"), Card("KC")]
+        board = [Card("2H"), Card("7D"), Card("9S")]
+        chunks = [(hole, board, 1, 20_000)] * 2
+
+        futures = pool.submit_many(simulate_chunk, chunks)
+        with pytest.raises(PoolSaturatedError):
+            pool.submit_many(simulate_chunk, chunks)
+
+        concurrent.futures.wait(futures)
+        wins = sum(f.result()[0] for f in futures)
+        assert 0.5 < wins / 40_000 < 1.0
+
+        # The slot is released once every chunk has finished
+        pool.queue_timeout = 5
+        pool.submit_many(simulate_chunk, chunks)[0].result()
+    finally:
+        pool.shutdown()
+
+    assert not pool.running
+
+
+def test_cancelled_slot_wait_does_not_leak_the_slot():
+    pool = OddsWorkerPool()
+    pool.start(workers=1, max_pending=1, queue_timeout=5)
+    try:
+
+        async def run():
+            pool.acquire_slot()
+            waiter = asyncio.ensure_future(pool.acquire_slot_async())
+            await asyncio.sleep(0.05)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            # The abandoned wait takes the slot once freed, then gives it back
+            pool.release_slot()
+            await asyncio.sleep(0.2)
+
+        asyncio.run(run())
+        pool.queue_timeout = 0
+        pool.acquire_slot()
+        pool.release_slot()
+    finally:
+        pool.shutdown()
+
+
+def test_async_odds_keeps_event_loop_responsive():
+    hole = [Card("KH"), Card("KC")]
+    board = [Card("2H"), Card("7D"), Card("9S")]
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        odds = await calculate_odds_async(
+            hole, board, num_opponents=2, simulations=8000, workers=2
+        )
+        task.cancel()
+        return odds, ticks
+
+    odds, ticks = asyncio.run(run())
+
+    assert abs(odds["win"] + odds["tie"] + odds["loss"] - 1) < 1e-9
+    assert ticks > 5
+
+
+def test_river_heads_up_is_enumerated_exactly():
+    """
+    Quad aces on a 2-3-4 diamond board lose only to 5D 6D: 1 of 990 holdings.
+    """
+    hole = [Card("AS"), Card("AD")]
+    board = [Card("AH"), Card("AC"), Card("2D"), Card("3D"), Card("4D")]
+
+    odds = calculate_odds(hole, board, num_opponents=1)
+
+    assert odds["mode"] == "exact"
+    assert odds["win"] == 989 / 990
+    assert odds["loss"] == 1 / 990
+
+
+def test_exact_enumeration_agrees_with_simulation_on_the_turn():
+    hole = [Card("AH"), Card("KH")]
+    board = [Card("2H"), Card("7H"), Card("9S"), Card("TC")]
+
+    exact = calculate_odds(hole, board, num_opponents=1)
+    simulated = calculate_odds(
+        hole,
+        board,
+        num_opponents=1,
+        simulations=200_000,
+        engine="vectorized",
+        exact_threshold=0,
+    )
+
+    assert exact["mode"] == "exact"
+    assert count_outcomes(6, 4, 1) == 46 * 990
+    assert abs(exact["win"] - simulated["win"]) < 0.01
+
+
+def test_deals_that_do_not_fit_in_the_deck_are_rejected():
+    hole = [Card("AS"), Card("AD")]
+    board = [Card("AH"), Card("AC"), Card("2D"), Card("3D"), Card("4D")]
+
+    assert count_outcomes(7, 5, 22) > 0
+    with pytest.raises(ValueError):
+        count_outcomes(7, 5, 23)
+    with pytest.raises(ValueError):
+        calculate_odds(hole, board, num_opponents=23)
+    with pytest.raises(ValueError):
+        calculate_odds_adaptive(hole, board, num_opponents=0)
+
+
+def test_hole_cards_must_be_two_cards_not_on_the_board():
+    board = [Card("2D"), Card("7C"), Card("9H"), Card("JD"), Card("KC")]
+
+    for hole in (
+        [Card("AS")],
+        [Card("AS"), Card("AS")],
+        [Card("AS"), Card("AD"), Card("AH")],
+        [Card("AS"), Card("KC")],
+    ):
+        with pytest.raises(ValueError):
+            calculate_odds(hole, board, num_opponents=1)
+    with pytest.raises(ValidationError):
+        HandOddsRequest(hole_cards=["AS"], board_cards=[], num_opponents=1)
+
+    request = HandOddsRequest(
+        hole_cards=["AS", "KC"], board_cards=["KC"], num_opponents=1
+    )
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(tools.calculate_odds(request))
+    assert error.value.status_code == 422
+
+
+def test_adaptive_odds_stops_at_target_precision():
+    hole = [Card("AH"), Card("AD")]
+    board = [Card("2C"), Card("7S"), Card("9D")]
+
+    odds = calculate_odds_adaptive(
+        hole,
+        board,
+        num_opponents=1,
+        target_stderr=0.01,
+        time_budget=30,
+        batch_size=500,
+        workers=2,
+    )
+
+    assert odds["mode"] == "adaptive"
+    assert odds["stderr"] <= 0.01
+    assert odds["trials"] < 10_000
+    low, high = odds["win_ci"]
+    assert low <= odds["win"] <= high
+
+
+def test_adaptive_odds_respects_time_budget():
+    hole = [Card("KH"), Card("QH")]
+    board = []
+
+    start = time.monotonic()
+    odds = calculate_odds_adaptive(
+        hole,
+        board,
+        num_opponents=3,
+        target_stderr=0.0001,
+        time_budget=0.5,
+        batch_size=200,
+        workers=2,
+    )
+
+    assert time.monotonic() - start < 5
+    assert odds["stderr"] > 0.0001
+    assert odds["trials"] % 200 == 0
+
+
+def test_preflop_hand_classes_cover_all_starting_hands():
+    deck = [Card(r + s) for r in RANK_ORDER for s in SUITS]
+    classes = {}
+    for i, first in enumerate(deck):
+        for second in deck[i + 1 :]:
+            index = hand_class_index([first, second])
+            classes.setdefault(index, set()).add(hand_class_index([second, first]))
+
+    assert len(classes) == 169
+    assert all(others == {index} for index, others in classes.items())
+    assert hand_class_label(hand_class_index([Card("AS"), Card("KS")])) == "AKs"
+    assert hand_class_label(hand_class_index([Card("7D"), Card("TC")])) == "T7o"
+    assert hand_class_label(hand_class_index([Card("QH"), Card("QC")])) == "QQ"
+
+
+def test_preflop_odds_come_from_loaded_table(tmp_path):
+    aces = hand_class_index([Card("AS"), Card("AH")])
+    path = tmp_path / "preflop.npy"
+    np.save(path, build_table(2_000, classes=[aces]))
+
+    assert preflop_table.load(path)
+    try:
+        odds = calculate_odds([Card("AD"), Card("AC")], [], num_opponents=1)
+        fewer_trials = calculate_odds(
+            [Card("AD"), Card("AC")], [], num_opponents=1, simulations=100
+        )
+    finally:
+        preflop_table.unload()
+
+    assert odds["mode"] == "preflop_table"
+    assert odds["win"] == pytest.approx(0.85, abs=0.03)
+    assert odds == fewer_trials
+
+
+def test_preflop_table_misses_unless_given_two_distinct_cards(tmp_path):
+    path = tmp_path / "preflop.npy"
+    np.save(path, np.zeros((NUM_CLASSES, MAX_OPPONENTS, 3)))
+    table = PreflopTable()
+    assert table.load(path)
+
+    assert table.lookup([Card("AS"), Card("KD")], 1) is not None
+    for hole in ([], [Card("AS")], [Card("AS"), Card("AS")]):
+        assert table.lookup(hole, 1) is None
+
+
+@pytest.mark.skipif(not PREFLOP_TABLE_PATH.exists(), reason="no preflop table")
+def test_shipped_preflop_table_matches_known_equities():
+    table = PreflopTable()
+    assert table.load()
+
+    aces = table.lookup([Card("AS"), Card("AH")], 1)
+    suited_connector = table.lookup([Card("7S"), Card("8S")], 1)
+    weakest = table.lookup([Card("2C"), Card("7D")], 1)
+
+    assert aces["win"] == pytest.approx(0.852, abs=0.005)
+    assert suited_connector["win"] + suited_connector["tie"] / 2 == pytest.approx(
+        0.48, abs=0.01
+    )
+    assert weakest["win"] == pytest.approx(0.32, abs=0.01)
+    assert table.lookup([Card("AS"), Card("AH")], 10) is None
+
+
+def _cards(codes: str) -> list[Card]:
+    return [Card(c) for c in codes.split()]
+
+
+def test_canonical_key_matches_suit_isomorphic_spots():
+    key = canonical_key(_cards("AH KH"), _cards("2H 7D 9S"), 2)
+
+    assert canonical_key(_cards("AS KS"), _cards("2S 7C 9D"), 2) == key
+    assert canonical_key(_cards("KD AD"), _cards("9H 2D 7C"), 2) == key
+    assert canonical_key(_cards("AH KD"), _cards("2H 7D 9S"), 2) != key
+    assert canonical_key(_cards("AH KH"), _cards("2D 7H 9S"), 2) != key
+    assert canonical_key(_cards("AH KH"), _cards("2H 7D 9S"), 3) != key
+
+
+def test_odds_cache_evicts_least_recently_used_and_expires_entries():
+    cache = OddsCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats() == {
+        "size": 2,
+        "maxsize": 2,
+        "hits": 2,
+        "misses": 1,
+        "hit_rate": 2 / 3,
+    }
+
+    expiring = OddsCache(maxsize=2, ttl=0)
+    expiring.set("a", 1)
+    assert expiring.get("a") is None
+    assert expiring.stats()["size"] == 0
+
+
+def test_seeded_odds_are_reproducible():
+    hole = _cards("QS JS")
+    board = _cards("TS 4D")
+
+    for engine in ENGINES:
+        first = calculate_odds(
+            hole, board, 2, simulations=4_000, workers=2, engine=engine, seed=42
+        )
+        second = calculate_odds(
+            hole, board, 2, simulations=4_000, workers=2, engine=engine, seed=42
+        )
+        other = calculate_odds(
+            hole, board, 2, simulations=4_000, workers=2, engine=engine, seed=43
+        )
+        assert first == second
+        assert first != other
+
+
+def test_worker_chunks_draw_independent_streams():
+    hole = _cards("9H 8H")
+    board = _cards("7H 2C 3S")
+
+    chunks = _seeded_chunks(hole, board, 1, 2_000, workers=4, seed=7)
+    results = [simulate_chunk(*args) for args in chunks]
+
+    assert len(set(results)) == len(results)
+    assert simulate_chunk(*chunks[0]) == results[0]
@@ -0,0 +1,45 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.pagination import decode_cursor, encode_cursor, page_size, parse_fields
+from app.core.config import settings
+
+
+def test_cursor_round_trips():
+    keyset = (datetime(2024, 3, 5, 21, 14, 7, 250), 42)
+
+    assert decode_cursor(encode_cursor(keyset)) == keyset
+    assert decode_cursor(None) is None
+
+
+def test_cursor_carries_extra_values():
+    position = (datetime(2024, 3, 5, 21, 14, 7), 42, 1000, 480)
+
+    assert decode_cursor(encode_cursor(position), size=4) == position
+    with pytest.raises(HTTPException):
+        decode_cursor(encode_cursor(position))
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "YWJj", "=="])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as e:
+        decode_cursor(cursor)
+    assert e.value.status_code == 400
+
+
+def test_parse_fields_keeps_declared_order():
+    allowed = ("id", "session_id", "result", "created_at")
+
+    assert parse_fields(None, allowed) == allowed
+    assert parse_fields("created_at, id,", allowed) == ("id", "created_at")
+    with pytest.raises(HTTPException) as e:
+        parse_fields("id,password", allowed)
+    assert e.value.status_code == 422
+
+
+def test_listings_are_unpaginated_unless_asked():
+    assert page_size(None, None) is None
+    assert page_size(50, None) == 50
+    assert page_size(None, "cursor") == settings.LIST_PAGE_SIZE
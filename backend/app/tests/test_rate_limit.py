@@ -0,0 +1,93 @@
+import asyncio
+import threading
+from decimal import Decimal
+
+import pytest
+from fastapi import Request
+from sqlalchemy.dialects import postgresql
+
+from app.core.rate_limit import RateLimiter, client_address, parse_networks
+from app.core.security import HashingPoolSaturatedError, PasswordHashingPool
+
+
+class _FakeResult:
+    def __init__(self, row):
+        self._row = row
+
+    def one(self):
+        return self._row
+
+
+class _FakeDB:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _FakeResult(self.rows.pop(0))
+
+    async def commit(self):
+        self.commits += 1
+
+
+def test_rate_limiter_counts_hits_in_a_shared_upsert():
+    limiter = RateLimiter(scope="user", limit=2, window=60)
+    db = _FakeDB([(2, Decimal("59.5")), (3, Decimal("44.2"))])
+
+    assert asyncio.run(limiter.hit(db, "alice")) == 0
+    assert asyncio.run(limiter.hit(db, "alice")) == pytest.approx(44.2)
+    assert limiter.limited == 1
+    assert db.commits == 2
+
+    sql = str(
+        db.statements[0].compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+    assert "'user:alice'" in sql
+    assert "ON CONFLICT (key) DO UPDATE" in sql
+    assert "RETURNING loginthrottle.attempts" in sql
+
+
+def test_client_address_only_trusts_forwarded_for_from_proxies():
+    trusted = parse_networks("10.0.0.0/8, 192.168.1.5")
+
+    def request(peer, forwarded=None):
+        headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+        return Request({"type": "http", "client": (peer, 1234), "headers": headers})
+
+    assert client_address(request("203.0.113.7", "1.2.3.4"), trusted) == "203.0.113.7"
+    assert client_address(request("10.0.0.2"), trusted) == "10.0.0.2"
+    assert (
+        client_address(
+            request("10.0.0.2", "1.2.3.4, 198.51.100.9, 192.168.1.5"), trusted
+        )
+        == "198.51.100.9"
+    )
+    assert client_address(request("10.0.0.2", "10.1.1.1"), trusted) == "10.1.1.1"
+
+
+def test_password_hashing_pool_rejects_when_full():
+    release = threading.Event()
+    pool = PasswordHashingPool()
+    pool.start(workers=1, max_pending=1)
+
+    async def scenario():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(HashingPoolSaturatedError):
+            await pool.run(len, "x")
+        release.set()
+        await blocked
+        return await pool.run(len, "abc")
+
+    try:
+        assert asyncio.run(scenario()) == 3
+        stats = pool.stats()
+        assert stats["rejected"] == 1
+        assert stats["completed"] == 2
+        assert stats["queued"] == 0
+    finally:
+        pool.shutdown()
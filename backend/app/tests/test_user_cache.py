@@ -0,0 +1,25 @@
+from app.core.user_cache import UserCache
+from app.models.user import User
+
+
+def _user(user_id: int, is_active: bool = True) -> User:
+    return User(
+        id=user_id,
+        username=f"user{user_id}",
+        email=f"user{user_id}@example.com",
+        hashed_password="x",
+        is_active=is_active,
+    )
+
+
+def test_user_cache_keeps_active_users_until_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.core.user_cache.time.monotonic", lambda: now[0])
+    cache = UserCache(maxsize=10, ttl=60)
+    cache.set(_user(1))
+    cache.set(_user(2, is_active=False))
+
+    assert cache.get(1).id == 1
+    assert cache.get(2) is None
+    now[0] += 61
+    assert cache.get(1) is None
@@ -7,7 +7,9 @@ from sqlmodel import SQLModel
 from app.core.config import settings
 from app.db.session import engine
 import app.models.hand
+import app.models.login_throttle
 import app.models.session
+import app.models.stats
 import app.models.user
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,86 @@
+"""Add stats rollups
+
+Revision ID: 7f2c4b9e1a6d
+Revises: 43233d1b5c1d
+Create Date: 2026-10-18 20:05:12.418230
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7f2c4b9e1a6d"
+down_revision: Union[str, Sequence[str], None] = "43233d1b5c1d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "userstats",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "player_position", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("action_taken", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("result", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("hand_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("user_id", "player_position", "action_taken", "result"),
+    )
+    op.create_table(
+        "sessionstats",
+        sa.Column("session_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "player_position", sqlmodel.sql.sqltypes.AutoString(), nullable=False
+        ),
+        sa.Column("action_taken", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("result", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("hand_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["session_id"],
+            ["session.id"],
+        ),
+        sa.PrimaryKeyConstraint(
+            "session_id", "player_position", "action_taken", "result"
+        ),
+    )
+
+    # Backfill from existing hands
+    op.execute(
+        """
+        INSERT INTO userstats
+            (user_id, player_position, action_taken, result, hand_count)
+        SELECT session.user_id, hand.player_position,
+               COALESCE(hand.action_taken, ''), COALESCE(hand.result, ''),
+               COUNT(hand.id)
+        FROM hand JOIN session ON session.id = hand.session_id
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO sessionstats
+            (session_id, player_position, action_taken, result, hand_count)
+        SELECT hand.session_id, hand.player_position,
+               COALESCE(hand.action_taken, ''), COALESCE(hand.result, ''),
+               COUNT(hand.id)
+        FROM hand
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("sessionstats")
+    op.drop_table("userstats")
@@ -0,0 +1,52 @@
+"""Add analytics indexes
+
+Revision ID: b3d81f5a9c27
+Revises: 7f2c4b9e1a6d
+Create Date: 2026-10-18 20:31:47.902114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3d81f5a9c27"
+down_revision: Union[str, Sequence[str], None] = "7f2c4b9e1a6d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build concurrently so existing tables stay writable during the migration
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_session_user_id_start_time",
+            "session",
+            ["user_id", "start_time"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_hand_session_id_created_at",
+            "hand",
+            ["session_id", "created_at"],
+            postgresql_include=["result", "action_taken", "player_position"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_hand_session_id_created_at",
+            table_name="hand",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_session_user_id_start_time",
+            table_name="session",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,52 @@
+"""Cascade session deletes to hands and session stats
+
+Revision ID: d4e9a7c35b18
+Revises: b3d81f5a9c27
+Create Date: 2026-10-18 21:12:05.417839
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e9a7c35b18"
+down_revision: Union[str, Sequence[str], None] = "b3d81f5a9c27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_FOREIGN_KEYS = (
+    ("hand_session_id_fkey", "hand"),
+    ("sessionstats_session_id_fkey", "sessionstats"),
+)
+
+
+def _replace_foreign_keys(ondelete: Union[str, None]) -> None:
+    for name, table in _FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_="foreignkey")
+        # Add without checking existing rows and validate after committing,
+        # so writes to the table are only blocked for the quick swap
+        op.create_foreign_key(
+            name,
+            table,
+            "session",
+            ["session_id"],
+            ["id"],
+            ondelete=ondelete,
+            postgresql_not_valid=True,
+        )
+    with op.get_context().autocommit_block():
+        for name, table in _FOREIGN_KEYS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _replace_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_foreign_keys(None)
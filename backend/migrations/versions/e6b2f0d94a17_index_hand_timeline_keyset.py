@@ -0,0 +1,53 @@
+"""Index the hand timeline keyset
+
+Revision ID: e6b2f0d94a17
+Revises: d4e9a7c35b18
+Create Date: 2026-10-19 09:42:18.264391
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e6b2f0d94a17"
+down_revision: Union[str, Sequence[str], None] = "d4e9a7c35b18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the replacement before dropping the old index so reads keep one
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_hand_session_id_created_at_id",
+            "hand",
+            ["session_id", "created_at", "id"],
+            postgresql_include=["result"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_hand_session_id_created_at",
+            table_name="hand",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_hand_session_id_created_at",
+            "hand",
+            ["session_id", "created_at"],
+            postgresql_include=["result", "action_taken", "player_position"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_hand_session_id_created_at_id",
+            table_name="hand",
+            postgresql_concurrently=True,
+        )
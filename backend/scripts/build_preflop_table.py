@@ -0,0 +1,43 @@
+"""
+Build the preflop equity table used by the odds calculator.
+
+Run from the backend directory:
+
+    python -m scripts.build_preflop_table --simulations 200000 --workers 8
+"""
+
+import argparse
+import concurrent.futures
+from functools import partial
+
+import numpy as np
+
+from app.core.odds.preflop import (
+    NUM_CLASSES,
+    PREFLOP_TABLE_PATH,
+    build_class,
+    hand_class_label,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--simulations", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=str(PREFLOP_TABLE_PATH))
+    args = parser.parse_args()
+
+    table = np.zeros((NUM_CLASSES, 9, 3), dtype=np.float64)
+    build = partial(build_class, simulations=args.simulations, seed=args.seed)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for index, rows in enumerate(executor.map(build, range(NUM_CLASSES))):
+            table[index] = rows
+            print(f"{hand_class_label(index):>3}  heads-up win {rows[0, 0]:.4f}")
+
+    np.save(args.output, table)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
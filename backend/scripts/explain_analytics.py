@@ -0,0 +1,94 @@
+"""
+Print query plans for the analytics and session access paths.
+
+Each query runs under EXPLAIN (ANALYZE, BUFFERS), first with the analytics
+indexes dropped and then with them in place. The drop happens inside a
+transaction that is rolled back, but it locks the tables while the script
+runs, so point it at a staging copy of the database.
+
+Run from the backend directory:
+
+    python -m scripts.explain_analytics --user 42
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import Select, text
+from sqlmodel import select
+
+from app.core.config import settings
+from app.db.session import engine
+from app.models.session import Session
+from app.services.analytics_service import AnalyticsService
+from app.services.hand_service import HAND_COLUMNS, HandService
+from app.services.session_service import SESSION_COLUMNS, SessionService
+
+
+INDEXES = ("ix_session_user_id_start_time", "ix_hand_session_id_created_at_id")
+
+
+def build_queries(user_id: int, session_id: int) -> dict[str, Select]:
+    """
+    Build the statements the app runs, from the same service query builders:
+    the first page of the user's sessions, the first page of hands of one of
+    their sessions, and the full win-rate timeline.
+    """
+    return {
+        "session list": SessionService.list_sessions_query(
+            user_id, tuple(SESSION_COLUMNS), settings.LIST_PAGE_SIZE
+        ),
+        "session hands": HandService.list_hands_query(
+            session_id, tuple(HAND_COLUMNS), settings.LIST_PAGE_SIZE
+        ),
+        "timeline": AnalyticsService.win_rate_query(user_id),
+    }
+
+
+async def explain_all(user_id: int) -> None:
+    async with engine.connect() as conn:
+        session_id = await conn.scalar(
+            select(Session.id)
+            .where(Session.user_id == user_id)
+            .order_by(Session.start_time.desc())
+            .limit(1)
+        )
+        if session_id is None:
+            raise SystemExit(f"User {user_id} has no sessions")
+        queries = {
+            name: stmt.compile(
+                dialect=conn.dialect, compile_kwargs={"literal_binds": True}
+            )
+            for name, stmt in build_queries(user_id, session_id).items()
+        }
+        await conn.rollback()
+
+        for label, drop in (("without indexes", True), ("with indexes", False)):
+            transaction = await conn.begin()
+            try:
+                if drop:
+                    for name in INDEXES:
+                        await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+                for name, sql in queries.items():
+                    result = await conn.execute(
+                        text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}")
+                    )
+                    print(f"=== {name} ({label}) ===")
+                    for (line,) in result:
+                        print(line)
+                    print()
+            finally:
+                await transaction.rollback()
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user", type=int, required=True, help="User id to query")
+    args = parser.parse_args()
+
+    asyncio.run(explain_all(args.user))
+
+
+if __name__ == "__main__":
+    main()
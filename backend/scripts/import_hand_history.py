@@ -0,0 +1,87 @@
+"""
+Import text hand-history exports (PokerStars format) into a poker session.
+
+Run from the backend directory:
+
+    python -m scripts.import_hand_history --user 42 hands.txt
+    python -m scripts.import_hand_history --session 7 archive/*.txt.gz
+
+Files are read line by line (gzip files are decompressed on the fly) and
+hands are committed in batches, so memory use does not grow with the files.
+Without --session, a new session is created for the user.
+"""
+
+import argparse
+import asyncio
+import gzip
+from typing import Iterator, Optional
+
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.history.parser import HandHistoryParser, parse_hand_history
+from app.db.session import async_session
+from app.models.session import Session
+from app.services.hand_service import HandService
+
+
+def read_lines(paths: list[str]) -> Iterator[str]:
+    for path in paths:
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8-sig", errors="replace") as f:
+            yield from f
+
+
+async def import_files(
+    paths: list[str],
+    user_id: Optional[int],
+    session_id: Optional[int],
+    batch_size: int,
+) -> tuple[int, HandHistoryParser]:
+    async with async_session() as db:
+        if session_id is None:
+            session = Session(user_id=user_id, notes="Imported hand history")
+            db.add(session)
+            await db.commit()
+            await db.refresh(session)
+            session_id = session.id
+        else:
+            result = await db.exec(select(Session).where(Session.id == session_id))
+            session = result.one()
+        user_id = session.user_id
+
+        parser = HandHistoryParser()
+        imported = 0
+        async for batch_ids in HandService.insert_batches(
+            db,
+            user_id,
+            session_id,
+            parse_hand_history(read_lines(paths), parser),
+            batch_size,
+        ):
+            imported += len(batch_ids)
+            print(f"\rImported {imported} hands", end="", flush=True)
+        print()
+    return session_id, parser
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("files", nargs="+", help="Hand-history files (.txt/.gz)")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--user", type=int, help="Create a new session for user")
+    target.add_argument("--session", type=int, help="Add hands to this session")
+    parser.add_argument("--batch-size", type=int, default=settings.HAND_BULK_BATCH_SIZE)
+    args = parser.parse_args()
+
+    session_id, history = asyncio.run(
+        import_files(args.files, args.user, args.session, args.batch_size)
+    )
+    print(
+        f"Session {session_id}: imported {history.parsed} hands, "
+        f"skipped {history.skipped}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Rebuild the per-user and per-session stats rollups from the hand table.
+
+Run from the backend directory:
+
+    python -m scripts.rebuild_stats            # every user
+    python -m scripts.rebuild_stats --user 42  # one user
+"""
+
+import argparse
+import asyncio
+from typing import Optional
+
+from app.db.session import async_session
+from app.services.stats_service import StatsService
+
+
+async def rebuild(user_id: Optional[int]) -> None:
+    async with async_session() as db:
+        await StatsService.rebuild(db, user_id)
+        await db.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--user", type=int, default=None, help="Only this user id")
+    args = parser.parse_args()
+
+    asyncio.run(rebuild(args.user))
+    target = f"user {args.user}" if args.user is not None else "all users"
+    print(f"Rebuilt stats rollups for {target}")
+
+
+if __name__ == "__main__":
+    main()